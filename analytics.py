@@ -0,0 +1,415 @@
+"""Streaming session analytics over game_events.jsonl and game_state.jsonl.
+
+Logs are read a line at a time through generators, so memory use stays
+flat however large the files get. Events and state snapshots are merged
+in frame order and split into sessions at each game_start event; every
+session yields its accuracy, kills per second by asteroid size, times
+to death and entity counts over frame.
+
+Each log file gets a byte-offset index beside it (<file>.idx) holding
+the frame, elapsed_s and offset of every INDEX_STRIDE-th line. A frame
+or elapsed_s range seeks to the nearest indexed line instead of reading
+from the start. Indexes are extended as the log grows and rebuilt when
+it is replaced (a new run or a rotation).
+
+Usage:
+
+    python analytics.py [--frames A:B] [--seconds A:B] [--curves CSV] [--workers N] PATH...
+
+PATH is a log directory (game_events.jsonl, game_state.jsonl and their
+rotated backups) or a single log file. Paths are analyzed in parallel on
+a process pool and their sessions merged into one table.
+"""
+import argparse
+import csv
+import heapq
+import itertools
+import json
+import os
+import re
+import struct
+import zlib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+EVENTS_LOG = "game_events.jsonl"
+STATE_LOG = "game_state.jsonl"
+SIZES = ("large", "medium", "small")
+
+INDEX_MAGIC = b"ASTRLIDX"
+INDEX_VERSION = 1
+INDEX_STRIDE = 256  # Lines between index entries
+# magic, version, stride, bytes indexed, lines indexed, CRC32 of the first line
+_INDEX_HEADER = struct.Struct("<8sB3xIQQI4x")
+INDEX = np.dtype([
+    ("frame", "<u4"),
+    ("elapsed_s", "<u4"),
+    ("offset", "<u8"),
+])
+
+# logger writes these two fields first on every line
+_POSITION = re.compile(rb'"elapsed_s": (\d+), "frame": (\d+)')
+
+
+def _position(line):
+    """(frame, elapsed_s) of a log line"""
+    match = _POSITION.search(line)
+    if match:
+        return int(match.group(2)), int(match.group(1))
+    record = json.loads(line)
+    return record["frame"], record["elapsed_s"]
+
+
+def _complete_lines(f, offset):
+    """Yield (offset, line) for every newline-terminated line from offset on"""
+    f.seek(offset)
+    for line in f:
+        if not line.endswith(b"\n"):
+            # Still being written
+            return
+        yield offset, line
+        offset += len(line)
+
+
+class LogIndex:
+    """Sparse frame/elapsed_s -> byte offset index of one JSONL log"""
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = np.zeros(0, dtype=INDEX)
+        self.indexed = 0
+        self.lines = 0
+        self.head_crc = 0
+
+    @property
+    def sidecar(self):
+        return self.path + ".idx"
+
+    def load(self):
+        """Read the sidecar; returns False if it is missing or for another file"""
+        try:
+            with open(self.sidecar, "rb") as f:
+                header = f.read(_INDEX_HEADER.size)
+                body = f.read()
+        except OSError:
+            return False
+        if len(header) != _INDEX_HEADER.size:
+            return False
+        magic, version, stride, indexed, lines, head_crc = _INDEX_HEADER.unpack(header)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION or stride != INDEX_STRIDE:
+            return False
+        if indexed > os.path.getsize(self.path) or head_crc != self._head_crc():
+            return False
+        self.entries = np.frombuffer(body[:len(body) // INDEX.itemsize * INDEX.itemsize], dtype=INDEX).copy()
+        self.indexed, self.lines, self.head_crc = indexed, lines, head_crc
+        return True
+
+    def save(self):
+        try:
+            with open(self.sidecar, "wb") as f:
+                f.write(_INDEX_HEADER.pack(
+                    INDEX_MAGIC, INDEX_VERSION, INDEX_STRIDE, self.indexed, self.lines, self.head_crc
+                ))
+                f.write(self.entries.tobytes())
+        except OSError:
+            # Read-only log directory; the index just isn't kept
+            pass
+
+    def _head_crc(self):
+        with open(self.path, "rb") as f:
+            return zlib.crc32(f.readline())
+
+    def update(self):
+        """Index lines appended since the last update; returns self"""
+        if not self.load():
+            self.entries = np.zeros(0, dtype=INDEX)
+            self.indexed = self.lines = 0
+            self.head_crc = self._head_crc()
+        if self.indexed == os.path.getsize(self.path):
+            return self
+
+        added = []
+        with open(self.path, "rb") as f:
+            for offset, line in _complete_lines(f, self.indexed):
+                if self.lines % INDEX_STRIDE == 0:
+                    added.append((*_position(line), offset))
+                self.lines += 1
+                self.indexed = offset + len(line)
+        if added:
+            self.entries = np.concatenate((self.entries, np.array(added, dtype=INDEX)))
+        self.save()
+        return self
+
+    def seek_offset(self, first_frame=None, first_second=None):
+        """Offset of an indexed line at or before the first line in range"""
+        offset = 0
+        for column, value in (("frame", first_frame), ("elapsed_s", first_second)):
+            if value is None or not len(self.entries):
+                continue
+            # Lines logged before the first entry >= value may still be in range
+            position = int(np.searchsorted(self.entries[column], value, "left")) - 1
+            if position >= 0:
+                offset = max(offset, int(self.entries["offset"][position]))
+        return offset
+
+
+def read_log(path, frames=None, seconds=None):
+    """Yield the records of one JSONL log, optionally within a range.
+
+    frames and seconds are inclusive (first, last) pairs of frame and
+    elapsed_s; either end may be None. Both columns never decrease within
+    a file, so reading seeks to the range start and stops after its end.
+    """
+    first_frame, last_frame = frames or (None, None)
+    first_second, last_second = seconds or (None, None)
+    offset = 0
+    if first_frame is not None or first_second is not None:
+        offset = LogIndex(path).update().seek_offset(first_frame, first_second)
+
+    with open(path, "rb") as f:
+        for _, line in _complete_lines(f, offset):
+            record = json.loads(line)
+            frame, elapsed = record["frame"], record["elapsed_s"]
+            if (last_frame is not None and frame > last_frame) or (last_second is not None and elapsed > last_second):
+                return
+            if (first_frame is not None and frame < first_frame) or (first_second is not None and elapsed < first_second):
+                continue
+            yield record
+
+
+def log_chain(directory, name):
+    """A log and its rotated backups, oldest first"""
+    backups = []
+    for index in itertools.count(1):
+        path = os.path.join(directory, f"{name}.{index}")
+        if not os.path.exists(path):
+            break
+        backups.append(path)
+    path = os.path.join(directory, name)
+    return backups[::-1] + ([path] if os.path.exists(path) else [])
+
+
+def read_chain(paths, frames=None, seconds=None):
+    return itertools.chain.from_iterable(read_log(path, frames, seconds) for path in paths)
+
+
+def _clock(timestamp):
+    """Seconds since midnight of an HH:MM:SS.mmm timestamp"""
+    hours, minutes, seconds = timestamp.split(":")
+    return (int(hours) * 60 + int(minutes)) * 60 + float(seconds)
+
+
+class Session:
+    """Running aggregates of one game, from its game_start to the next"""
+
+    def __init__(self, source, number, start_frame, seed=None):
+        self.source = source
+        self.number = number
+        self.seed = seed
+        self.start_frame = start_frame
+        self.start = None
+        self.end = None
+        self.shots = 0
+        self.hits = 0
+        self.kills = Counter()
+        self.deaths = []  # Seconds each life lasted
+        self.last_death = None
+        self.score = None
+        self.wave = None
+        self.curves = {}  # Group name -> [(frames since start, count)]
+
+    def _time(self, record):
+        now = _clock(record["timestamp"])
+        if self.start is None:
+            self.start = now
+        elif now < self.end:
+            # Past midnight
+            now += 24 * 60 * 60
+        self.end = now
+        return now
+
+    def add_event(self, event):
+        now = self._time(event)
+        kind = event["type"]
+        if kind == "shot_fired":
+            self.shots += event.get("count", 1)
+        elif kind == "asteroid_shot":
+            self.hits += 1
+            self.kills[event.get("size", "unknown")] += 1
+        elif kind == "ufo_shot":
+            self.hits += 1
+            self.kills["ufo"] += 1
+        elif kind == "player_hit":
+            since = self.start if self.last_death is None else self.last_death
+            self.deaths.append(now - since)
+            self.last_death = now
+        elif kind == "game_over":
+            self.score = event.get("score")
+            self.wave = event.get("wave")
+
+    def add_state(self, entry):
+        self._time(entry)
+        frame = entry["frame"] - self.start_frame
+        for name, value in entry.items():
+            if isinstance(value, dict) and "count" in value:
+                self.curves.setdefault(name, []).append((frame, value["count"]))
+
+    @property
+    def duration(self):
+        return self.end - self.start if self.start is not None else 0.0
+
+    def summary(self):
+        duration = self.duration
+        return {
+            "source": self.source,
+            "session": self.number,
+            "seed": self.seed,
+            "duration": duration,
+            "shots": self.shots,
+            "hits": self.hits,
+            "accuracy": self.hits / self.shots if self.shots else None,
+            "kills": dict(self.kills),
+            "kills_per_second": {size: count / duration for size, count in self.kills.items()} if duration else {},
+            "deaths": self.deaths,
+            "score": self.score,
+            "wave": self.wave,
+            "curves": self.curves,
+        }
+
+
+def sessions(events, states, source=""):
+    """Yield a Session per game in merged event and state streams.
+
+    A state snapshot is logged as its frame is counted, before that
+    frame's events, so on equal frames states sort first. Records before
+    the first game_start form a session of their own.
+    """
+    merged = heapq.merge(
+        ((state["frame"], 0, state) for state in states),
+        ((event["frame"], 1, event) for event in events),
+        key=lambda item: item[:2],
+    )
+    session = None
+    for frame, is_event, record in merged:
+        if is_event and record["type"] == "game_start":
+            if session is not None:
+                yield session
+            session = Session(source, 0 if session is None else session.number + 1, frame, record.get("seed"))
+        elif session is None:
+            session = Session(source, 0, frame)
+        if is_event:
+            session.add_event(record)
+        else:
+            session.add_state(record)
+    if session is not None:
+        yield session
+
+
+def analyze(path, frames=None, seconds=None):
+    """Session summaries for a log directory or a single log file"""
+    if os.path.isdir(path):
+        events = read_chain(log_chain(path, EVENTS_LOG), frames, seconds)
+        states = read_chain(log_chain(path, STATE_LOG), frames, seconds)
+    elif os.path.basename(path).startswith(STATE_LOG):
+        events, states = (), read_log(path, frames, seconds)
+    else:
+        events, states = read_log(path, frames, seconds), ()
+    return [session.summary() for session in sessions(events, states, path)]
+
+
+def analyze_all(paths, frames=None, seconds=None, workers=None):
+    """analyze() every path, in parallel unless workers == 1; sessions keep path order"""
+    if workers == 1:
+        return [summary for path in paths for summary in analyze(path, frames, seconds)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(analyze, path, frames, seconds) for path in paths]
+        return [summary for future in futures for summary in future.result()]
+
+
+def merge(summaries):
+    """One summary totalling many sessions"""
+    duration = sum(s["duration"] for s in summaries)
+    shots = sum(s["shots"] for s in summaries)
+    hits = sum(s["hits"] for s in summaries)
+    kills = Counter()
+    for s in summaries:
+        kills.update(s["kills"])
+    deaths = [seconds for s in summaries for seconds in s["deaths"]]
+    return {
+        "sessions": len(summaries),
+        "duration": duration,
+        "shots": shots,
+        "hits": hits,
+        "accuracy": hits / shots if shots else None,
+        "kills": dict(kills),
+        "kills_per_second": {size: count / duration for size, count in kills.items()} if duration else {},
+        "deaths": len(deaths),
+        "mean_time_to_death": sum(deaths) / len(deaths) if deaths else None,
+    }
+
+
+def _percent(value):
+    return f"{value:.0%}" if value is not None else "-"
+
+
+def format_table(summaries):
+    kinds = SIZES + ("ufo",)
+    kill_header = " ".join(f"{kind + '/s':>9}" for kind in kinds)
+    lines = [f"{'source':>24} {'#':>3} {'seed':>10} {'secs':>7} {'shots':>6} {'acc':>5} {kill_header} "
+             f"{'deaths':>6} {'ttd':>6} {'score':>7}"]
+    for s in summaries:
+        rates = " ".join(f"{s['kills_per_second'].get(kind, 0):>9.3f}" for kind in kinds)
+        ttd = f"{sum(s['deaths']) / len(s['deaths']):>6.1f}" if s["deaths"] else f"{'-':>6}"
+        lines.append(
+            f"{s['source'][-24:]:>24} {s['session']:>3} {str(s['seed']):>10} {s['duration']:>7.1f} "
+            f"{s['shots']:>6} {_percent(s['accuracy']):>5} {rates} {len(s['deaths']):>6} {ttd} "
+            f"{str(s['score'] if s['score'] is not None else '-'):>7}"
+        )
+    total = merge(summaries)
+    rates = " ".join(f"{total['kills_per_second'].get(kind, 0):>9.3f}" for kind in kinds)
+    ttd = total["mean_time_to_death"]
+    lines.append(
+        f"{'all':>24} {total['sessions']:>3} {'':>10} {total['duration']:>7.1f} {total['shots']:>6} "
+        f"{_percent(total['accuracy']):>5} {rates} {total['deaths']:>6} "
+        f"{f'{ttd:.1f}' if ttd is not None else '-':>6} {'':>7}"
+    )
+    return "\n".join(lines)
+
+
+def write_curves(summaries, path):
+    """Entity counts over frame as CSV rows: source, session, group, frame, count"""
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(("source", "session", "group", "frame", "count"))
+        for s in summaries:
+            for group, points in s["curves"].items():
+                for frame, count in points:
+                    writer.writerow((s["source"], s["session"], group, frame, count))
+
+
+def _parse_range(text):
+    if text is None:
+        return None
+    first, _, last = text.partition(":")
+    return (int(first) if first else None, int(last) if last else None)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Per-session statistics from game_events/game_state logs")
+    parser.add_argument("paths", nargs="*", default=["."], help="log directories or files (default: .)")
+    parser.add_argument("--frames", metavar="A:B", help="only records with A <= frame <= B")
+    parser.add_argument("--seconds", metavar="A:B", help="only records with A <= elapsed_s <= B")
+    parser.add_argument("--curves", metavar="CSV", help="write entity counts over frame to CSV")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args(argv)
+
+    summaries = analyze_all(args.paths, _parse_range(args.frames), _parse_range(args.seconds), args.workers)
+    print(format_table(summaries))
+    if args.curves:
+        write_curves(summaries, args.curves)
+
+
+if __name__ == "__main__":
+    main()
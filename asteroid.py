@@ -2,46 +2,101 @@ import pygame
 from circleshape import CircleShape
 from constants import *
 from logger import log_event
-import random
+import rng
 import math
 
+
+def generate_shape(radius):
+    """Generate irregular polygon vertices"""
+    num_vertices = rng.cosmetic.randint(8, 12)
+    vertices = []
+    for i in range(num_vertices):
+        angle = (2 * math.pi * i) / num_vertices
+        # Add randomness to radius (70-100% of actual radius)
+        r = radius * rng.cosmetic.uniform(0.7, 1.0)
+        x = math.cos(angle) * r
+        y = math.sin(angle) * r
+        vertices.append(pygame.Vector2(x, y))
+    return tuple(vertices)
+
+
+class AsteroidShapes:
+    """Shared outline templates, ASTEROID_SHAPE_VARIANTS per radius class.
+
+    Asteroids only store an index into `templates`; the vertex tuples are
+    never mutated, so every asteroid of a size class shares them.
+    """
+
+    def __init__(self, variants=None):
+        if variants is None:
+            variants = ASTEROID_SHAPE_VARIANTS
+        self.variants = variants
+        self.templates = []
+        self.by_radius = {}
+        for kind in range(1, ASTEROID_KINDS + 1):
+            self._build(ASTEROID_MIN_RADIUS * kind)
+
+    def _build(self, radius):
+        start = len(self.templates)
+        self.templates.extend(generate_shape(radius) for _ in range(self.variants))
+        indices = range(start, len(self.templates))
+        self.by_radius[radius] = indices
+        return indices
+
+    def pick(self, radius):
+        """Return a random template index for an asteroid of this radius"""
+        indices = self.by_radius.get(radius)
+        if indices is None:
+            # Off-class radius (e.g. benchmarks); build its templates on demand
+            indices = self._build(radius)
+        return indices[rng.cosmetic.randrange(len(indices))]
+
+
 class Asteroid(CircleShape):
+    # Shared AsteroidShapes library; built on first use if Game hasn't set one
+    shapes = None
+    # Optional RotationAtlasCache; None draws with the exact vector path
+    sprite_cache = None
+
     def __init__(self, x, y, radius):
         super().__init__(x, y, radius)
-        # Generate irregular polygon shape
-        self.vertices = self._generate_shape()
-        self.rotation = random.uniform(0, 360)
-        self.rotation_speed = random.uniform(-60, 60)  # Degrees per second
-
-    def _generate_shape(self):
-        """Generate irregular polygon vertices"""
-        num_vertices = random.randint(8, 12)
-        vertices = []
-        for i in range(num_vertices):
-            angle = (2 * math.pi * i) / num_vertices
-            # Add randomness to radius (70-100% of actual radius)
-            r = self.radius * random.uniform(0.7, 1.0)
-            x = math.cos(angle) * r
-            y = math.sin(angle) * r
-            vertices.append(pygame.Vector2(x, y))
-        return vertices
+        if Asteroid.shapes is None:
+            Asteroid.shapes = AsteroidShapes()
+        self.shape = self.shapes.pick(radius)
+        self.rotation = rng.cosmetic.uniform(0, 360)
+        self.rotation_speed = rng.cosmetic.uniform(-60, 60)  # Degrees per second
+
+    @property
+    def vertices(self):
+        return self.shapes.templates[self.shape]
 
     def draw(self, screen):
+        if self.sprite_cache is not None:
+            self.sprite_cache.draw(
+                screen, self.shape, self.vertices, self.radius, self.render_position, self.rotation
+            )
+            return
+
         # Transform vertices based on position and rotation
         rotated_vertices = []
         for v in self.vertices:
             # Rotate
             rotated = v.rotate(self.rotation)
             # Translate
-            final = self.position + rotated
+            final = self.render_position + rotated
             rotated_vertices.append((final.x, final.y))
         pygame.draw.polygon(screen, "white", rotated_vertices, LINE_WIDTH)
 
     def update(self, dt):
-        self.position += self.velocity * dt
+        self.position = self.position + self.velocity * dt
         self.rotation += self.rotation_speed * dt
         self.wrap_position()
 
+    def snapshot(self):
+        record = super().snapshot()
+        record["rot"] = round(self.rotation, 2)
+        return record
+
     def get_score(self):
         """Return score based on asteroid size"""
         if self.radius >= ASTEROID_MAX_RADIUS:
@@ -51,13 +106,22 @@ class Asteroid(CircleShape):
         else:
             return ASTEROID_SCORE_SMALL
 
+    def get_size(self):
+        """Size class, as used by get_score"""
+        if self.radius >= ASTEROID_MAX_RADIUS:
+            return "large"
+        elif self.radius >= ASTEROID_MIN_RADIUS * 2:
+            return "medium"
+        else:
+            return "small"
+
     def split(self):
         self.kill()
         if self.radius <= ASTEROID_MIN_RADIUS:
             return
 
         log_event("asteroid_split")
-        new_angle = random.uniform(20, 50)
+        new_angle = rng.gameplay.uniform(20, 50)
         rotate_angle = self.velocity.rotate(new_angle)
 
         new_radius = self.radius - ASTEROID_MIN_RADIUS
@@ -1,4 +1,4 @@
-import random
+import rng
 
 import pygame
 from asteroid import Asteroid
@@ -50,10 +50,10 @@ class AsteroidField(pygame.sprite.Sprite):
             self.spawn_timer = 0
 
             # spawn a new asteroid at a random edge
-            edge = random.choice(self.edges)
-            speed = random.randint(40, 100)
+            edge = rng.gameplay.choice(self.edges)
+            speed = rng.gameplay.randint(40, 100)
             velocity = edge[0] * speed
-            velocity = velocity.rotate(random.randint(-30, 30))
-            position = edge[1](random.uniform(0, 1))
-            kind = random.randint(1, ASTEROID_KINDS)
+            velocity = velocity.rotate(rng.gameplay.randint(-30, 30))
+            position = edge[1](rng.gameplay.uniform(0, 1))
+            kind = rng.gameplay.randint(1, ASTEROID_KINDS)
             self.spawn(ASTEROID_MIN_RADIUS * kind, position, velocity)
@@ -1,50 +1,231 @@
 import pygame
+import hashlib
 import os
+import queue
+import threading
+import time
+import wave
+from collections import deque
 import numpy as np
 
+from constants import (
+    SOUND_CACHE_DIR, AUDIO_PENDING_LIMIT, AUDIO_PENDING_MAX_AGE, AUDIO_CHANNELS, AUDIO_RESERVED_SOUNDS,
+)
+
+SAMPLE_RATE = 22050
+# Bump to resynthesize every cached sound, e.g. after changing a generator helper
+SOUND_CACHE_VERSION = 1
+
+# Sound name -> (generator method, arguments after the sample rate)
+SOUNDS = {
+    "shoot": ("_generate_shoot_sound", ()),
+    "explosion_small": ("_generate_explosion_sound", (0.15, 800)),
+    "explosion_medium": ("_generate_explosion_sound", (0.2, 500)),
+    "explosion_large": ("_generate_explosion_sound", (0.3, 300)),
+    "player_death": ("_generate_death_sound", ()),
+    "thrust": ("_generate_thrust_sound", ()),  # Looped
+    "powerup": ("_generate_powerup_sound", ()),
+    "extra_life": ("_generate_extra_life_sound", ()),
+}
+
+# A play may take over a busy channel whose sound has the same or lower priority
+PRIORITIES = {
+    "extra_life": 4,
+    "powerup": 3,
+    "explosion_large": 2,
+    "explosion_medium": 1,
+    "explosion_small": 0,
+    "shoot": 0,
+}
+
+
+class VoiceManager:
+    """A fixed budget of mixer channels, shared out by priority.
+
+    Sounds in `reserved` each get a channel of their own that nothing
+    else plays on. Everything else shares the remaining channels: a play
+    goes to an idle channel, else takes over the oldest of the
+    lowest-priority busy ones if that is no higher than its own, else is
+    dropped. A sound already played since begin_frame() is coalesced
+    into that play, so a burst of identical hits costs one voice. The
+    mixer never mixes more than `channels` voices at once.
+    """
+
+    def __init__(self, channels=None, reserved=None):
+        if channels is None:
+            channels = AUDIO_CHANNELS
+        if reserved is None:
+            reserved = AUDIO_RESERVED_SOUNDS
+        pygame.mixer.set_num_channels(channels)
+        # Keep Sound.play() and find_channel() off the reserved channels too
+        pygame.mixer.set_reserved(len(reserved))
+        self.reserved = {name: pygame.mixer.Channel(index) for index, name in enumerate(reserved)}
+        self.channels = [pygame.mixer.Channel(index) for index in range(len(reserved), channels)]
+        self.priorities = [0] * len(self.channels)
+        self.started = [0] * len(self.channels)
+        self.frame_sounds = set()
+        self.plays = 0
+        self.played = 0
+        self.coalesced = 0
+        self.stolen = 0
+        self.dropped = 0
+        # Plays can come from the game and audio threads
+        self.lock = threading.Lock()
+
+    def begin_frame(self):
+        self.frame_sounds.clear()
+
+    def play(self, name, sound, loops=0):
+        with self.lock:
+            channel = self.reserved.get(name)
+            if channel is not None:
+                self.played += 1
+                channel.play(sound, loops)
+                return channel
+
+            if name in self.frame_sounds:
+                self.coalesced += 1
+                return None
+            self.frame_sounds.add(name)
+
+            priority = PRIORITIES.get(name, 0)
+            index = None
+            for i, candidate in enumerate(self.channels):
+                if not candidate.get_busy():
+                    index = i
+                    break
+            if index is None:
+                index = min(range(len(self.channels)), key=lambda i: (self.priorities[i], self.started[i]), default=None)
+                if index is None or self.priorities[index] > priority:
+                    self.dropped += 1
+                    return None
+                self.stolen += 1
+
+            self.plays += 1
+            self.played += 1
+            self.priorities[index] = priority
+            self.started[index] = self.plays
+            channel = self.channels[index]
+            channel.play(sound, loops)
+            return channel
+
+    def stop(self, name):
+        """Stop a reserved sound"""
+        channel = self.reserved.get(name)
+        if channel is not None:
+            channel.stop()
+
+    def is_playing(self, name):
+        channel = self.reserved.get(name)
+        return channel is not None and channel.get_busy()
+
+    def stats(self):
+        return {
+            "played": self.played,
+            "coalesced": self.coalesced,
+            "stolen": self.stolen,
+            "dropped": self.dropped,
+            "busy": sum(channel.get_busy() for channel in self.channels),
+        }
 
-class AudioManager:
-    def __init__(self):
-        pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
-        self.sounds = {}
-        self.sound_enabled = True
-
-        # Create assets/sounds directory if it doesn't exist
-        os.makedirs("assets/sounds", exist_ok=True)
-
-        # Generate 8-bit style sounds
-        self._generate_sounds()
-
-        # Load the generated sounds
-        self._load_sounds()
 
-    def _generate_sounds(self):
-        """Generate 8-bit style sound effects"""
-        sample_rate = 22050
+def sound_key(name, generator, args, mixer_format):
+    """Content hash of everything a synthesized sound depends on"""
+    code = generator.__code__
+    digest = hashlib.sha1()
+    digest.update(repr((name, generator.__name__, args, mixer_format, SOUND_CACHE_VERSION)).encode())
+    digest.update(code.co_code)
+    digest.update(repr(code.co_consts).encode())
+    return digest.hexdigest()[:16]
 
-        # Shoot sound - short high-pitched beep
-        self._create_sound_file("shoot", self._generate_shoot_sound(sample_rate))
 
-        # Small explosion
-        self._create_sound_file("explosion_small", self._generate_explosion_sound(sample_rate, 0.15, 800))
+class AudioManager:
+    """Sound effects, synthesized once and cached by content hash.
 
-        # Medium explosion
-        self._create_sound_file("explosion_medium", self._generate_explosion_sound(sample_rate, 0.2, 500))
+    Each sound's key hashes its generator's bytecode, its arguments, the
+    mixer format and SOUND_CACHE_VERSION. Synthesized sounds are written to
+    <cache_dir>/<name>-<key>.wav and loaded straight from there while the
+    key stays the same; if the directory can't be written the sound is
+    built from the samples in memory. Sounds are also shared by every
+    AudioManager in the process.
 
-        # Large explosion
-        self._create_sound_file("explosion_large", self._generate_explosion_sound(sample_rate, 0.3, 300))
+    With lazy=True nothing is loaded up front; each sound is loaded the
+    first time it is played, or by warm().
+    """
 
-        # Player death - descending tone
-        self._create_sound_file("player_death", self._generate_death_sound(sample_rate))
+    # Key -> pygame Sound, across instances
+    _loaded = {}
 
-        # Thrust - low rumble (looped)
-        self._create_sound_file("thrust", self._generate_thrust_sound(sample_rate))
+    def __init__(self, cache_dir=None, lazy=False):
+        pygame.mixer.init(frequency=SAMPLE_RATE, size=-16, channels=2, buffer=512)
+        self.sounds = {}
+        self.sound_enabled = True
+        self.cache_dir = SOUND_CACHE_DIR if cache_dir is None else cache_dir
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # Noise source; reseeded per sound so a key always gives the same samples
+        self.noise = np.random.default_rng()
+
+        # Mixer may have opened with a different format than requested
+        self.mixer_format = pygame.mixer.get_init()
+        self.voices = VoiceManager()
+        if not lazy:
+            self.warm()
+
+    def warm(self, names=SOUNDS):
+        """Load sounds ahead of their first play"""
+        for name in names:
+            self.load(name)
+
+    def load(self, name):
+        """The named sound, loaded on first use; None if it couldn't be made"""
+        if name not in self.sounds:
+            try:
+                self.sounds[name] = self._load_sound(name)
+            except Exception:
+                self.sounds[name] = None
+        return self.sounds[name]
 
-        # Power-up collected
-        self._create_sound_file("powerup", self._generate_powerup_sound(sample_rate))
+    def _load_sound(self, name):
+        method, args = SOUNDS[name]
+        generator = getattr(self, method)
+        key = sound_key(name, generator, args, self.mixer_format)
+        sound = self._loaded.get(key)
+        if sound is not None:
+            return sound
 
-        # Extra life
-        self._create_sound_file("extra_life", self._generate_extra_life_sound(sample_rate))
+        path = os.path.join(self.cache_dir, f"{name}-{key}.wav")
+        try:
+            with wave.open(path, "rb") as wav_file:
+                sound = pygame.mixer.Sound(buffer=wav_file.readframes(wav_file.getnframes()))
+            self.cache_hits += 1
+        except (OSError, EOFError, wave.Error):
+            self.cache_misses += 1
+            self.noise = np.random.default_rng(int(key, 16))
+            samples = generator(self.mixer_format[0], *args)
+            # Interleave into the mixer's channel count
+            frames = np.repeat(samples[:, None], self.mixer_format[2], axis=1)
+            self._save_sound(name, path, frames)
+            sound = pygame.mixer.Sound(buffer=frames)
+        self._loaded[key] = sound
+        return sound
+
+    def _save_sound(self, name, path, frames):
+        """Write a cache entry and remove the ones it replaces"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temporary = path + ".tmp"
+            with wave.open(temporary, "wb") as wav_file:
+                wav_file.setnchannels(frames.shape[1])
+                wav_file.setsampwidth(2)
+                wav_file.setframerate(self.mixer_format[0])
+                wav_file.writeframes(frames.tobytes())
+            os.replace(temporary, path)
+            for stale in os.listdir(self.cache_dir):
+                if stale.startswith(name + "-") and stale.endswith(".wav") and stale != os.path.basename(path):
+                    os.remove(os.path.join(self.cache_dir, stale))
+        except OSError:
+            pass  # Read-only cache; the sound still plays from memory
 
     def _generate_shoot_sound(self, sample_rate):
         """Generate pew pew sound"""
@@ -61,7 +242,7 @@ class AudioManager:
         """Generate explosion noise"""
         t = np.linspace(0, duration, int(sample_rate * duration), False)
         # White noise with decreasing amplitude
-        noise = np.random.uniform(-1, 1, len(t))
+        noise = self.noise.uniform(-1, 1, len(t))
         # Low pass filter effect by averaging
         filtered = np.convolve(noise, np.ones(5)/5, mode='same')
         # Add some low frequency rumble
@@ -79,7 +260,7 @@ class AudioManager:
         freq = 600 * np.exp(-t * 4)
         wave = np.sin(2 * np.pi * freq * t)
         # Add some noise
-        noise = np.random.uniform(-0.3, 0.3, len(t))
+        noise = self.noise.uniform(-0.3, 0.3, len(t))
         wave = wave + noise
         # Envelope
         envelope = np.exp(-t * 2)
@@ -90,7 +271,7 @@ class AudioManager:
         duration = 0.2  # Will be looped
         t = np.linspace(0, duration, int(sample_rate * duration), False)
         # Low frequency noise
-        noise = np.random.uniform(-1, 1, len(t))
+        noise = self.noise.uniform(-1, 1, len(t))
         # Low pass by averaging
         filtered = np.convolve(noise, np.ones(20)/20, mode='same')
         # Add low frequency hum
@@ -120,91 +301,37 @@ class AudioManager:
         envelope = np.exp(-t * 2) * 0.8 + 0.2
         return (wave * envelope * 32767 * 0.3).astype(np.int16)
 
-    def _create_sound_file(self, name, samples):
-        """Save samples as a WAV file"""
-        filepath = f"assets/sounds/{name}.wav"
-        # Create stereo sound
-        stereo = np.column_stack((samples, samples))
-        sound = pygame.sndarray.make_sound(stereo)
-        # pygame doesn't have a direct way to save, so we'll use the samples
-        try:
-            import wave
-            with wave.open(filepath, 'w') as wav_file:
-                wav_file.setnchannels(2)
-                wav_file.setsampwidth(2)
-                wav_file.setframerate(22050)
-                wav_file.writeframes(stereo.tobytes())
-        except Exception:
-            pass  # Fall back to in-memory sounds
-
-    def _load_sounds(self):
-        """Load sound files into pygame"""
-        sound_files = [
-            "shoot", "explosion_small", "explosion_medium", "explosion_large",
-            "player_death", "thrust", "powerup", "extra_life"
-        ]
-
-        for name in sound_files:
-            filepath = f"assets/sounds/{name}.wav"
-            try:
-                if os.path.exists(filepath):
-                    self.sounds[name] = pygame.mixer.Sound(filepath)
-                else:
-                    # Generate in-memory if file doesn't exist
-                    self.sounds[name] = self._generate_sound_memory(name)
-            except Exception:
-                self.sounds[name] = None
-
-    def _generate_sound_memory(self, name):
-        """Generate sound directly in memory"""
-        sample_rate = 22050
-        generators = {
-            "shoot": lambda: self._generate_shoot_sound(sample_rate),
-            "explosion_small": lambda: self._generate_explosion_sound(sample_rate, 0.15, 800),
-            "explosion_medium": lambda: self._generate_explosion_sound(sample_rate, 0.2, 500),
-            "explosion_large": lambda: self._generate_explosion_sound(sample_rate, 0.3, 300),
-            "player_death": lambda: self._generate_death_sound(sample_rate),
-            "thrust": lambda: self._generate_thrust_sound(sample_rate),
-            "powerup": lambda: self._generate_powerup_sound(sample_rate),
-            "extra_life": lambda: self._generate_extra_life_sound(sample_rate),
-        }
-
-        if name in generators:
-            samples = generators[name]()
-            stereo = np.column_stack((samples, samples))
-            return pygame.sndarray.make_sound(stereo)
-        return None
-
     def play(self, sound_name):
         """Play a sound effect"""
         if not self.sound_enabled:
             return
-        sound = self.sounds.get(sound_name)
+        sound = self.load(sound_name)
         if sound:
-            sound.play()
+            self.voices.play(sound_name, sound)
+
+    def begin_frame(self):
+        """Start a new frame for coalescing repeated plays"""
+        self.voices.begin_frame()
+
+    def voice_stats(self):
+        """Channel budget counters (see VoiceManager)"""
+        return self.voices.stats()
 
     def play_explosion(self, radius):
         """Play explosion sound based on asteroid size"""
-        if radius >= ASTEROID_MAX_RADIUS:
-            self.play("explosion_large")
-        elif radius >= ASTEROID_MIN_RADIUS * 2:
-            self.play("explosion_medium")
-        else:
-            self.play("explosion_small")
+        self.play(explosion_sound(radius))
 
     def start_thrust(self):
         """Start playing thrust sound (looped)"""
         if not self.sound_enabled:
             return
-        sound = self.sounds.get("thrust")
-        if sound and sound.get_num_channels() == 0:
-            sound.play(-1)  # Loop indefinitely
+        sound = self.load("thrust")
+        if sound and not self.voices.is_playing("thrust"):
+            self.voices.play("thrust", sound, -1)  # Loop indefinitely
 
     def stop_thrust(self):
         """Stop thrust sound"""
-        sound = self.sounds.get("thrust")
-        if sound:
-            sound.stop()
+        self.voices.stop("thrust")
 
     def toggle_sound(self):
         """Toggle sound on/off"""
@@ -213,5 +340,150 @@ class AudioManager:
             pygame.mixer.stop()
 
 
+def explosion_sound(radius):
+    """Explosion sound name for an asteroid size"""
+    if radius >= ASTEROID_MAX_RADIUS:
+        return "explosion_large"
+    elif radius >= ASTEROID_MIN_RADIUS * 2:
+        return "explosion_medium"
+    else:
+        return "explosion_small"
+
+
+class AsyncAudio:
+    """An AudioManager started on a background thread, behind the same API.
+
+    Construction returns at once, so audio set-up never delays the first
+    frame. Sounds load lazily on the audio thread the first time they are
+    played (or warm()ed). A play of a sound that isn't ready yet is queued
+    and played once it is, unless it has waited longer than
+    AUDIO_PENDING_MAX_AGE or AUDIO_PENDING_LIMIT plays are already waiting,
+    in which case it is dropped.
+    """
+
+    def __init__(self, cache_dir=None):
+        self.manager = None
+        self.failed = False
+        self.sound_enabled = True
+        self.thrust_wanted = False
+        self.pending = deque()
+        self.requested = set()
+        self.jobs = queue.SimpleQueue()
+        self.queued = 0
+        self.dropped = 0
+        # Seconds the audio thread took to open the mixer
+        self.init_seconds = None
+        self.ready = threading.Event()
+        self.thread = threading.Thread(target=self._run, args=(cache_dir,), name="audio", daemon=True)
+        self.thread.start()
+
+    def _run(self, cache_dir):
+        start = time.perf_counter()
+        try:
+            manager = AudioManager(cache_dir, lazy=True)
+            manager.sound_enabled = self.sound_enabled
+            self.manager = manager
+        except Exception:
+            self.failed = True
+            self.pending.clear()
+        self.init_seconds = time.perf_counter() - start
+        self.ready.set()
+
+        while not self.failed:
+            name = self.jobs.get()
+            if name is None:
+                break
+            self.manager.load(name)
+            self._play_pending()
+            if name == "thrust" and self.thrust_wanted:
+                self.manager.start_thrust()
+
+    def _request(self, name):
+        if name not in self.requested:
+            self.requested.add(name)
+            self.jobs.put(name)
+
+    def _play_pending(self):
+        """Play queued sounds that have loaded; called from either thread"""
+        sounds = self.manager.sounds
+        now = time.perf_counter()
+        for _ in range(len(self.pending)):
+            try:
+                name, queued_at = self.pending.popleft()
+            except IndexError:
+                break
+            if now - queued_at > AUDIO_PENDING_MAX_AGE or not self.sound_enabled:
+                self.dropped += 1
+            elif name not in sounds:
+                # Still loading
+                self.pending.append((name, queued_at))
+            else:
+                self.manager.play(name)
+
+    def warm(self, names=SOUNDS):
+        """Load sounds on the audio thread ahead of their first play"""
+        for name in names:
+            self._request(name)
+
+    def close(self):
+        self.jobs.put(None)
+
+    def play(self, sound_name):
+        """Play a sound effect now if it's loaded, otherwise once it is"""
+        if not self.sound_enabled or self.failed:
+            return
+        manager = self.manager
+        if manager is not None and sound_name in manager.sounds:
+            manager.play(sound_name)
+            return
+        if len(self.pending) >= AUDIO_PENDING_LIMIT:
+            self.dropped += 1
+            return
+        self.pending.append((sound_name, time.perf_counter()))
+        self.queued += 1
+        self._request(sound_name)
+        # It may have finished loading since the check above
+        if manager is not None and sound_name in manager.sounds:
+            self._play_pending()
+
+    def play_explosion(self, radius):
+        """Play explosion sound based on asteroid size"""
+        self.play(explosion_sound(radius))
+
+    def begin_frame(self):
+        if self.manager is not None:
+            self.manager.begin_frame()
+
+    def voice_stats(self):
+        """VoiceManager counters, plus plays queued and dropped while sounds loaded"""
+        stats = self.manager.voice_stats() if self.manager is not None else {}
+        stats["queued"] = self.queued
+        stats["dropped_loading"] = self.dropped
+        return stats
+
+    def start_thrust(self):
+        """Start playing thrust sound (looped) as soon as it's loaded"""
+        if not self.sound_enabled or self.failed:
+            return
+        self.thrust_wanted = True
+        manager = self.manager
+        if manager is not None and "thrust" in manager.sounds:
+            manager.start_thrust()
+        else:
+            self._request("thrust")
+
+    def stop_thrust(self):
+        """Stop thrust sound"""
+        self.thrust_wanted = False
+        if self.manager is not None:
+            self.manager.stop_thrust()
+
+    def toggle_sound(self):
+        """Toggle sound on/off"""
+        self.sound_enabled = not self.sound_enabled
+        if self.manager is not None and self.manager.sound_enabled != self.sound_enabled:
+            self.manager.toggle_sound()
+
+
 # Import constants for explosion check
 from constants import ASTEROID_MAX_RADIUS, ASTEROID_MIN_RADIUS
@@ -0,0 +1,168 @@
+"""Play many headless games in parallel and tabulate the results.
+
+Each game gets a seed and an input policy and runs until game over or a
+time limit. Games are spread over a ProcessPoolExecutor, one game per
+task, so throughput grows with the number of cores.
+
+Usage:  python batch.py [--games N] [--workers N] [--policy NAME] [--seed S]
+"""
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from constants import STATE_GAME_OVER
+from game import Game
+from inputs import THRUST, ROTATE_LEFT, ROTATE_RIGHT, FIRE
+import logger
+
+MAX_SIM_SECONDS = 10 * 60
+
+
+def random_policy(rng):
+    """Hold fire, thrust now and then and turn in random bursts"""
+    inputs = FIRE
+    if rng.random() < 0.3:
+        inputs |= THRUST
+    turn = rng.random()
+    if turn < 0.3:
+        inputs |= ROTATE_LEFT
+    elif turn < 0.6:
+        inputs |= ROTATE_RIGHT
+    return inputs
+
+
+class RandomPolicy:
+    """random_policy, re-decided every `hold` ticks so turns and thrust last a while"""
+
+    def __init__(self, seed, hold=10):
+        self.rng = random.Random(seed)
+        self.hold = hold
+        self.inputs = 0
+
+    def __call__(self, game):
+        if game.tick % self.hold == 0:
+            self.inputs = random_policy(self.rng)
+        return self.inputs
+
+
+class TurretPolicy:
+    """Sit in the middle, spin and keep firing"""
+
+    def __init__(self, seed):
+        pass
+
+    def __call__(self, game):
+        return ROTATE_LEFT | FIRE
+
+
+class IdlePolicy:
+    """Never touch the controls; a baseline for how long waves take to kill"""
+
+    def __init__(self, seed):
+        pass
+
+    def __call__(self, game):
+        return 0
+
+
+POLICIES = {
+    "random": RandomPolicy,
+    "turret": TurretPolicy,
+    "idle": IdlePolicy,
+}
+
+
+class GameResult:
+    def __init__(self, seed, policy, score, waves, deaths, shots, ticks, tick_rate, elapsed):
+        self.seed = seed
+        self.policy = policy
+        self.score = score
+        self.waves = waves
+        self.deaths = deaths
+        self.shots = shots
+        self.ticks = ticks
+        self.tick_rate = tick_rate
+        self.elapsed = elapsed
+
+    @property
+    def sim_seconds(self):
+        """Game time survived, at the tick rate this game ran at"""
+        return self.ticks / self.tick_rate
+
+    @property
+    def sim_fps(self):
+        return self.ticks / self.elapsed if self.elapsed else 0.0
+
+
+def play(seed, policy="random", max_seconds=MAX_SIM_SECONDS, tick_rate=None, profile=None):
+    """Play one headless game to game over (or max_seconds of game time)"""
+    game = Game(headless=True, tick_rate=tick_rate, profile=profile)
+    game.start_game(seed=seed)
+    decide = POLICIES[policy](seed)
+    max_ticks = int(max_seconds * game.tick_rate)
+    dt = game.tick_dt
+    start = time.perf_counter()
+    while game.state != STATE_GAME_OVER and game.tick < max_ticks:
+        game.step(dt, decide(game))
+    elapsed = time.perf_counter() - start
+    return GameResult(
+        seed, policy, game.score, game.wave, game.deaths, game.player.shots_fired, game.tick,
+        game.tick_rate, elapsed
+    )
+
+
+def init_worker():
+    # Dozens of processes appending to the same JSONL logs helps nobody
+    logger.set_enabled(False)
+
+
+def run_batch(seeds, policy="random", max_seconds=MAX_SIM_SECONDS, workers=None):
+    """Play one game per seed, in parallel unless workers == 1; results keep seed order"""
+    seeds = list(seeds)
+    if workers == 1:
+        init_worker()
+        return [play(seed, policy, max_seconds) for seed in seeds]
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+        futures = [executor.submit(play, seed, policy, max_seconds) for seed in seeds]
+        return [future.result() for future in futures]
+
+
+def format_table(results, wall_time=None):
+    lines = [f"{'seed':>8} {'policy':>8} {'score':>7} {'waves':>5} {'deaths':>6} {'shots':>6} {'sim s':>7} {'sim fps':>9}"]
+    for r in results:
+        lines.append(
+            f"{r.seed:>8} {r.policy:>8} {r.score:>7} {r.waves:>5} {r.deaths:>6} {r.shots:>6} "
+            f"{r.sim_seconds:>7.1f} {r.sim_fps:>9,.0f}"
+        )
+    if results:
+        n = len(results)
+        lines.append(
+            f"{'mean':>8} {'':>8} {sum(r.score for r in results) / n:>7.0f} "
+            f"{sum(r.waves for r in results) / n:>5.1f} {sum(r.deaths for r in results) / n:>6.1f} "
+            f"{sum(r.shots for r in results) / n:>6.0f} {sum(r.sim_seconds for r in results) / n:>7.1f} "
+            f"{sum(r.sim_fps for r in results) / n:>9,.0f}"
+        )
+    if wall_time:
+        ticks = sum(r.ticks for r in results)
+        lines.append(f"{len(results)} games, {ticks} ticks in {wall_time:.2f} s: {ticks / wall_time:,.0f} sim frames/s overall")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play headless games in parallel")
+    parser.add_argument("--games", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="random")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--max-seconds", type=float, default=MAX_SIM_SECONDS, help="game time limit per game")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = run_batch(range(args.seed, args.seed + args.games), args.policy, args.max_seconds, args.workers)
+    print(format_table(results, time.perf_counter() - start))
+
+
+if __name__ == "__main__":
+    main()
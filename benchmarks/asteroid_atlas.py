@@ -0,0 +1,58 @@
+"""Asteroid draw time with rotation atlases versus exact polygons.
+
+Draws 10 to 200 spinning asteroids for a few hundred frames and reports
+the median time of drawing them all, plus the memory the atlases hold
+once every frame angle has been used. Uses the SDL dummy driver, so this
+is the drawing and blitting work only.
+
+Run from the repository root:  python -m benchmarks.asteroid_atlas
+"""
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from game import Game
+import logger
+
+ASTEROIDS = (10, 50, 200)
+FRAMES = 300
+DT = 1 / 60
+
+
+def measure(screen, asteroid_atlas, asteroids):
+    game = Game(screen, asteroid_atlas=asteroid_atlas, flight_recorder=False)
+    game.audio = None
+    game.start_game(seed=1)
+    for _ in range(asteroids):
+        game.spawn_asteroid()
+    samples = []
+    for _ in range(FRAMES):
+        for asteroid in game.asteroids:
+            asteroid.rotation += 7
+        screen.fill((0, 0, 0))
+        start = time.perf_counter()
+        for asteroid in game.asteroids:
+            asteroid.draw(screen)
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    atlas_bytes = game.sprite_cache.stats()["bytes"] if game.sprite_cache else 0
+    return samples[len(samples) // 2], atlas_bytes
+
+
+def main():
+    logger.set_enabled(False)
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    print(f"{'asteroids':>9} {'polygon ms':>11} {'atlas ms':>9} {'atlas MB':>9}")
+    for asteroids in ASTEROIDS:
+        polygon, _ = measure(screen, False, asteroids)
+        atlas, atlas_bytes = measure(screen, True, asteroids)
+        print(f"{asteroids:>9} {polygon * 1000:>11.3f} {atlas * 1000:>9.3f} {atlas_bytes / 2**20:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Memory and construction cost of a 5,000-asteroid field.
+
+Compares Asteroid, which shares AsteroidShapes templates, against a
+stand-in with the instance layout Asteroid had before them: the same
+CircleShape base plus its own list of vertices, rotation and spin.
+
+Run from the repository root:  python -m benchmarks.asteroid_memory
+"""
+import os
+import random
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, ASTEROID_MIN_RADIUS, ASTEROID_KINDS
+from asteroid import Asteroid, AsteroidShapes, generate_shape
+from circleshape import CircleShape
+import rng
+
+ASTEROIDS = 5_000
+
+
+class PerInstanceAsteroid(CircleShape):
+    """Asteroid's state before AsteroidShapes: a vertex list per instance"""
+
+    def __init__(self, x, y, radius):
+        super().__init__(x, y, radius)
+        self.vertices = list(generate_shape(radius))
+        self.rotation = rng.cosmetic.uniform(0, 360)
+        self.rotation_speed = rng.cosmetic.uniform(-60, 60)
+
+
+def build_field(cls):
+    field = pygame.sprite.Group()
+    cls.containers = (field,)
+    for _ in range(ASTEROIDS):
+        radius = ASTEROID_MIN_RADIUS * random.randint(1, ASTEROID_KINDS)
+        cls(random.uniform(0, SCREEN_WIDTH), random.uniform(0, SCREEN_HEIGHT), radius)
+    return field
+
+
+def measure(cls):
+    random.seed(1)
+    # Templates are built up front, as Game does, so they aren't counted
+    Asteroid.shapes = AsteroidShapes()
+    tracemalloc.start()
+    start = time.perf_counter()
+    field = build_field(cls)
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del field
+    return current, elapsed
+
+
+def main():
+    pygame.init()
+    for label, cls in (("per-instance shapes", PerInstanceAsteroid), ("shared templates", Asteroid)):
+        current, elapsed = measure(cls)
+        print(
+            f"{label:>20}: {current / 1024 / 1024:6.2f} MiB total, "
+            f"{current / ASTEROIDS:6.0f} B/asteroid, {elapsed * 1000:7.1f} ms to build"
+        )
+
+
+if __name__ == "__main__":
+    main()
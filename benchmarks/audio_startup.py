@@ -0,0 +1,58 @@
+"""AudioManager start-up time with and without the sound cache.
+
+cold     empty cache directory: every sound is synthesized and written,
+         as every launch did before sounds were cached
+disk     cache files present, as on a normal launch
+memory   another AudioManager in the same process
+
+Each case is the median of REPEATS constructions. Runs with SDL's dummy
+audio driver unless SDL_AUDIODRIVER is set, and caches sounds in a
+temporary directory.
+
+Run from the repository root:  python -m benchmarks.audio_startup
+"""
+import os
+import shutil
+import statistics
+import tempfile
+import time
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from audio import AudioManager
+
+REPEATS = 15
+
+
+def timed(build):
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        manager = build()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000, manager
+
+
+def main():
+    pygame.init()
+    cache_dir = tempfile.mkdtemp()
+
+    def cold():
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        AudioManager._loaded.clear()
+        return AudioManager(cache_dir)
+
+    def disk():
+        AudioManager._loaded.clear()
+        return AudioManager(cache_dir)
+
+    print(f"{'cache':>8} {'ms':>8} {'hits':>5} {'synthesized':>12}")
+    for name, build in (("cold", cold), ("disk", disk), ("memory", lambda: AudioManager(cache_dir))):
+        ms, manager = timed(build)
+        print(f"{name:>8} {ms:>8.2f} {manager.cache_hits:>5} {manager.cache_misses:>12}")
+    shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
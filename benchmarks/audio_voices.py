@@ -0,0 +1,62 @@
+"""Sound plays per frame against the AudioManager voice budget.
+
+Each frame triggers `hits` explosions of random sizes plus a shot and,
+now and then, a power-up, the way a spread-shot volley into a dense wave
+does, and the thrust loop runs throughout. Frames are paced at 60 per
+second so sounds finish as they would in play. Reports how many plays
+reached a channel, were coalesced, took over a busy channel or were
+dropped, the busiest the mixer got, and the cost of a play() call. Runs
+with SDL's dummy audio driver unless SDL_AUDIODRIVER is set.
+
+Run from the repository root:  python -m benchmarks.audio_voices
+"""
+import os
+import random
+import tempfile
+import time
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from audio import AudioManager, VoiceManager
+from constants import AUDIO_CHANNELS
+
+FRAMES = 180
+FRAME_TIME = 1 / 60
+HITS = (1, 10, 50)
+
+
+def main():
+    pygame.init()
+    audio = AudioManager(tempfile.mkdtemp())
+    rng = random.Random(1)
+    print(f"{'hits/frame':>10} {'played':>7} {'coalesced':>9} {'stolen':>6} {'dropped':>7} "
+          f"{'max busy':>8} {'us/play':>8}")
+    for hits in HITS:
+        audio.voices = VoiceManager()
+        audio.start_thrust()
+        calls = 0
+        busiest = 0
+        elapsed = 0.0
+        next_frame = time.perf_counter()
+        for frame in range(FRAMES):
+            next_frame += FRAME_TIME
+            time.sleep(max(0.0, next_frame - time.perf_counter()))
+            audio.begin_frame()
+            start = time.perf_counter()
+            audio.play("shoot")
+            for _ in range(hits):
+                audio.play_explosion(rng.choice((20, 40, 60)))
+            if frame % 50 == 0:
+                audio.play("powerup")
+            elapsed += time.perf_counter() - start
+            calls += hits + 1 + (frame % 50 == 0)
+            busiest = max(busiest, sum(pygame.mixer.Channel(i).get_busy() for i in range(AUDIO_CHANNELS)))
+        stats = audio.voice_stats()
+        print(f"{hits:>10} {stats['played']:>7} {stats['coalesced']:>9} {stats['stolen']:>6} "
+              f"{stats['dropped']:>7} {busiest:>8} {elapsed / calls * 1e6:>8.2f}")
+        audio.stop_thrust()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Frame time of the update pass with 10k entities, with and without EntityStore.
+
+Run from the repository root:  python -m benchmarks.entity_store
+"""
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, ASTEROID_MIN_RADIUS, SHOT_RADIUS
+from circleshape import CircleShape
+from entitystore import EntityStore
+from asteroid import Asteroid
+from shot import Shot
+from ufo import UFO
+from powerup import PowerUp
+
+ENTITIES = 10_000
+FRAMES = 120
+DT = 1 / 60
+
+
+def populate(updatable):
+    Asteroid.containers = (updatable,)
+    Shot.containers = (updatable,)
+    UFO.containers = (updatable,)
+    PowerUp.containers = (updatable,)
+    for i in range(ENTITIES):
+        x = random.uniform(0, SCREEN_WIDTH)
+        y = random.uniform(0, SCREEN_HEIGHT)
+        kind = i % 10
+        if kind < 7:
+            entity = Asteroid(x, y, ASTEROID_MIN_RADIUS * random.randint(1, 3))
+            entity.velocity = pygame.Vector2(random.uniform(-100, 100), random.uniform(-100, 100))
+        elif kind < 9:
+            entity = Shot(x, y, SHOT_RADIUS)
+            entity.velocity = pygame.Vector2(500, 0).rotate(random.uniform(0, 360))
+            # Long lifetime keeps the population stable for the whole run
+            entity.lifetime = 1e9
+        else:
+            entity = PowerUp(x, y)
+
+
+def run(use_store):
+    random.seed(1)
+    CircleShape.store = EntityStore((Asteroid, Shot, UFO, PowerUp)) if use_store else None
+    updatable = pygame.sprite.Group()
+    populate(updatable)
+
+    samples = []
+    for _ in range(FRAMES):
+        start = time.perf_counter()
+        if CircleShape.store is not None:
+            CircleShape.store.step(DT)
+        updatable.update(DT)
+        samples.append(time.perf_counter() - start)
+
+    for sprite in list(updatable):
+        sprite.kill()
+    CircleShape.store = None
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def main():
+    pygame.init()
+    for label, use_store in (("sprites", False), ("entity store", True)):
+        median = run(use_store)
+        print(f"{label:>13}: {median * 1000:7.2f} ms/frame ({ENTITIES} entities)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Cost of the flight recorder per simulation tick.
+
+Times FlightRecorder.record() on headless games with 10 to 200 asteroids,
+with and without EntityStore. "frame" is the FRAME row every tick records;
+"snapshot" is one entity snapshot, taken every FLIGHT_RECORDER_ENTITY_EVERY
+ticks; "per tick" is the frame row plus the snapshot spread over its ticks.
+Each figure is the best of several runs.
+
+Run from the repository root:  python -m benchmarks.flight_recorder
+"""
+import time
+
+from constants import FLIGHT_RECORDER_ENTITY_EVERY
+from flightrecorder import FlightRecorder
+from game import Game
+import logger
+
+ASTEROIDS = (10, 50, 200)
+CALLS = 2_000
+REPEATS = 7
+
+
+def best_us(function):
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for _ in range(CALLS):
+            function()
+        times.append((time.perf_counter() - start) / CALLS * 1e6)
+    return min(times)
+
+
+def build_game(entity_store, asteroids):
+    game = Game(headless=True, entity_store=entity_store, flight_recorder=False)
+    game.start_game(seed=1)
+    for _ in range(asteroids):
+        game.spawn_asteroid()
+    for _ in range(30):
+        game.step(game.tick_dt)
+    return game
+
+
+def main():
+    logger.set_enabled(False)
+    print(f"{'store':>5} {'entities':>8} {'frame us':>9} {'snapshot us':>12} {'per tick us':>12}")
+    for entity_store in (False, True):
+        for asteroids in ASTEROIDS:
+            game = build_game(entity_store, asteroids)
+            entities = len(game.asteroids) + len(game.shots) + len(game.ufos) + len(game.powerups)
+            recorder = FlightRecorder()
+            snapshot = best_us(lambda: recorder._snapshot_entities(game))
+            # Frame rows alone: never reach a snapshot tick
+            recorder.entity_every = float("inf")
+            frame = best_us(lambda: recorder.record(game, 0))
+            per_tick = frame + snapshot / FLIGHT_RECORDER_ENTITY_EVERY
+            print(f"{str(entity_store):>5} {entities:>8} {frame:>9.1f} {snapshot:>12.1f} {per_tick:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""Simulated frames per second of headless games.
+
+Each game is driven by a random input policy until game over or a frame
+limit; no window, audio or drawing is involved. Games run one after
+another in this process; see batch.py for the parallel version.
+
+Run from the repository root:  python -m benchmarks.headless_throughput
+"""
+import time
+
+from batch import play
+import logger
+
+GAMES = 20
+MAX_SECONDS = 5 * 60
+
+
+def main():
+    logger.set_enabled(False)
+    total_frames = 0
+    start = time.perf_counter()
+    for seed in range(GAMES):
+        total_frames += play(seed, "random", MAX_SECONDS).ticks
+    elapsed = time.perf_counter() - start
+    print(f"{GAMES} games, {total_frames} frames in {elapsed:.2f} s: {total_frames / elapsed:,.0f} sim frames/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Cost of logger.log_state snapshots per entity.
+
+Times entity.snapshot() alone and whole sampled log_state calls (records,
+JSON encoding and the file append) for fields of 10 to 1,000 asteroids,
+plus the cost of a call on a frame that isn't sampled and of one past the
+max_seconds cutoff, then checks that events logged past the cutoff still
+get rising frame numbers. Log files are written to a temporary directory.
+
+Run from the repository root:  python -m benchmarks.log_snapshot
+"""
+import json
+import math
+import os
+import random
+import tempfile
+import time
+
+import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, ASTEROID_MIN_RADIUS, ASTEROID_KINDS
+from asteroid import Asteroid
+import logger
+
+SIZES = (10, 100, 1_000)
+REPEATS = 200
+
+
+def build_field(count):
+    field = pygame.sprite.Group()
+    Asteroid.containers = (field,)
+    for _ in range(count):
+        radius = ASTEROID_MIN_RADIUS * random.randint(1, ASTEROID_KINDS)
+        asteroid = Asteroid(random.uniform(0, SCREEN_WIDTH), random.uniform(0, SCREEN_HEIGHT), radius)
+        asteroid.velocity = pygame.Vector2(random.uniform(-100, 100), random.uniform(-100, 100))
+    return field
+
+
+def per_entity_us(function, count):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        function()
+    return (time.perf_counter() - start) / REPEATS / count * 1e6
+
+
+def main():
+    random.seed(1)
+    os.chdir(tempfile.mkdtemp())
+    print(f"{'entities':>8} {'snapshot() us':>14} {'log_state us/entity':>20}")
+    for count in SIZES:
+        field = build_field(count)
+        entities = {"asteroids": field}
+        logger.configure(sample_every=1, max_seconds=math.inf, sprite_limit=count)
+        snapshot = per_entity_us(lambda: [asteroid.snapshot() for asteroid in field], count)
+        logged = per_entity_us(lambda: logger.log_state(entities, (SCREEN_WIDTH, SCREEN_HEIGHT)), count)
+        print(f"{count:>8} {snapshot:>14.2f} {logged:>20.2f}")
+
+    logger.configure(sample_every=10 ** 9)
+    calls = 1_000_000
+    start = time.perf_counter()
+    for _ in range(calls):
+        logger.log_state(entities)
+    print(f"unsampled frame: {(time.perf_counter() - start) / calls * 1e9:.0f} ns per call")
+
+    # Past the max_seconds cutoff no state is logged, but frames keep counting
+    logger.configure(max_seconds=0)
+    start = time.perf_counter()
+    for _ in range(calls):
+        logger.log_state(entities)
+    print(f"frame past the cutoff: {(time.perf_counter() - start) / calls * 1e9:.0f} ns per call")
+    for _ in range(2):
+        logger.log_state(entities)
+        logger.log_event("frame_check")
+    logger.flush()
+    with open("game_events.jsonl") as f:
+        frames = [json.loads(line)["frame"] for line in f][-2:]
+    if frames[1] <= frames[0]:
+        raise AssertionError(f"event frames stopped advancing past the cutoff: {frames}")
+
+
+if __name__ == "__main__":
+    main()
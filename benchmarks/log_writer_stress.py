@@ -0,0 +1,67 @@
+"""Stress the background log writer at 100,000 events per minute.
+
+Simulates 60 fps frames that each log their share of the event rate and
+reports how long log_event held up the frame, then checks that every
+event that wasn't dropped reached disk (rotated files included). Files
+are written to a temporary directory with rotation at 1 MB.
+
+Run from the repository root:  python -m benchmarks.log_writer_stress [seconds] [events per minute]
+"""
+import glob
+import os
+import sys
+import tempfile
+import time
+
+import logger
+
+FPS = 60
+
+
+def main(seconds=60.0, per_minute=100_000):
+    os.chdir(tempfile.mkdtemp())
+    # Keep every rotated file so nothing written can go missing
+    logger.configure(max_bytes=1024 * 1024, backups=1000)
+    frames = int(seconds * FPS)
+    per_frame = per_minute / 60 / FPS
+    frame_dt = 1 / FPS
+
+    logged = 0
+    owed = 0.0
+    costs = []
+    start = time.perf_counter()
+    for frame in range(frames):
+        frame_start = time.perf_counter()
+        owed += per_frame
+        while owed >= 1:
+            logger.log_event("asteroid_shot", frame=frame, score=logged)
+            logged += 1
+            owed -= 1
+        costs.append(time.perf_counter() - frame_start)
+        # Sleep off the rest of the frame like clock.tick would
+        remaining = start + (frame + 1) * frame_dt - time.perf_counter()
+        if remaining > 0:
+            time.sleep(remaining)
+    elapsed = time.perf_counter() - start
+
+    stats = logger.writer_stats()
+    logger.shutdown()
+    on_disk = 0
+    for path in glob.glob("game_events.jsonl*"):
+        with open(path) as f:
+            on_disk += sum(1 for _ in f)
+
+    costs.sort()
+    print(f"{logged} events in {elapsed:.1f} s ({logged / elapsed * 60:,.0f}/min)")
+    print(
+        f"log_event time per frame: mean {sum(costs) / len(costs) * 1e6:.0f} us, "
+        f"p99 {costs[int(len(costs) * 0.99)] * 1e6:.0f} us, max {costs[-1] * 1e6:.0f} us"
+    )
+    print(f"dropped {stats['dropped']}, batches {stats['batches']}, rotations {stats['rotations']}")
+    expected = logged - stats["dropped"]
+    print(f"on disk: {on_disk} of {expected} kept events - {'OK' if on_disk == expected else 'MISSING'}")
+    return 0 if on_disk == expected else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(*(float(arg) for arg in sys.argv[1:3])))
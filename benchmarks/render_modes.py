@@ -0,0 +1,56 @@
+"""Frame time of Game.draw with full redraws versus dirty-rect rendering.
+
+Plays the same seeded session in both modes and reports draw time only.
+With the SDL dummy driver display updates are free, so this measures the
+drawing and blitting work; run with a real video driver to include the
+cost of presenting frames:  python -m benchmarks.render_modes
+"""
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, STATE_PLAYING
+from game import Game
+
+FRAMES = 600
+DT = 1 / 60
+
+
+def run(dirty_rects):
+    random.seed(1)
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    game = Game(screen, dirty_rects=dirty_rects, flight_recorder=False)
+    game.audio = None
+    game.start_game()
+
+    samples = []
+    for _ in range(FRAMES):
+        game.update(DT)
+        if game.state == STATE_PLAYING:
+            start = time.perf_counter()
+            game.draw()
+            samples.append(time.perf_counter() - start)
+        else:
+            game.draw()
+
+    samples.sort()
+    return samples[len(samples) // 2], samples[int(len(samples) * 0.95)], game
+
+
+def main():
+    pygame.init()
+    for label, dirty in (("full redraw", False), ("dirty rects", True)):
+        median, p95, game = run(dirty)
+        line = f"{label:>12}: median {median * 1000:6.3f} ms, p95 {p95 * 1000:6.3f} ms"
+        if game.dirty_renderer is not None:
+            stats = game.dirty_renderer.stats()
+            line += f" ({stats['dirty_frames']} partial / {stats['full_frames']} full frames)"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
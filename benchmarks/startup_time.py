@@ -0,0 +1,70 @@
+"""Time to first frame of main.py, per start-up phase.
+
+Runs main.py in fresh interpreters (dummy SDL drivers, a temporary working
+directory) that quit right after the first frame, and prints the median
+of each phase from startup.breakdown(), with audio started on the
+background thread (the default) and synchronously. "cold" runs start
+with an empty sound cache; "warm" runs reuse it.
+
+Run from the repository root:  python -m benchmarks.startup_time [runs]
+"""
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = """
+import json, sys
+import startup
+import main, game, pygame
+
+init, draw = game.Game.__init__, game.Game.draw
+
+def patched_init(self, *args, **kwargs):
+    init(self, *args, async_audio=sys.argv[1] == "async", **kwargs)
+
+def draw_once(self):
+    draw(self)
+    pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+game.Game.__init__, game.Game.draw = patched_init, draw_once
+main.main()
+print(json.dumps(startup.breakdown()))
+"""
+
+
+def run(mode, directory):
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy", PYTHONPATH=REPO)
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD, mode], cwd=directory, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(argv):
+    runs = int(argv[0]) if argv else 5
+    rows = {}
+    for mode in ("async", "sync"):
+        for cache in ("cold", "warm"):
+            samples = []
+            for _ in range(runs):
+                directory = tempfile.mkdtemp()
+                if cache == "warm":
+                    run(mode, directory)
+                samples.append(run(mode, directory))
+                shutil.rmtree(directory, ignore_errors=True)
+            rows[f"{mode}/{cache}"] = {name: statistics.median(s[name] for s in samples) for name in samples[0]}
+
+    names = list(next(iter(rows.values())))
+    print(f"{'ms':>12} " + " ".join(f"{column:>11}" for column in rows))
+    for name in names:
+        print(f"{name:>12} " + " ".join(f"{row.get(name, 0):>11.1f}" for row in rows.values()))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
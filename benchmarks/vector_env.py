@@ -0,0 +1,50 @@
+"""Steps per second of VectorEnv at K = 1, 16 and 256 games.
+
+Each configuration runs at least the same total number of game steps with
+random (thrust, rotate, fire) actions, including observation building and
+automatic resets, with and without EntityStore-backed games. The opening
+wave pause is stepped through before timing starts.
+
+Run from the repository root:  python -m benchmarks.vector_env
+"""
+import time
+
+import numpy as np
+
+from vecenv import VectorEnv
+
+SIZES = (1, 16, 256)
+TOTAL_STEPS = 30_000
+MIN_BATCHES = 300
+WARMUP_BATCHES = 150
+
+
+def measure(num_envs, entity_store):
+    env = VectorEnv(num_envs, entity_store=entity_store)
+    env.reset()
+    rng = np.random.default_rng(0)
+    batches = max(MIN_BATCHES, TOTAL_STEPS // num_envs)
+    actions = [
+        np.column_stack((rng.integers(-1, 2, num_envs), rng.integers(-1, 2, num_envs), rng.integers(0, 2, num_envs)))
+        for _ in range(WARMUP_BATCHES + batches)
+    ]
+    for batch in actions[:WARMUP_BATCHES]:
+        env.step(batch)
+    start = time.perf_counter()
+    for batch in actions[WARMUP_BATCHES:]:
+        env.step(batch)
+    elapsed = time.perf_counter() - start
+    env.close()
+    return batches, batches * num_envs / elapsed
+
+
+def main():
+    print(f"{'K':>5} {'store':>6} {'batches':>8} {'game steps/s':>13}")
+    for num_envs in SIZES:
+        for entity_store in (False, True):
+            batches, rate = measure(num_envs, entity_store)
+            print(f"{num_envs:>5} {str(entity_store):>6} {batches:>8} {rate:>13,.0f}")
+
+
+if __name__ == "__main__":
+    main()
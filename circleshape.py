@@ -1,9 +1,26 @@
 import pygame
-from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, LINE_WIDTH
+from pool import Poolable
 
 
 # Base class for game objects
-class CircleShape(pygame.sprite.Sprite):
+class CircleShape(Poolable, pygame.sprite.Sprite):
+    # Optional EntityStore; when set, stored subclasses become array-backed handles
+    store = None
+    # Whether the entity re-enters from the opposite edge (see wrap_position)
+    wraps_around = True
+
+    @classmethod
+    def instance_class(cls):
+        """The store-backed handle class when the active EntityStore holds cls"""
+        store = CircleShape.store
+        if store is not None and store.handles(cls):
+            return store.handle_class(cls)
+        return cls
+
+    def __new__(cls, *args, **kwargs):
+        return super().__new__(cls.instance_class())
+
     def __init__(self, x, y, radius):
         if hasattr(self, "containers"):
             super().__init__(self.containers)
@@ -12,17 +29,57 @@ class CircleShape(pygame.sprite.Sprite):
         self.position = pygame.Vector2(x, y)
         self.velocity = pygame.Vector2(0, 0)
         self.radius = radius
+        # Where draw() renders; see begin_tick and interpolate
+        self.render_position = self.position
+        self.previous_position = None
 
     def wrap_position(self):
         """Wrap position around screen edges"""
-        if self.position.x < -self.radius:
-            self.position.x = SCREEN_WIDTH + self.radius
-        elif self.position.x > SCREEN_WIDTH + self.radius:
-            self.position.x = -self.radius
-        if self.position.y < -self.radius:
-            self.position.y = SCREEN_HEIGHT + self.radius
-        elif self.position.y > SCREEN_HEIGHT + self.radius:
-            self.position.y = -self.radius
+        # Assigns a new vector rather than editing in place, which store handles need
+        position = self.position
+        x, y = position
+        radius = self.radius
+        if x < -radius:
+            x = SCREEN_WIDTH + radius
+        elif x > SCREEN_WIDTH + radius:
+            x = -radius
+        if y < -radius:
+            y = SCREEN_HEIGHT + radius
+        elif y > SCREEN_HEIGHT + radius:
+            y = -radius
+        if (x, y) != position:
+            self.position = pygame.Vector2(x, y)
+
+    def begin_tick(self):
+        """Remember where the coming simulation tick starts"""
+        if self.previous_position is None:
+            self.previous_position = self.position.copy()
+        else:
+            self.previous_position.update(self.position)
+
+    def interpolate(self, alpha):
+        """Place render_position alpha of the way through the last tick"""
+        previous = self.previous_position
+        position = self.position
+        if previous is None or alpha >= 1:
+            self.render_position = position
+            return
+        # Don't draw a sprite sliding across the screen when it wrapped
+        dx = position.x - previous.x
+        dy = position.y - previous.y
+        if abs(dx) > SCREEN_WIDTH / 2 or abs(dy) > SCREEN_HEIGHT / 2:
+            self.render_position = position
+        else:
+            self.render_position = pygame.Vector2(previous.x + dx * alpha, previous.y + dy * alpha)
+
+    def bounding_rect(self):
+        """Screen area draw() may touch, used for dirty-rect rendering"""
+        return self.rect_around(self.radius + LINE_WIDTH + 2)
+
+    def rect_around(self, extent):
+        size = int(extent * 2) + 2
+        x, y = self.render_position
+        return pygame.Rect(int(x - extent), int(y - extent), size, size)
 
     def draw(self, screen):
         # must override
@@ -32,10 +89,21 @@ class CircleShape(pygame.sprite.Sprite):
         # must override
         pass
 
+    def update_behavior(self, dt):
+        """Per-frame logic other than motion; store-backed handles only run this"""
+        pass
+
+    def snapshot(self):
+        """Compact record of this object for the state log"""
+        position = self.position
+        velocity = self.velocity
+        return {
+            "type": type(self).__name__,
+            "pos": [round(position.x, 2), round(position.y, 2)],
+            "vel": [round(velocity.x, 2), round(velocity.y, 2)],
+            "rad": self.radius,
+        }
+
     def collides_with(self, other):
-        distance = self.position.distance_to(other.position)
-        if distance <= self.radius + other.radius:
-            return True
-        else:
-            return False
-        
\ No newline at end of file
+        reach = self.radius + other.radius
+        return self.position.distance_squared_to(other.position) <= reach * reach
@@ -0,0 +1,67 @@
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, ASTEROID_MAX_RADIUS
+
+
+class SpatialHash:
+    """Uniform grid broadphase for circle sprites.
+
+    Cells wrap around the screen edges, so sprites that have drifted past an
+    edge (wrap_position lets them go up to one radius off-screen) still land
+    in a valid bucket and neighbouring cells are found across the seam.
+    """
+
+    def __init__(self, cell_size=None):
+        if cell_size is None:
+            cell_size = ASTEROID_MAX_RADIUS * 2
+        self.cell_size = cell_size
+        self.cols = max(1, SCREEN_WIDTH // cell_size)
+        self.rows = max(1, SCREEN_HEIGHT // cell_size)
+        self.cells = {}
+        self.max_radius = 0
+
+    def rebuild(self, sprites):
+        """Bucket sprites by cell; remembers each sprite's insertion order"""
+        self.cells = {}
+        self.max_radius = 0
+        size = self.cell_size
+        cols = self.cols
+        rows = self.rows
+        for index, sprite in enumerate(sprites):
+            key = (int(sprite.position.x // size) % cols, int(sprite.position.y // size) % rows)
+            bucket = self.cells.get(key)
+            if bucket is None:
+                self.cells[key] = [(index, sprite)]
+            else:
+                bucket.append((index, sprite))
+            if sprite.radius > self.max_radius:
+                self.max_radius = sprite.radius
+
+    def candidates(self, sprite):
+        """Yield (index, other) for every bucketed sprite near sprite"""
+        if not self.cells:
+            return
+        size = self.cell_size
+        reach = sprite.radius + self.max_radius
+        x0 = int((sprite.position.x - reach) // size)
+        x1 = int((sprite.position.x + reach) // size)
+        y0 = int((sprite.position.y - reach) // size)
+        y1 = int((sprite.position.y + reach) // size)
+        # A small grid can wrap onto itself, so visit each cell only once
+        xs = {x % self.cols for x in range(x0, x1 + 1)}
+        ys = {y % self.rows for y in range(y0, y1 + 1)}
+        for x in xs:
+            for y in ys:
+                bucket = self.cells.get((x, y))
+                if bucket:
+                    yield from bucket
+
+    def first_hit(self, sprite):
+        """Return the earliest-inserted live sprite colliding with sprite"""
+        best_index = None
+        best = None
+        for index, other in self.candidates(sprite):
+            if best_index is not None and index > best_index:
+                continue
+            if other.alive() and sprite.collides_with(other):
+                best_index = index
+                best = other
+        return best
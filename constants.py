@@ -2,6 +2,26 @@ SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 LINE_WIDTH = 2
 
+# Main loop: fixed simulation rate, independent render rate
+TICK_RATE = 60  # Simulation ticks per second
+MAX_CATCHUP_TICKS = 5  # Ticks run per frame at most; further backlog is dropped
+RENDER_FPS_LIMIT = 120  # 0 = uncapped
+PROFILER_WINDOW = 240  # Frames the profiler's percentiles cover (see profiler.py)
+PROFILER_OVERLAY_REFRESH = 15  # Frames between overlay text updates
+REPLAY_DIR = "replays"  # Every session is recorded here (see replay.py)
+SOUND_CACHE_DIR = "assets/sounds"  # Synthesized sound effects, keyed by content hash (see audio.py)
+AUDIO_PENDING_LIMIT = 16  # Plays queued while sounds load in the background; more are dropped
+AUDIO_PENDING_MAX_AGE = 0.2  # Seconds a queued play may wait before it is dropped
+AUDIO_CHANNELS = 8  # Mixer voices at most; see audio.VoiceManager
+AUDIO_RESERVED_SOUNDS = ("thrust", "player_death")  # Sounds with a channel of their own
+
+# Flight recorder (see flightrecorder.py)
+FLIGHT_RECORDER_SECONDS = 10  # Seconds of play kept in memory
+FLIGHT_RECORDER_DIR = "flight"
+FLIGHT_RECORDER_KEEP = 20  # Newest dumps kept in FLIGHT_RECORDER_DIR; older ones are deleted (0 = keep all)
+FLIGHT_RECORDER_ENTITY_EVERY = 4  # Ticks between entity snapshots (1 = every tick)
+FLIGHT_RECORDER_MAX_ENTITIES = 128  # Entities kept per snapshot
+
 PLAYER_RADIUS = 20
 PLAYER_TURN_SPEED = 300
 PLAYER_SPEED = 200
@@ -12,6 +32,9 @@ ASTEROID_MIN_RADIUS = 20
 ASTEROID_KINDS = 3
 ASTEROID_SPAWN_RATE_SECONDS = 0.8
 ASTEROID_MAX_RADIUS = ASTEROID_MIN_RADIUS * ASTEROID_KINDS
+ASTEROID_SHAPE_VARIANTS = 8  # Shared outline templates per radius class
+ASTEROID_ATLAS_ANGLES = 64  # Pre-rendered rotation steps per asteroid shape
+ASTEROID_ATLAS_BUDGET_BYTES = 64 * 1024 * 1024
 
 # Asteroid scores based on size
 ASTEROID_SCORE_LARGE = 20    # radius = 60
@@ -57,6 +80,24 @@ PARTICLE_LIFETIME = 0.5
 PARTICLE_COUNT_EXPLOSION = 12
 PARTICLE_COUNT_THRUST = 3
 PARTICLE_SPEED = 150
+PARTICLE_DIRTY_CELL = 64  # Grid size used to report particle dirty rects
+PARTICLE_CAPACITY = 4096  # Hard cap; oldest particles are overwritten beyond this
+
+# Starfield parallax drift per layer, far to near (pixels per second)
+STARFIELD_LAYER_SPEEDS = (4, 10, 22)
+
+# Object pools (instances created up front when pre-warming)
+POOL_PREWARM_SHOTS = 64
+POOL_PREWARM_ASTEROIDS = 64
+POOL_PREWARM_PARTICLES = 256
+
+# HUD rendered-text cache entries (LRU)
+HUD_TEXT_CACHE_SIZE = 128
+
+# Dirty-rect rendering
+DIRTY_RECT_MAX_FRACTION = 0.4  # Redraw everything once this much of the screen is dirty
+DIRTY_RECT_REFRESH_FRAMES = 30  # Forced full redraw interval, keeps the starfield twinkling
+HUD_BAND_HEIGHT = 90  # Top strip holding score, wave and lives
 
 # Colors
 COLOR_WHITE = "white"
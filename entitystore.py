@@ -0,0 +1,200 @@
+import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class ComponentArrays:
+    """Contiguous state for every live instance of one CircleShape subclass"""
+
+    def __init__(self, wraps, capacity=256):
+        self.wraps = wraps
+        self.position = np.zeros((capacity, 2))
+        self.velocity = np.zeros((capacity, 2))
+        self.radius = np.zeros(capacity)
+        self.rotation = np.zeros(capacity)
+        self.rotation_speed = np.zeros(capacity)
+        self.lifetime = np.full(capacity, np.inf)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.handles = [None] * capacity
+        self.free = list(range(capacity - 1, -1, -1))
+        # Every slot in use is below this mark, so steps only touch [:high]
+        self.high = 0
+
+    def __len__(self):
+        return len(self.handles) - len(self.free)
+
+    def allocate(self, handle):
+        """Reserve a zeroed slot for handle and return its index"""
+        if not self.free:
+            self._grow()
+        slot = self.free.pop()
+        self.position[slot] = 0
+        self.velocity[slot] = 0
+        self.radius[slot] = 0
+        self.rotation[slot] = 0
+        self.rotation_speed[slot] = 0
+        self.lifetime[slot] = np.inf
+        self.alive[slot] = True
+        self.handles[slot] = handle
+        if slot >= self.high:
+            self.high = slot + 1
+        return slot
+
+    def release(self, slot):
+        self.alive[slot] = False
+        self.handles[slot] = None
+        self.free.append(slot)
+        if slot == self.high - 1:
+            while self.high > 0 and not self.alive[self.high - 1]:
+                self.high -= 1
+
+    def _grow(self):
+        old = len(self.handles)
+        new = old * 2
+        for name in ("position", "velocity"):
+            array = np.zeros((new, 2))
+            array[:old] = getattr(self, name)
+            setattr(self, name, array)
+        for name in ("radius", "rotation", "rotation_speed"):
+            array = np.zeros(new)
+            array[:old] = getattr(self, name)
+            setattr(self, name, array)
+        lifetime = np.full(new, np.inf)
+        lifetime[:old] = self.lifetime
+        self.lifetime = lifetime
+        alive = np.zeros(new, dtype=bool)
+        alive[:old] = self.alive
+        self.alive = alive
+        self.handles.extend([None] * (new - old))
+        # Keep popping the lowest free slot first
+        self.free = list(range(new - 1, old - 1, -1)) + self.free
+
+    def step(self, dt):
+        """Integrate, wrap and expire every instance in a few array ops"""
+        n = self.high
+        if n == 0:
+            return
+        position = self.position[:n]
+        radius = self.radius[:n]
+        position += self.velocity[:n] * dt
+        self.rotation[:n] += self.rotation_speed[:n] * dt
+        self.lifetime[:n] -= dt
+
+        if self.wraps:
+            x = position[:, 0]
+            y = position[:, 1]
+            x[:] = np.where(x < -radius, SCREEN_WIDTH + radius,
+                            np.where(x > SCREEN_WIDTH + radius, -radius, x))
+            y[:] = np.where(y < -radius, SCREEN_HEIGHT + radius,
+                            np.where(y > SCREEN_HEIGHT + radius, -radius, y))
+
+        expired = np.flatnonzero(self.alive[:n] & (self.lifetime[:n] <= 0))
+        for slot in expired:
+            self.handles[slot].kill()
+
+
+def _vector_field(name):
+    def get(self):
+        if self._slot is None:
+            return self._detached[name].copy()
+        x, y = getattr(self._arrays, name)[self._slot]
+        return pygame.Vector2(x, y)
+
+    def set(self, value):
+        if self._slot is None:
+            self._detached[name] = pygame.Vector2(value)
+        else:
+            getattr(self._arrays, name)[self._slot] = value
+
+    return property(get, set)
+
+
+def _scalar_field(name):
+    def get(self):
+        if self._slot is None:
+            return self._detached[name]
+        return float(getattr(self._arrays, name)[self._slot])
+
+    def set(self, value):
+        if self._slot is None:
+            self._detached[name] = value
+        else:
+            getattr(self._arrays, name)[self._slot] = value
+
+    return property(get, set)
+
+
+class StoreHandle:
+    """Mixin that redirects a CircleShape's motion state into an EntityStore.
+
+    Handles keep the usual sprite API, so Game can read and assign
+    .position, call .kill() and add them to groups as before. Motion is done
+    by EntityStore.step; update() only runs the subclass's update_behavior.
+
+    .position and .velocity read as copies of the stored values, so they
+    are changed by assignment (handle.position = v), never in place.
+    """
+
+    _VECTORS = ("position", "velocity")
+    _SCALARS = ("radius", "rotation", "rotation_speed", "lifetime")
+
+    position = _vector_field("position")
+    velocity = _vector_field("velocity")
+    radius = _scalar_field("radius")
+    rotation = _scalar_field("rotation")
+    rotation_speed = _scalar_field("rotation_speed")
+    lifetime = _scalar_field("lifetime")
+
+    def __init__(self, *args, **kwargs):
+        self._slot = self._arrays.allocate(self)
+        super().__init__(*args, **kwargs)
+
+    def update(self, dt):
+        self.update_behavior(dt)
+
+    def kill(self):
+        # Keep a detached copy so code that reads state after kill()
+        # (Asteroid.split, collision handlers) still sees the final values
+        if self._slot is not None:
+            self._detached = {name: getattr(self, name) for name in self._VECTORS + self._SCALARS}
+            self._arrays.release(self._slot)
+            self._slot = None
+        super().kill()
+
+
+class EntityStore:
+    """Struct-of-arrays storage for the given CircleShape subclasses.
+
+    Assign an instance to CircleShape.store to make new instances of those
+    classes store-backed handles, and call step(dt) once per frame before
+    updating the sprite groups.
+    """
+
+    def __init__(self, types):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("EntityStore requires numpy")
+        self.arrays = {cls: ComponentArrays(cls.wraps_around) for cls in types}
+        self._handle_classes = {}
+
+    def handles(self, cls):
+        return cls in self.arrays
+
+    def handle_class(self, cls):
+        """Return the store-backed subclass used in place of cls"""
+        handle_cls = self._handle_classes.get(cls)
+        if handle_cls is None:
+            handle_cls = type(cls.__name__, (StoreHandle, cls), {"_arrays": self.arrays[cls]})
+            self._handle_classes[cls] = handle_cls
+        return handle_cls
+
+    def count(self):
+        return sum(len(arrays) for arrays in self.arrays.values())
+
+    def step(self, dt):
+        for arrays in self.arrays.values():
+            arrays.step(dt)
@@ -0,0 +1,269 @@
+"""Always-on flight recorder: the last few seconds of play, kept in memory.
+
+Every tick a fixed-width FRAME row (state, inputs, score, lives, player
+pose, entity counts) goes into a preallocated ring, and every
+`entity_every` ticks so does a snapshot of every entity, up to
+`max_entities`. Events logged while a session runs (from start_game to
+its end) are kept in a ring of their own. Nothing touches the disk until
+dump(), which Game calls on a player death, on game over, on an
+unhandled exception in run() and on the F9 hotkey.
+
+Dumps are .npz files holding the rings in chronological order; the copy
+is taken on the game thread and written on a background thread, except
+for crashes, which are written before the exception propagates. Only the
+newest `keep` dumps in the directory are kept.
+
+Inspect a dump with:  python flightrecorder.py flight/FILE.npz
+"""
+import json
+import os
+import sys
+import threading
+from collections import deque
+from datetime import datetime
+
+import numpy as np
+from numpy.lib import recfunctions
+
+from asteroid import Asteroid
+from constants import *
+from powerup import PowerUp
+from shot import Shot
+from ufo import UFO
+import logger
+
+FRAME = np.dtype([
+    ("tick", "<u4"),
+    ("state", "u1"),
+    ("inputs", "u1"),
+    ("lives", "<i2"),
+    ("wave", "<u2"),
+    ("score", "<i4"),
+    ("x", "<f4"),
+    ("y", "<f4"),
+    ("rotation", "<f4"),
+    ("asteroids", "<u2"),
+    ("shots", "<u2"),
+    ("ufos", "<u2"),
+    ("powerups", "<u2"),
+])
+ENTITY = np.dtype([
+    ("type", "u1"),
+    ("x", "<f4"),
+    ("y", "<f4"),
+    ("vx", "<f4"),
+    ("vy", "<f4"),
+    ("radius", "<f4"),
+    ("rotation", "<f4"),
+])
+
+STATES = (STATE_MENU, STATE_PLAYING, STATE_PAUSED, STATE_GAME_OVER, STATE_WAVE_PAUSE)
+_STATE_CODES = {state: code for code, state in enumerate(STATES)}
+# Snapshotted groups; an entity's type code is its index here
+_GROUPS = (("asteroids", Asteroid), ("shots", Shot), ("ufos", UFO), ("powerups", PowerUp))
+TYPES = tuple(cls.__name__ for _, cls in _GROUPS)
+
+
+class FlightRecorder:
+    def __init__(self, seconds=None, tick_rate=None, directory=None, entity_every=None, max_entities=None,
+                 keep=None):
+        if seconds is None:
+            seconds = FLIGHT_RECORDER_SECONDS
+        if tick_rate is None:
+            tick_rate = TICK_RATE
+        if entity_every is None:
+            entity_every = FLIGHT_RECORDER_ENTITY_EVERY
+        self.directory = FLIGHT_RECORDER_DIR if directory is None else directory
+        self.entity_every = entity_every
+        self.max_entities = FLIGHT_RECORDER_MAX_ENTITIES if max_entities is None else max_entities
+        self.keep = FLIGHT_RECORDER_KEEP if keep is None else keep
+        capacity = int(seconds * tick_rate)
+        self.frames = np.zeros(capacity, dtype=FRAME)
+        self.recorded = 0
+        snapshots = capacity // entity_every + 1
+        # One snapshot per slot, in ENTITY field order: a flat list of values read
+        # from the sprites, or an (n, 7) array copied from the EntityStore.
+        # dump() packs them into ENTITY rows, so snapshots skip the conversion.
+        self.entity_rows = [None] * snapshots
+        self.entity_ticks = np.zeros(snapshots, dtype=np.uint32)
+        self.snapshots = 0
+        self.events = deque(maxlen=capacity)
+        self.tick = 0
+        self.pending = None
+        self.dumps = []
+        self.listening = False
+
+    def open(self):
+        """Start keeping logged events; Game calls this when a session starts"""
+        if not self.listening:
+            logger.add_listener(self.on_event)
+            self.listening = True
+
+    def close(self):
+        """Stop keeping logged events; the rings stay available to dump()"""
+        if self.listening:
+            logger.remove_listener(self.on_event)
+            self.listening = False
+
+    def on_event(self, event_type, details):
+        self.events.append((self.tick, event_type, details))
+
+    def record(self, game, inputs):
+        """Add one tick of game state; called at the end of Game.step"""
+        self.tick = game.tick
+        player = game.player
+        if player is not None:
+            position = player.position
+            x, y, rotation = position.x, position.y, player.rotation
+        else:
+            x = y = rotation = 0.0
+        self.frames[self.recorded % len(self.frames)] = (
+            game.tick, _STATE_CODES[game.state], inputs, game.lives, game.wave, game.score,
+            x, y, rotation, len(game.asteroids), len(game.shots), len(game.ufos), len(game.powerups),
+        )
+        self.recorded += 1
+
+        if self.recorded % self.entity_every == 0:
+            self._snapshot_entities(game)
+        if self.pending is not None:
+            reason, self.pending = self.pending, None
+            self.dump(reason)
+
+    def _snapshot_entities(self, game):
+        slot = self.snapshots % len(self.entity_rows)
+        if game.store is not None:
+            self.entity_rows[slot] = self._copy_store(game.store)
+        else:
+            self.entity_rows[slot] = self._copy_sprites(game)
+        self.entity_ticks[slot] = game.tick
+        self.snapshots += 1
+
+    def _copy_store(self, store):
+        """Up to max_entities rows, straight from the EntityStore arrays"""
+        blocks = []
+        room = self.max_entities
+        for code, (_, cls) in enumerate(_GROUPS):
+            arrays = store.arrays[cls]
+            live = np.flatnonzero(arrays.alive[:arrays.high])[:room]
+            if len(live):
+                blocks.append(np.column_stack((
+                    np.full(len(live), code), arrays.position[live], arrays.velocity[live],
+                    arrays.radius[live], arrays.rotation[live],
+                )))
+                room -= len(live)
+        return np.concatenate(blocks) if blocks else []
+
+    def _copy_sprites(self, game):
+        """Values of up to max_entities sprites, as one flat list"""
+        values = []
+        limit = self.max_entities * len(ENTITY.names)
+        for code, (name, cls) in enumerate(_GROUPS):
+            # Only asteroids spin; the rest record rotation 0
+            rotates = cls is Asteroid
+            for sprite in getattr(game, name):
+                if len(values) == limit:
+                    break
+                position = sprite.position
+                velocity = sprite.velocity
+                values += (code, position.x, position.y, velocity.x, velocity.y,
+                           sprite.radius, sprite.rotation if rotates else 0.0)
+        return values
+
+    def request_dump(self, reason):
+        """Dump once the current tick has been recorded"""
+        self.pending = reason
+
+    def _ordered(self, ring, count):
+        """Ring contents oldest first"""
+        if count <= len(ring):
+            return ring[:count].copy()
+        start = count % len(ring)
+        return np.concatenate((ring[start:], ring[:start]))
+
+    def _packed_entities(self):
+        """(snapshots, max_entities) ENTITY rows oldest first, and the row count of each"""
+        ring = self.entity_rows
+        if self.snapshots <= len(ring):
+            slots = ring[:self.snapshots]
+        else:
+            start = self.snapshots % len(ring)
+            slots = ring[start:] + ring[:start]
+        entities = np.zeros((len(slots), self.max_entities), dtype=ENTITY)
+        counts = np.zeros(len(slots), dtype=np.uint16)
+        for i, rows in enumerate(slots):
+            rows = np.asarray(rows, dtype=np.float32).reshape(-1, len(ENTITY.names))
+            entities[i, :len(rows)] = recfunctions.unstructured_to_structured(rows, ENTITY)
+            counts[i] = len(rows)
+        return entities, counts
+
+    def dump(self, reason, sync=False, **extra):
+        """Write the rings to <directory>/flight-<time>-<reason>.npz; returns the path"""
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        path = os.path.join(self.directory, f"flight-{stamp}-{reason}.npz")
+        entities, entity_counts = self._packed_entities()
+        meta = {"reason": reason, "tick": self.tick, "states": STATES, "types": TYPES, **extra}
+        arrays = {
+            "frames": self._ordered(self.frames, self.recorded),
+            "entities": entities,
+            "entity_ticks": self._ordered(self.entity_ticks, self.snapshots),
+            "entity_counts": entity_counts,
+            "events": np.array([json.dumps([tick, kind, details], default=str) for tick, kind, details in self.events]),
+            "meta": np.array(json.dumps(meta, default=str)),
+        }
+        if sync:
+            _write_dump(path, arrays, self.keep)
+        else:
+            threading.Thread(target=_write_dump, args=(path, arrays, self.keep), name="flight-dump").start()
+        self.dumps.append(path)
+        return path
+
+
+def _write_dump(path, arrays, keep=0):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    np.savez_compressed(path, **arrays)
+    if keep:
+        _prune(directory or ".", keep)
+
+
+def _prune(directory, keep):
+    """Delete all but the newest `keep` dumps; names sort by time"""
+    dumps = sorted(name for name in os.listdir(directory) if name.startswith("flight-") and name.endswith(".npz"))
+    for name in dumps[:-keep]:
+        try:
+            os.remove(os.path.join(directory, name))
+        except FileNotFoundError:
+            # Another dump thread got there first
+            pass
+
+
+def load_dump(path):
+    """Dump contents as a dict; "meta" and "events" are decoded from JSON"""
+    with np.load(path) as data:
+        dump = {name: data[name] for name in data.files}
+    dump["meta"] = json.loads(str(dump["meta"]))
+    dump["events"] = [json.loads(str(event)) for event in dump["events"]]
+    return dump
+
+
+def main(paths):
+    for path in paths:
+        dump = load_dump(path)
+        meta = dump["meta"]
+        frames = dump["frames"]
+        print(f"{path}: {meta['reason']} at tick {meta['tick']}")
+        if len(frames):
+            first, last = frames[0], frames[-1]
+            print(f"  {len(frames)} ticks ({first['tick']}-{last['tick']}), "
+                  f"{len(dump['entity_ticks'])} entity snapshots, {len(dump['events'])} events")
+            print(f"  final: score {last['score']}, lives {last['lives']}, wave {last['wave']}, "
+                  f"{last['asteroids']} asteroids, state {meta['states'][last['state']]}")
+        for tick, kind, details in dump["events"][-10:]:
+            print(f"  tick {tick}: {kind} {details or ''}")
+        if "traceback" in meta:
+            print(meta["traceback"])
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,31 +1,138 @@
 import pygame
 import json
 import os
-import random
+import rng
+import startup
+import tuning
+import time
+import traceback
+from collections import deque
 from constants import *
 from player import Player
-from asteroid import Asteroid
+from asteroid import Asteroid, AsteroidShapes
 from shot import Shot
 from hud import HUD
-from particle import Particle, ParticleSystem
+from particle import Particle, ParticleSystem, NullParticleSystem
 from ufo import UFO, UFOSpawner
 from powerup import PowerUp, maybe_spawn_powerup
 from starfield import Starfield
+from collision import SpatialHash
+from circleshape import CircleShape
+from entitystore import EntityStore
+from pool import SpritePool
+from spritecache import RotationAtlasCache
+from renderer import DirtyRectRenderer
+from replay import ReplayRecorder, session_path
+from rng import RandomStreams
 from logger import log_state, log_event
+from inputs import read_keyboard, THRUST, REVERSE
+from profiler import FrameProfiler
 
 # Try to import audio, but make it optional (in case numpy isn't available)
 try:
-    from audio import AudioManager
+    from audio import AudioManager, AsyncAudio
     AUDIO_AVAILABLE = True
 except ImportError:
     AUDIO_AVAILABLE = False
 
+# The flight recorder needs numpy too
+try:
+    from flightrecorder import FlightRecorder
+    FLIGHT_RECORDER_AVAILABLE = True
+except ImportError:
+    FLIGHT_RECORDER_AVAILABLE = False
+
+
+class LoopStats:
+    """Rolling frame and tick timings for the fixed-timestep loop"""
+
+    def __init__(self, window=120):
+        self.frame_times = deque(maxlen=window)
+        self.tick_times = deque(maxlen=window)
+        self.ticks_per_frame = deque(maxlen=window)
+        self.dropped_time = 0.0
+
+    def summary(self):
+        """Averages in milliseconds over the window, plus total dropped time"""
+        def average(values):
+            return sum(values) / len(values) * 1000 if values else 0.0
+
+        frames = self.ticks_per_frame
+        return {
+            "frame_ms": average(self.frame_times),
+            "tick_ms": average(self.tick_times),
+            "ticks_per_frame": sum(frames) / len(frames) if frames else 0.0,
+            "fps": 1000 / average(self.frame_times) if self.frame_times else 0.0,
+            "dropped_s": self.dropped_time,
+        }
+
 
 class Game:
-    def __init__(self, screen):
+    """Game state, rules and main loop.
+
+    A headless game (screen=None, headless=True) has no window, HUD, audio,
+    starfield or particles and is driven entirely through step(dt, inputs),
+    so it can be simulated as fast as the CPU allows.
+    """
+
+    # The game whose groups and pools the sprite classes currently point at
+    _active = None
+
+    def __init__(self, screen=None, entity_store=False, object_pools=False, prewarm_pools=False,
+                 asteroid_atlas=False, starfield_layers=1, dirty_rects=False, headless=False,
+                 tick_rate=None, fps_limit=None, interpolate=True,
+                 record_replays=None, profile=None, flight_recorder=None, async_audio=True,
+                 frame_profiler=False):
+        # Constant overrides for this game (see tuning.py); None = constants.py as is
+        self.profile = profile
+        tuning.activate(profile)
+        # Read after the profile is active, so it can override them
+        if tick_rate is None:
+            tick_rate = TICK_RATE
+        if fps_limit is None:
+            fps_limit = RENDER_FPS_LIMIT
         self.screen = screen
+        self.headless = headless
         self.clock = pygame.time.Clock()
-        self.hud = HUD()
+
+        # This game's random streams; start_game() reseeds them per session
+        self.rng = RandomStreams()
+        rng.activate(self.rng)
+        # Simulation ticks since the session started
+        self.tick = 0
+        # Directory to write a replay of every session to (None = off)
+        self.record_replays = record_replays
+        self.recorder = None
+
+        # Last few seconds of play, dumped on deaths and crashes (on by default unless headless)
+        if flight_recorder is None:
+            flight_recorder = not headless
+        if flight_recorder and FLIGHT_RECORDER_AVAILABLE:
+            self.flight_recorder = FlightRecorder(tick_rate=tick_rate)
+        else:
+            self.flight_recorder = None
+
+        # Fixed-timestep loop settings (see run)
+        self.tick_rate = tick_rate
+        self.tick_dt = 1 / tick_rate
+        self.fps_limit = fps_limit
+        self.interpolate = interpolate
+        # Fraction of a tick the last rendered frame sits past the simulation
+        self.render_alpha = 1.0
+        self.loop_stats = LoopStats()
+        # Per-phase timings (profiler.stats()); F3 shows them on screen
+        self.profiler = FrameProfiler(enabled=frame_profiler)
+        if headless:
+            self.world = None
+            self.dirty_renderer = None
+            self.hud = None
+        else:
+            # Offscreen layer the world is drawn into, then blitted at the shake offset
+            self.world = pygame.Surface(screen.get_size(), 0, screen)
+            # Optional partial-redraw path for low-power machines
+            self.dirty_renderer = DirtyRectRenderer() if dirty_rects else None
+            with startup.phase("fonts"):
+                self.hud = HUD()
 
         # Sprite groups
         self.updatable = pygame.sprite.Group()
@@ -36,22 +143,38 @@ class Game:
         self.ufos = pygame.sprite.Group()
         self.powerups = pygame.sprite.Group()
 
-        # Set up containers for auto-adding to groups
-        Asteroid.containers = (self.asteroids, self.updatable, self.drawable)
-        Shot.containers = (self.shots, self.updatable, self.drawable)
-        Player.containers = (self.updatable, self.drawable)
-        UFO.containers = (self.ufos, self.updatable, self.drawable)
-        PowerUp.containers = (self.powerups, self.updatable, self.drawable)
+        # Optionally keep entity motion state in NumPy arrays
+        self.store = EntityStore((Asteroid, Shot, UFO, PowerUp)) if entity_store else None
+
+        # Recycle dead shots, asteroids and particles instead of reallocating
+        self.pool = SpritePool() if object_pools else None
+        self.prewarm_pools = prewarm_pools and object_pools
+
+        # Outline templates shared by every asteroid of a size class
+        self.asteroid_shapes = AsteroidShapes()
+
+        # Optionally draw asteroids from pre-rendered rotation atlases (None = exact polygons).
+        # Off by default: it saves about 1 ms a frame at 200 asteroids but holds tens of MB
+        self.sprite_cache = RotationAtlasCache() if asteroid_atlas and not headless else None
+
+        # Point the sprite classes at this game's groups, pools and caches
+        self.activate()
 
         # Initialize particle system
-        self.particle_system = ParticleSystem(self.particles, self.updatable, self.drawable)
-
-        # Initialize audio
-        if AUDIO_AVAILABLE:
-            try:
-                self.audio = AudioManager()
-            except Exception:
-                self.audio = None
+        if headless:
+            self.particle_system = NullParticleSystem()
+        else:
+            self.particle_system = ParticleSystem(self.particles, self.updatable, self.drawable)
+
+        # Initialize audio; by default on a background thread, so it can't hold up the first frame
+        if headless:
+            self.audio = None
+        elif AUDIO_AVAILABLE:
+            with startup.phase("audio"):
+                try:
+                    self.audio = AsyncAudio() if async_audio else AudioManager()
+                except Exception:
+                    self.audio = None
         else:
             self.audio = None
 
@@ -59,15 +182,23 @@ class Game:
         self.ufo_spawner = UFOSpawner()
 
         # Starfield background
-        self.starfield = Starfield(num_stars=100)
+        if headless:
+            self.starfield = None
+        else:
+            with startup.phase("starfield"):
+                self.starfield = Starfield(num_stars=100, layers=starfield_layers)
 
         # Game state
         self.state = STATE_MENU
         self.score = 0
         self.lives = PLAYER_LIVES
         self.wave = 0
+        self.deaths = 0
         self.wave_timer = 0
-        self.high_score = self.load_high_score()
+        self.high_score = 0 if headless else self.load_high_score()
+
+        # Broadphase for shot collisions, rebuilt every frame
+        self.shot_grid = SpatialHash()
 
         # Screen shake
         self.screen_shake = 0
@@ -79,6 +210,9 @@ class Game:
         # Track thrust state for audio
         self.thrusting = False
 
+        # Frames drawn by run()
+        self.frames_drawn = 0
+
     def load_high_score(self):
         """Load high score from file"""
         try:
@@ -98,16 +232,62 @@ class Game:
         except IOError:
             pass
 
-    def start_game(self):
-        """Start a new game"""
+    def activate(self):
+        """Bind the class-level state sprites use (containers, pools, caches, RNG, tuning) to this game.
+
+        Runs before every step, so several games can live in one process.
+        """
+        rng.activate(self.rng)
+        tuning.activate(self.profile)
+        if Game._active is self:
+            return
+        Game._active = self
+
+        # Set up containers for auto-adding to groups
+        Asteroid.containers = (self.asteroids, self.updatable, self.drawable)
+        Shot.containers = (self.shots, self.updatable, self.drawable)
+        Player.containers = (self.updatable, self.drawable)
+        UFO.containers = (self.ufos, self.updatable, self.drawable)
+        PowerUp.containers = (self.powerups, self.updatable, self.drawable)
+
+        CircleShape.store = self.store
+        Shot.pool = self.pool
+        Asteroid.pool = self.pool
+        Particle.pool = self.pool
+        Asteroid.shapes = self.asteroid_shapes
+        Asteroid.sprite_cache = self.sprite_cache
+
+    def start_game(self, seed=None):
+        """Start a new game; the same seed and inputs replay the same session"""
+        # A session abandoned by restarting is still saved
+        self.finish_recording()
+
+        self.activate()
+
         # Clear all sprites
         for sprite in list(self.updatable):
             sprite.kill()
+        self.particle_system.clear()
+
+        if self.pool:
+            self.pool.recycle()
+            if self.prewarm_pools:
+                self.pool.prewarm(Shot, POOL_PREWARM_SHOTS)
+                self.pool.prewarm(Asteroid, POOL_PREWARM_ASTEROIDS)
+                if not self.particle_system.vectorized:
+                    self.pool.prewarm(Particle, POOL_PREWARM_PARTICLES)
+
+        # Reseed before anything in the new session draws a random number
+        self.rng.seed(seed)
+        self.tick = 0
+        if self.flight_recorder:
+            self.flight_recorder.open()
 
         # Reset state
         self.score = 0
         self.lives = PLAYER_LIVES
         self.wave = 0
+        self.deaths = 0
 
         # Reset UFO spawner
         self.ufo_spawner = UFOSpawner()
@@ -120,6 +300,18 @@ class Game:
         # Start first wave
         self.state = STATE_WAVE_PAUSE
         self.wave_timer = WAVE_PAUSE_TIME
+        log_event("game_start", seed=self.rng.seed_value)
+
+        if self.record_replays:
+            self.recorder = ReplayRecorder(self, session_path(self.record_replays, self.rng.seed_value))
+
+    def finish_recording(self):
+        """Write out the current session's replay, if any, and stop the flight recorder listening"""
+        if self.recorder:
+            self.recorder.finish()
+            self.recorder = None
+        if self.flight_recorder:
+            self.flight_recorder.close()
 
     def start_wave(self):
         """Start a new wave of asteroids"""
@@ -141,11 +333,11 @@ class Game:
             (pygame.Vector2(0, -1), lambda x: pygame.Vector2(x * SCREEN_WIDTH, SCREEN_HEIGHT + ASTEROID_MAX_RADIUS)),
         ]
 
-        edge = random.choice(edges)
-        speed = random.randint(40, 100) * speed_multiplier
+        edge = rng.gameplay.choice(edges)
+        speed = rng.gameplay.randint(40, 100) * speed_multiplier
         velocity = edge[0] * speed
-        velocity = velocity.rotate(random.randint(-30, 30))
-        position = edge[1](random.uniform(0, 1))
+        velocity = velocity.rotate(rng.gameplay.randint(-30, 30))
+        position = edge[1](rng.gameplay.uniform(0, 1))
 
         asteroid = Asteroid(position.x, position.y, ASTEROID_MAX_RADIUS)
         asteroid.velocity = velocity
@@ -157,6 +349,12 @@ class Game:
                 return False
 
             if event.type == pygame.KEYDOWN:
+                # Save the last few seconds for a bug report
+                if event.key == pygame.K_F9 and self.flight_recorder:
+                    self.flight_recorder.dump("hotkey")
+                if event.key == pygame.K_F3:
+                    self.profiler.toggle_overlay()
+
                 if self.state == STATE_MENU:
                     if event.key == pygame.K_SPACE:
                         self.start_game()
@@ -178,11 +376,36 @@ class Game:
         return True
 
     def update(self, dt):
-        """Update game state"""
-        log_state()
+        """Update game state from the keyboard"""
+        self.step(dt, read_keyboard())
+
+    def step(self, dt, inputs=0):
+        """Advance the simulation by dt seconds with the given input bitmask"""
+        self.activate()
+        if self.state in (STATE_PLAYING, STATE_WAVE_PAUSE):
+            # Only ticks that advance the session are counted and recorded
+            self.tick += 1
+            if self.recorder:
+                self.recorder.record(inputs)
+
+        log_state(
+            {
+                "player": self.player,
+                "asteroids": self.asteroids,
+                "shots": self.shots,
+                "ufos": self.ufos,
+                "powerups": self.powerups,
+            },
+            self.screen.get_size() if self.screen else (),
+        )
+
+        # Sprites killed last frame become available for reuse
+        if self.pool:
+            self.pool.recycle()
 
         # Always update starfield for twinkling effect
-        self.starfield.update(dt)
+        if self.starfield:
+            self.starfield.update(dt)
 
         if self.state == STATE_MENU:
             pass  # Nothing to update in menu
@@ -191,13 +414,13 @@ class Game:
             self.wave_timer -= dt
             # Update particles during wave pause
             self.particles.update(dt)
+            self.particle_system.update(dt)
             if self.wave_timer <= 0:
                 self.start_wave()
 
         elif self.state == STATE_PLAYING:
             # Check thrust state for audio
-            keys = pygame.key.get_pressed()
-            is_thrusting = keys[pygame.K_w] or keys[pygame.K_s]
+            is_thrusting = bool(inputs & (THRUST | REVERSE))
             if is_thrusting and not self.thrusting:
                 if self.audio:
                     self.audio.start_thrust()
@@ -215,21 +438,37 @@ class Game:
                 self.particle_system.thrust(rear.x, rear.y, direction)
 
             # Update all sprites
+            if self.player:
+                self.player.inputs = inputs
+            profiler = self.profiler if self.profiler.enabled else None
+            if profiler:
+                start = time.perf_counter_ns()
+            if self.store is not None:
+                self.store.step(dt)
             self.updatable.update(dt)
+            self.particle_system.update(dt)
+            if profiler:
+                sprites_done = time.perf_counter_ns()
+                profiler.add("update.sprites", sprites_done - start)
 
             # Update UFO spawner
             self.ufo_spawner.update(dt, self.wave, self.ufos, self.player)
+            if profiler:
+                spawner_done = time.perf_counter_ns()
+                profiler.add("update.ufo_spawner", spawner_done - sprites_done)
 
             # Check for collisions
             self.check_collisions()
+            if profiler:
+                profiler.add("update.collisions", time.perf_counter_ns() - spawner_done)
 
             # Update screen shake
             if self.screen_shake > 0:
                 self.screen_shake -= dt
                 intensity = min(self.screen_shake * 20, 10)
                 self.shake_offset = pygame.Vector2(
-                    random.uniform(-intensity, intensity),
-                    random.uniform(-intensity, intensity)
+                    rng.cosmetic.uniform(-intensity, intensity),
+                    rng.cosmetic.uniform(-intensity, intensity)
                 )
             else:
                 self.shake_offset = pygame.Vector2(0, 0)
@@ -245,6 +484,10 @@ class Game:
         elif self.state == STATE_GAME_OVER:
             # Update particles during game over
             self.particles.update(dt)
+            self.particle_system.update(dt)
+
+        if self.flight_recorder:
+            self.flight_recorder.record(self, inputs)
 
     def check_collisions(self):
         """Check for collisions between game objects"""
@@ -277,64 +520,65 @@ class Game:
                         self.audio.play("powerup")
                 powerup.kill()
 
+        # Bucket shots once; both shot passes query the same grid
+        self.shot_grid.rebuild(self.shots)
+
         # Shot-asteroid collision
         for asteroid in list(self.asteroids):
-            for shot in list(self.shots):
-                if asteroid.collides_with(shot):
-                    log_event("asteroid_shot")
-                    self.score += asteroid.get_score()
-
-                    # Create explosion particles
-                    self.particle_system.asteroid_explosion(
-                        asteroid.position.x,
-                        asteroid.position.y,
-                        asteroid.radius
-                    )
-
-                    # Play explosion sound
-                    if self.audio:
-                        self.audio.play_explosion(asteroid.radius)
+            shot = self.shot_grid.first_hit(asteroid)
+            if shot is not None:
+                log_event("asteroid_shot", size=asteroid.get_size())
+                self.score += asteroid.get_score()
+
+                # Create explosion particles
+                self.particle_system.asteroid_explosion(
+                    asteroid.position.x,
+                    asteroid.position.y,
+                    asteroid.radius
+                )
 
-                    # Add screen shake based on asteroid size
-                    self.screen_shake = max(self.screen_shake, asteroid.radius / 60)
+                # Play explosion sound
+                if self.audio:
+                    self.audio.play_explosion(asteroid.radius)
 
-                    # Maybe spawn power-up from large asteroids
-                    if asteroid.radius >= ASTEROID_MAX_RADIUS:
-                        maybe_spawn_powerup(asteroid.position.x, asteroid.position.y, self.powerups)
+                # Add screen shake based on asteroid size
+                self.screen_shake = max(self.screen_shake, asteroid.radius / 60)
 
-                    asteroid.split()
-                    shot.kill()
-                    break
+                # Maybe spawn power-up from large asteroids
+                if asteroid.radius >= ASTEROID_MAX_RADIUS:
+                    maybe_spawn_powerup(asteroid.position.x, asteroid.position.y, self.powerups)
+
+                asteroid.split()
+                shot.kill()
 
         # Shot-UFO collision
         for ufo in list(self.ufos):
-            for shot in list(self.shots):
-                if ufo.collides_with(shot):
-                    log_event("ufo_shot")
-                    self.score += ufo.get_score()
-
-                    # Create explosion particles
-                    self.particle_system.explosion(
-                        ufo.position.x,
-                        ufo.position.y,
-                        COLOR_WHITE,
-                        count=15,
-                        speed=PARTICLE_SPEED * 1.2
-                    )
-
-                    # Play large explosion sound
-                    if self.audio:
-                        self.audio.play("explosion_large")
+            shot = self.shot_grid.first_hit(ufo)
+            if shot is not None:
+                log_event("ufo_shot")
+                self.score += ufo.get_score()
+
+                # Create explosion particles
+                self.particle_system.explosion(
+                    ufo.position.x,
+                    ufo.position.y,
+                    COLOR_WHITE,
+                    count=15,
+                    speed=PARTICLE_SPEED * 1.2
+                )
+
+                # Play large explosion sound
+                if self.audio:
+                    self.audio.play("explosion_large")
 
-                    # Screen shake
-                    self.screen_shake = 0.4
+                # Screen shake
+                self.screen_shake = 0.4
 
-                    # Maybe spawn power-up
-                    maybe_spawn_powerup(ufo.position.x, ufo.position.y, self.powerups)
+                # Maybe spawn power-up
+                maybe_spawn_powerup(ufo.position.x, ufo.position.y, self.powerups)
 
-                    ufo.kill()
-                    shot.kill()
-                    break
+                ufo.kill()
+                shot.kill()
 
     def player_death(self):
         """Handle player death"""
@@ -352,6 +596,7 @@ class Game:
 
         self.thrusting = False
         self.lives -= 1
+        self.deaths += 1
 
         if self.lives <= 0:
             # Game over
@@ -359,39 +604,99 @@ class Game:
         else:
             # Respawn player
             self.player.reset(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
+            if self.flight_recorder:
+                self.flight_recorder.request_dump("player_death")
 
     def game_over(self):
         """Handle game over"""
         self.state = STATE_GAME_OVER
+        log_event("game_over", score=self.score, wave=self.wave)
         if self.score > self.high_score:
             self.high_score = self.score
-            self.save_high_score()
+            if not self.headless:
+                self.save_high_score()
+        self.finish_recording()
+        if self.flight_recorder:
+            self.flight_recorder.request_dump("game_over")
+
+    def begin_tick(self):
+        """Snapshot positions so draw() can interpolate into the coming tick"""
+        for group in (self.asteroids, self.shots, self.ufos, self.powerups):
+            for sprite in group:
+                sprite.begin_tick()
+        if self.player:
+            self.player.begin_tick()
+
+    def sync_render_positions(self):
+        """Point every sprite's render_position at its interpolated position"""
+        alpha = self.render_alpha if self.interpolate else 1.0
+        for group in (self.asteroids, self.shots, self.ufos, self.powerups):
+            for sprite in group:
+                sprite.interpolate(alpha)
+        if self.player:
+            self.player.interpolate(alpha)
 
     def draw(self):
         """Draw everything to screen"""
-        self.screen.fill("black")
-
-        # Draw starfield background (always visible)
-        self.starfield.draw(self.screen)
+        self.sync_render_positions()
+
+        # The overlay needs whole frames, so it bypasses partial redraws
+        if self.dirty_renderer is not None and not self.profiler.show_overlay and self.dirty_renderer.draw(self):
+            return
+
+        self.draw_world()
+
+        # Screen shake moves the whole world layer; the HUD stays put
+        offset = self.shake_offset if self.state == STATE_PLAYING else (0, 0)
+        if offset[0] or offset[1]:
+            self.screen.fill("black")
+        self.screen.blit(self.world, offset)
+
+        profiler = self.profiler if self.profiler.enabled else None
+        if profiler:
+            start = time.perf_counter_ns()
+        self.draw_hud()
+        if profiler:
+            hud_done = time.perf_counter_ns()
+            profiler.add("draw.hud", hud_done - start)
+            flip_start = hud_done
+            if profiler.show_overlay:
+                profiler.draw_overlay(self.screen)
+                # Its own phase, so drawing the overlay isn't charged to draw.flip
+                flip_start = time.perf_counter_ns()
+                profiler.add("draw.overlay", flip_start - hud_done)
 
-        # Apply screen shake offset
-        offset = self.shake_offset if self.state == STATE_PLAYING else pygame.Vector2(0, 0)
+        pygame.display.flip()
+        if profiler:
+            profiler.add("draw.flip", time.perf_counter_ns() - flip_start)
+        if self.dirty_renderer is not None:
+            self.dirty_renderer.full_frame_drawn(self)
+
+    def draw_world(self):
+        """Draw the starfield and game objects into the offscreen world layer"""
+        profiler = self.profiler if self.profiler.enabled else None
+        if profiler:
+            start = time.perf_counter_ns()
+
+        # Draw starfield background (always visible; also clears the layer)
+        self.starfield.draw(self.world)
+        if profiler:
+            starfield_done = time.perf_counter_ns()
+            profiler.add("draw.starfield", starfield_done - start)
+
+        if self.state != STATE_MENU:
+            for obj in self.drawable:
+                obj.draw(self.world)
+            self.particle_system.draw(self.world)
+            if profiler:
+                profiler.add("draw.sprites", time.perf_counter_ns() - starfield_done)
 
+    def draw_hud(self):
+        """Draw HUD and overlays for the current state onto the screen"""
         if self.state == STATE_MENU:
             self.hud.draw_main_menu(self.screen, self.high_score)
 
         elif self.state == STATE_WAVE_PAUSE:
-            # Draw game objects
-            for obj in self.drawable:
-                # Temporarily offset position for screen shake
-                if hasattr(obj, 'position'):
-                    original_pos = obj.position.copy()
-                    obj.position += offset
-                    obj.draw(self.screen)
-                    obj.position = original_pos
-                else:
-                    obj.draw(self.screen)
-            # Draw HUD
             self.hud.draw_score(self.screen, self.score)
             self.hud.draw_high_score(self.screen, self.high_score)
             self.hud.draw_lives(self.screen, self.lives)
@@ -399,26 +704,12 @@ class Game:
             self.hud.draw_wave_announcement(self.screen, self.wave + 1)
 
         elif self.state == STATE_PLAYING:
-            # Draw game objects with shake offset
-            for obj in self.drawable:
-                if hasattr(obj, 'position'):
-                    original_pos = obj.position.copy()
-                    obj.position += offset
-                    obj.draw(self.screen)
-                    obj.position = original_pos
-                else:
-                    obj.draw(self.screen)
-            # Draw HUD
             self.hud.draw_score(self.screen, self.score)
             self.hud.draw_high_score(self.screen, self.high_score)
             self.hud.draw_lives(self.screen, self.lives)
             self.hud.draw_wave(self.screen, self.wave)
 
         elif self.state == STATE_PAUSED:
-            # Draw game objects (frozen)
-            for obj in self.drawable:
-                obj.draw(self.screen)
-            # Draw HUD
             self.hud.draw_score(self.screen, self.score)
             self.hud.draw_lives(self.screen, self.lives)
             self.hud.draw_wave(self.screen, self.wave)
@@ -426,23 +717,80 @@ class Game:
             self.hud.draw_paused(self.screen)
 
         elif self.state == STATE_GAME_OVER:
-            # Draw game objects
-            for obj in self.drawable:
-                obj.draw(self.screen)
-            # Draw game over screen
             self.hud.draw_game_over(self.screen, self.score, self.high_score)
 
-        pygame.display.flip()
-
     def run(self):
-        """Main game loop"""
-        dt = 0
-
-        while True:
-            if not self.handle_events():
-                return
+        """Main game loop.
 
-            self.update(dt)
-            self.draw()
+        The simulation advances in fixed ticks of tick_dt, however long a
+        frame takes. Up to MAX_CATCHUP_TICKS ticks run per frame; anything
+        beyond that is dropped rather than fed in as one huge step. Frames
+        are drawn between ticks at render_alpha and capped at fps_limit.
+        While self.profiler is enabled each frame is timed by phase.
+        """
+        accumulator = 0.0
+        previous = time.perf_counter()
 
-            dt = self.clock.tick(60) / 1000
+        try:
+            while True:
+                # Decided once per frame: F3 may switch profiling on or off during it
+                profiler = self.profiler if self.profiler.enabled else None
+                if profiler:
+                    profiler.begin_frame()
+
+                if not self.handle_events():
+                    self.finish_recording()
+                    return
+                if profiler:
+                    profiler.lap("events")
+
+                now = time.perf_counter()
+                frame_time = now - previous
+                previous = now
+                self.loop_stats.frame_times.append(frame_time)
+                accumulator += frame_time
+
+                inputs = read_keyboard()
+                # Identical sounds triggered within this frame play once
+                if self.audio:
+                    self.audio.begin_frame()
+                ticks = 0
+                while accumulator >= self.tick_dt and ticks < MAX_CATCHUP_TICKS:
+                    if self.interpolate:
+                        self.begin_tick()
+                    tick_start = time.perf_counter()
+                    self.step(self.tick_dt, inputs)
+                    self.loop_stats.tick_times.append(time.perf_counter() - tick_start)
+                    accumulator -= self.tick_dt
+                    ticks += 1
+                if accumulator >= self.tick_dt:
+                    self.loop_stats.dropped_time += accumulator - self.tick_dt
+                    accumulator = self.tick_dt
+                self.loop_stats.ticks_per_frame.append(ticks)
+                if profiler:
+                    profiler.lap("update")
+
+                self.render_alpha = accumulator / self.tick_dt
+                if self.frames_drawn:
+                    self.draw()
+                else:
+                    with startup.phase("first_draw"):
+                        self.draw()
+                    startup.first_frame()
+                    # Load the sound effects while the menu is up
+                    if self.audio:
+                        self.audio.warm()
+                self.frames_drawn += 1
+                if profiler:
+                    profiler.lap("draw")
+
+                self.clock.tick(self.fps_limit)
+                if profiler:
+                    profiler.lap("wait")
+                    profiler.end_frame()
+        except Exception:
+            # Keep what led up to the crash, then let it propagate
+            if self.flight_recorder:
+                self.flight_recorder.dump("exception", sync=True, traceback=traceback.format_exc())
+                self.flight_recorder.close()
+            raise
@@ -1,24 +1,77 @@
 import pygame
+from collections import OrderedDict
 from constants import *
 
 
+class TextCache:
+    """LRU cache of rendered text surfaces keyed by (font, text, color)"""
+
+    def __init__(self, max_entries=None):
+        self.max_entries = HUD_TEXT_CACHE_SIZE if max_entries is None else max_entries
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color):
+        key = (font, text, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = font.render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
+
+
 class HUD:
     def __init__(self):
         pygame.font.init()
         self.font_large = pygame.font.Font(None, 72)
         self.font_medium = pygame.font.Font(None, 48)
         self.font_small = pygame.font.Font(None, 36)
+        self.text_cache = TextCache()
+        self.pause_overlay = None
+
+    def cache_stats(self):
+        """Text cache hit/miss counters"""
+        return {
+            "hits": self.text_cache.hits,
+            "misses": self.text_cache.misses,
+            "entries": len(self.text_cache.surfaces),
+        }
+
+    def render(self, font, text, color=None):
+        return self.text_cache.render(font, text, COLOR_WHITE if color is None else color)
+
+    def draw_number(self, screen, font, label, value, color=None, **anchor):
+        """Draw label followed by value, composited from cached digit glyphs.
+
+        The rect is positioned like Surface.get_rect(**anchor), so callers
+        can centre the combined text the same way as a rendered string.
+        """
+        glyphs = [self.render(font, label, color)]
+        glyphs.extend(self.render(font, digit, color) for digit in str(value))
+        width = sum(glyph.get_width() for glyph in glyphs)
+        rect = pygame.Rect(0, 0, width, font.get_height())
+        for name, position in anchor.items():
+            setattr(rect, name, position)
+        x = rect.x
+        for glyph in glyphs:
+            screen.blit(glyph, (x, rect.y))
+            x += glyph.get_width()
+        return rect
 
     def draw_score(self, screen, score):
         """Draw score in top-left corner"""
-        text = self.font_small.render(f"SCORE: {score}", True, COLOR_WHITE)
-        screen.blit(text, (20, 20))
+        self.draw_number(screen, self.font_small, "SCORE: ", score, topleft=(20, 20))
 
     def draw_high_score(self, screen, high_score):
         """Draw high score in top-center"""
-        text = self.font_small.render(f"HIGH: {high_score}", True, COLOR_WHITE)
-        rect = text.get_rect(midtop=(SCREEN_WIDTH // 2, 20))
-        screen.blit(text, rect)
+        self.draw_number(screen, self.font_small, "HIGH: ", high_score, midtop=(SCREEN_WIDTH // 2, 20))
 
     def draw_lives(self, screen, lives):
         """Draw lives as ship icons in top-right"""
@@ -36,54 +89,53 @@ class HUD:
 
     def draw_wave(self, screen, wave):
         """Draw current wave number"""
-        text = self.font_small.render(f"WAVE: {wave}", True, COLOR_WHITE)
-        screen.blit(text, (20, 55))
+        self.draw_number(screen, self.font_small, "WAVE: ", wave, topleft=(20, 55))
 
     def draw_wave_announcement(self, screen, wave):
         """Draw wave start announcement"""
-        text = self.font_large.render(f"WAVE {wave}", True, COLOR_WHITE)
+        text = self.render(self.font_large, f"WAVE {wave}", COLOR_WHITE)
         rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
         screen.blit(text, rect)
 
     def draw_game_over(self, screen, score, high_score):
         """Draw game over screen"""
         # Game over text
-        text = self.font_large.render("GAME OVER", True, COLOR_WHITE)
+        text = self.render(self.font_large, "GAME OVER", COLOR_WHITE)
         rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 60))
         screen.blit(text, rect)
 
         # Final score
-        text = self.font_medium.render(f"FINAL SCORE: {score}", True, COLOR_WHITE)
+        text = self.render(self.font_medium, f"FINAL SCORE: {score}", COLOR_WHITE)
         rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
         screen.blit(text, rect)
 
         # High score
         if score >= high_score:
-            text = self.font_medium.render("NEW HIGH SCORE!", True, COLOR_YELLOW)
+            text = self.render(self.font_medium, "NEW HIGH SCORE!", COLOR_YELLOW)
         else:
-            text = self.font_medium.render(f"HIGH SCORE: {high_score}", True, COLOR_WHITE)
+            text = self.render(self.font_medium, f"HIGH SCORE: {high_score}", COLOR_WHITE)
         rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
         screen.blit(text, rect)
 
         # Restart prompt
-        text = self.font_small.render("PRESS SPACE TO RESTART", True, COLOR_WHITE)
+        text = self.render(self.font_small, "PRESS SPACE TO RESTART", COLOR_WHITE)
         rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 120))
         screen.blit(text, rect)
 
     def draw_main_menu(self, screen, high_score):
         """Draw main menu"""
         # Title
-        text = self.font_large.render("ASTEROIDS", True, COLOR_WHITE)
+        text = self.render(self.font_large, "ASTEROIDS", COLOR_WHITE)
         rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 3))
         screen.blit(text, rect)
 
         # High score
-        text = self.font_medium.render(f"HIGH SCORE: {high_score}", True, COLOR_WHITE)
+        text = self.render(self.font_medium, f"HIGH SCORE: {high_score}", COLOR_WHITE)
         rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
         screen.blit(text, rect)
 
         # Start prompt
-        text = self.font_medium.render("PRESS SPACE TO START", True, COLOR_WHITE)
+        text = self.render(self.font_medium, "PRESS SPACE TO START", COLOR_WHITE)
         rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 80))
         screen.blit(text, rect)
 
@@ -95,25 +147,26 @@ class HUD:
         ]
         y_offset = SCREEN_HEIGHT - 120
         for line in controls:
-            text = self.font_small.render(line, True, COLOR_WHITE)
+            text = self.render(self.font_small, line, COLOR_WHITE)
             rect = text.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
             screen.blit(text, rect)
             y_offset += 30
 
     def draw_paused(self, screen):
         """Draw pause overlay"""
-        # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
-        screen.blit(overlay, (0, 0))
+        # Semi-transparent overlay, built once
+        if self.pause_overlay is None:
+            self.pause_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self.pause_overlay.set_alpha(128)
+            self.pause_overlay.fill((0, 0, 0))
+        screen.blit(self.pause_overlay, (0, 0))
 
         # Paused text
-        text = self.font_large.render("PAUSED", True, COLOR_WHITE)
+        text = self.render(self.font_large, "PAUSED", COLOR_WHITE)
         rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
         screen.blit(text, rect)
 
         # Resume prompt
-        text = self.font_small.render("PRESS ESC/P TO RESUME", True, COLOR_WHITE)
+        text = self.render(self.font_small, "PRESS ESC/P TO RESUME", COLOR_WHITE)
         rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60))
         screen.blit(text, rect)
@@ -0,0 +1,26 @@
+import pygame
+
+# One bit per control; a frame's input is the OR of the held controls
+THRUST = 1
+REVERSE = 2
+ROTATE_LEFT = 4
+ROTATE_RIGHT = 8
+FIRE = 16
+
+_KEY_BITS = (
+    (pygame.K_w, THRUST),
+    (pygame.K_s, REVERSE),
+    (pygame.K_a, ROTATE_LEFT),
+    (pygame.K_d, ROTATE_RIGHT),
+    (pygame.K_SPACE, FIRE),
+)
+
+
+def read_keyboard():
+    """Return the currently held keys as an input bitmask"""
+    keys = pygame.key.get_pressed()
+    bits = 0
+    for key, bit in _KEY_BITS:
+        if keys[key]:
+            bits |= bit
+    return bits
@@ -1,122 +1,344 @@
-import inspect
+import atexit
+import itertools
 import json
 import math
+import os
+import threading
+from collections import deque
 from datetime import datetime
 
-__all__ = ["log_state", "log_event"]
+__all__ = [
+    "log_state", "log_event", "configure", "set_enabled", "is_enabled", "add_listener", "remove_listener",
+    "flush", "shutdown", "writer_stats", "append_raw",
+]
 
 _FPS = 60
-_MAX_SECONDS = 16
+_SAMPLE_EVERY = 60  # Frames between state snapshots
+_MAX_SECONDS = 16  # Stop logging state after this many seconds (math.inf = never)
 _SPRITE_SAMPLE_LIMIT = 10  # Maximum number of sprites to log per group
 
+# Background writer (see _Writer)
+_QUEUE_SIZE = 10_000  # Records waiting to be written; see _OVERFLOW
+_OVERFLOW = "drop"  # Full queue: "drop" the record or "block" the game until there is room
+_FLUSH_BYTES = 64 * 1024  # Write out once this much is buffered...
+_FLUSH_SECONDS = 0.5  # ...or this long after the last write
+_MAX_BYTES = 16 * 1024 * 1024  # Rotate a log file once it reaches this size (0 = never)
+_BACKUPS = 3  # Rotated files kept as <name>.1 (newest) to <name>.N
+_STATE_SINK = None  # Object with write_state(entry) replacing game_state.jsonl (see telemetry.py)
+
 _frame_count = 0
-_state_log_initialized = False
-_event_log_initialized = False
+_writer = None
+_started_paths = set()  # Files already truncated this run
+_raw_paths = set()  # Files written with append_raw, which never rotate
+_FLUSH = object()  # Writer queue markers, sent in place of a path
+_STOP = object()
 _start_time = datetime.now()
+_enabled = True
+_listeners = []
+
+
+def configure(fps=None, sample_every=None, max_seconds=None, sprite_limit=None, queue_size=None,
+              overflow=None, flush_bytes=None, flush_seconds=None, max_bytes=None, backups=None,
+              state_sink=None):
+    """Change state log sampling and background writer settings; None keeps a setting.
+
+    queue_size applies from the next time the writer starts. state_sink="jsonl"
+    goes back to writing game_state.jsonl.
+    """
+    global _FPS, _SAMPLE_EVERY, _MAX_SECONDS, _SPRITE_SAMPLE_LIMIT
+    global _QUEUE_SIZE, _OVERFLOW, _FLUSH_BYTES, _FLUSH_SECONDS, _MAX_BYTES, _BACKUPS, _STATE_SINK
+    if fps is not None:
+        _FPS = fps
+    if sample_every is not None:
+        _SAMPLE_EVERY = sample_every
+    if max_seconds is not None:
+        _MAX_SECONDS = max_seconds
+    if sprite_limit is not None:
+        _SPRITE_SAMPLE_LIMIT = sprite_limit
+    if queue_size is not None:
+        _QUEUE_SIZE = queue_size
+    if overflow is not None:
+        if overflow not in ("drop", "block"):
+            raise ValueError(f"overflow must be 'drop' or 'block', not {overflow!r}")
+        _OVERFLOW = overflow
+    if flush_bytes is not None:
+        _FLUSH_BYTES = flush_bytes
+    if flush_seconds is not None:
+        _FLUSH_SECONDS = flush_seconds
+    if max_bytes is not None:
+        _MAX_BYTES = max_bytes
+    if backups is not None:
+        _BACKUPS = backups
+    if state_sink is not None:
+        _STATE_SINK = None if state_sink == "jsonl" else state_sink
+
+
+def set_enabled(enabled):
+    """Turn all logging on or off, e.g. for batches of headless games"""
+    global _enabled
+    _enabled = enabled
+
+
+def is_enabled():
+    return _enabled
+
+
+def add_listener(listener):
+    """Call listener(event_type, details) for every logged event, even when disabled"""
+    _listeners.append(listener)
+
+
+def remove_listener(listener):
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+class _Writer(threading.Thread):
+    """Writes queued lines to their files off the game thread.
+
+    The game thread only appends to a deque; the writer wakes when
+    _FLUSH_BYTES have been queued or _FLUSH_SECONDS have passed, and on
+    flush() and shutdown, then writes everything pending with one write per
+    file. Each file is truncated the first time it is written in a run and
+    rotated when it grows past _MAX_BYTES.
+    """
+
+    def __init__(self):
+        super().__init__(name="log-writer", daemon=True)
+        self.pending = deque()
+        # Bytes queued since the writer was last woken (game thread only)
+        self.unsent = 0
+        self.wake = threading.Event()
+        self.drained = threading.Event()
+        self.files = {}
+        self.written = 0
+        self.dropped = 0
+        self.batches = 0
+        self.rotations = 0
+
+    def put(self, path, line, droppable=True):
+        if droppable and len(self.pending) >= _QUEUE_SIZE:
+            if _OVERFLOW == "drop":
+                self.dropped += 1
+                return
+            while len(self.pending) >= _QUEUE_SIZE:
+                if not self.is_alive():
+                    # The writer died (e.g. an OSError writing or rotating): drop rather than hang
+                    self.dropped += 1
+                    return
+                self.drained.clear()
+                self.wake.set()
+                self.drained.wait(_FLUSH_SECONDS)
+        self.pending.append((path, line))
+        self.unsent += len(line)
+        if self.unsent >= _FLUSH_BYTES:
+            self.unsent = 0
+            self.wake.set()
+
+    def send(self, marker, payload=None):
+        """Queue a control marker, bypassing the size limit, and wake the writer"""
+        self.pending.append((marker, payload))
+        self.wake.set()
+
+    def run(self):
+        running = True
+        while running:
+            self.wake.wait(_FLUSH_SECONDS)
+            self.wake.clear()
+            running = self._drain()
+            self.drained.set()
+        for f in self.files.values():
+            f.close()
+        self.files = {}
+
+    def salvage(self):
+        """Write out what is pending on the calling thread, after the writer thread has died"""
+        try:
+            self._drain()
+        except OSError:
+            self.dropped += len(self.pending)
+            self.pending.clear()
+
+    def _drain(self):
+        """Write out everything pending; returns False once _STOP is reached"""
+        buffers = {}
+        while self.pending:
+            path, line = self.pending.popleft()
+            if path is _FLUSH:
+                self._write_buffers(buffers)
+                buffers = {}
+                line.set()
+            elif path is _STOP:
+                self._write_buffers(buffers)
+                return False
+            else:
+                buffers.setdefault(path, []).append(line)
+        self._write_buffers(buffers)
+        return True
+
+    def _write_buffers(self, buffers):
+        for path, lines in buffers.items():
+            f = self.files.get(path)
+            if f is None:
+                # New log file on each run
+                f = self.files[path] = open(path, "ab" if path in _started_paths else "wb")
+                _started_paths.add(path)
+            if isinstance(lines[0], bytes):
+                f.write(b"".join(lines))
+            else:
+                f.write("".join(lines).encode())
+            f.flush()
+            self.written += len(lines)
+            if _MAX_BYTES and path not in _raw_paths and f.tell() >= _MAX_BYTES:
+                self._rotate(path)
+        if buffers:
+            self.batches += 1
+
+    def _rotate(self, path):
+        self.files.pop(path).close()
+        for index in range(_BACKUPS - 1, 0, -1):
+            if os.path.exists(f"{path}.{index}"):
+                os.replace(f"{path}.{index}", f"{path}.{index + 1}")
+        if _BACKUPS:
+            os.replace(path, f"{path}.1")
+        self.files[path] = open(path, "wb")
+        self.rotations += 1
+
+
+def _get_writer():
+    global _writer
+    if _writer is None:
+        _writer = _Writer()
+        _writer.start()
+    return _writer
+
+
+def _write(path, record):
+    # Encode here: the record may hold live objects, and the writer thread
+    # should spend as little time as possible holding the GIL
+    _get_writer().put(path, json.dumps(record) + "\n")
+
+
+def append_raw(path, data):
+    """Queue bytes for the writer thread to append to path.
+
+    Never dropped when the queue is full, since losing a chunk would
+    misalign a binary file. Files written this way never rotate.
+    """
+    _raw_paths.add(path)
+    _get_writer().put(path, data, droppable=False)
+
+
+def _wait_while_alive(writer, event, timeout):
+    """event.wait(timeout), giving up early if the writer thread has died"""
+    remaining = math.inf if timeout is None else timeout
+    while remaining > 0:
+        step = min(_FLUSH_SECONDS, remaining)
+        if event.wait(step):
+            return True
+        if not writer.is_alive():
+            return event.is_set()
+        remaining -= step
+    return False
+
+
+def flush(timeout=None):
+    """Block until everything logged so far is on disk"""
+    if _writer is not None:
+        done = threading.Event()
+        _writer.send(_FLUSH, done)
+        if not _wait_while_alive(_writer, done, timeout) and not _writer.is_alive():
+            _writer.salvage()
+
+
+def shutdown():
+    """Write out everything queued and stop the writer; logging again restarts it"""
+    global _writer
+    if _writer is not None:
+        writer, _writer = _writer, None
+        writer.send(_STOP)
+        writer.join()
+        if writer.pending:
+            # The thread died before reaching _STOP
+            writer.salvage()
+
+
+def writer_stats():
+    if _writer is None:
+        return {"queued": 0, "written": 0, "dropped": 0, "batches": 0, "rotations": 0}
+    return {
+        "queued": len(_writer.pending),
+        "written": _writer.written,
+        "dropped": _writer.dropped,
+        "batches": _writer.batches,
+        "rotations": _writer.rotations,
+    }
 
 
-def log_state():
-    global _frame_count, _state_log_initialized
-
-    # Stop logging after `_MAX_SECONDS` seconds
-    if _frame_count > _FPS * _MAX_SECONDS:
-        return
-
-    # Take a snapshot approx. once per second
-    _frame_count += 1
-    if _frame_count % _FPS != 0:
-        return
-
-    now = datetime.now()
-
-    frame = inspect.currentframe()
-    if frame is None:
-        return
-
-    frame_back = frame.f_back
-    if frame_back is None:
-        return
-
-    local_vars = frame_back.f_locals.copy()
-
-    screen_size = []
-    game_state = {}
-
-    for key, value in local_vars.items():
-        if "pygame" in str(type(value)) and hasattr(value, "get_size"):
-            screen_size = value.get_size()
-
-        if hasattr(value, "__class__") and "Group" in value.__class__.__name__:
-            sprites_data = []
-
-            for i, sprite in enumerate(value):
-                if i >= _SPRITE_SAMPLE_LIMIT:
-                    break
-
-                sprite_info = {"type": sprite.__class__.__name__}
-
-                if hasattr(sprite, "position"):
-                    sprite_info["pos"] = [
-                        round(sprite.position.x, 2),
-                        round(sprite.position.y, 2),
-                    ]
-
-                if hasattr(sprite, "velocity"):
-                    sprite_info["vel"] = [
-                        round(sprite.velocity.x, 2),
-                        round(sprite.velocity.y, 2),
-                    ]
+def _forget_writer():
+    # A forked child (e.g. a batch worker) inherits the object but not the thread
+    global _writer
+    _writer = None
 
-                if hasattr(sprite, "radius"):
-                    sprite_info["rad"] = sprite.radius
 
-                if hasattr(sprite, "rotation"):
-                    sprite_info["rot"] = round(sprite.rotation, 2)
+atexit.register(shutdown)
+os.register_at_fork(after_in_child=_forget_writer)
 
-                sprites_data.append(sprite_info)
 
-            game_state[key] = {"count": len(value), "sprites": sprites_data}
+def log_state(entities, screen_size=()):
+    """Count a frame and, every `_SAMPLE_EVERY` frames, log a snapshot.
 
-        if len(game_state) == 0 and hasattr(value, "position"):
-            sprite_info = {"type": value.__class__.__name__}
+    entities maps names to sprite groups or single entities (None is
+    skipped); every entity provides snapshot(), a compact dict record.
+    Groups are logged as their size plus up to `_SPRITE_SAMPLE_LIMIT` records.
+    """
+    global _frame_count
 
-            sprite_info["pos"] = [
-                round(value.position.x, 2),
-                round(value.position.y, 2),
-            ]
+    if not _enabled:
+        return
 
-            if hasattr(value, "velocity"):
-                sprite_info["vel"] = [
-                    round(value.velocity.x, 2),
-                    round(value.velocity.y, 2),
-                ]
+    # Keep counting after the cutoff: events and analytics key on the frame
+    _frame_count += 1
 
-            if hasattr(value, "radius"):
-                sprite_info["rad"] = value.radius
+    # Stop logging state after `_MAX_SECONDS` seconds
+    if _frame_count > _FPS * _MAX_SECONDS:
+        return
+    if _frame_count % _SAMPLE_EVERY != 0:
+        return
 
-            if hasattr(value, "rotation"):
-                sprite_info["rot"] = round(value.rotation, 2)
+    now = datetime.now()
 
-            game_state[key] = sprite_info
+    game_state = {}
+    for name, value in entities.items():
+        if value is None:
+            continue
+        snapshot = getattr(value, "snapshot", None)
+        if snapshot is not None:
+            game_state[name] = snapshot()
+        else:
+            sprites = [sprite.snapshot() for sprite in itertools.islice(value, _SPRITE_SAMPLE_LIMIT)]
+            game_state[name] = {"count": len(value), "sprites": sprites}
 
     entry = {
         "timestamp": now.strftime("%H:%M:%S.%f")[:-3],
         "elapsed_s": math.floor((now - _start_time).total_seconds()),
         "frame": _frame_count,
-        "screen_size": screen_size,
+        "screen_size": list(screen_size),
         **game_state,
     }
 
-    # New log file on each run
-    mode = "w" if not _state_log_initialized else "a"
-    with open("game_state.jsonl", mode) as f:
-        f.write(json.dumps(entry) + "\n")
-
-    _state_log_initialized = True
+    if _STATE_SINK is None:
+        _write("game_state.jsonl", entry)
+    else:
+        _STATE_SINK.write_state(entry)
 
 
 def log_event(event_type, **details):
-    global _event_log_initialized
+    for listener in _listeners:
+        listener(event_type, details)
+
+    if not _enabled:
+        return
 
     now = datetime.now()
 
@@ -128,8 +350,4 @@ def log_event(event_type, **details):
         **details,
     }
 
-    mode = "w" if not _event_log_initialized else "a"
-    with open("game_events.jsonl", mode) as f:
-        f.write(json.dumps(event) + "\n")
-
-    _event_log_initialized = True
+    _write("game_events.jsonl", event)
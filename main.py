@@ -26,9 +26,14 @@ After game.run() is called, the program lives inside game.py's
 main loop until the player quits.
 """
 
-import pygame  # The game library that handles graphics, input, etc.
-from constants import SCREEN_WIDTH, SCREEN_HEIGHT  # Our screen size settings
-from game import Game  # The main Game class that runs everything
+# Imported first: it starts the clock for the time-to-first-frame breakdown
+# (see startup.py), which is logged to game_events.jsonl as a "startup" event
+import startup
+
+with startup.phase("imports"):
+    import pygame  # The game library that handles graphics, input, etc.
+    from constants import SCREEN_WIDTH, SCREEN_HEIGHT, REPLAY_DIR  # Our screen size settings
+    from game import Game  # The main Game class that runs everything
 
 
 def main():
@@ -45,19 +50,23 @@ def main():
 
     # Initialize pygame - this MUST be called before using any pygame features
     # It sets up the graphics system, sound system, etc.
-    pygame.init()
+    with startup.phase("pygame_init"):
+        pygame.init()
 
     # Create the game window
     # pygame.display.set_mode() creates a window of the specified size
     # It returns a "Surface" object - think of it like a canvas we draw on
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    with startup.phase("display"):
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 
-    # Set the window title (what appears in the title bar)
-    pygame.display.set_caption("Asteroids")
+        # Set the window title (what appears in the title bar)
+        pygame.display.set_caption("Asteroids")
 
     # Create our Game object, passing it the screen to draw on
     # The Game class (in game.py) contains ALL the game logic
-    game = Game(screen)
+    # Each session is also recorded so it can be replayed with replay.py,
+    # and dead shots, asteroids and particles are recycled (see pool.py)
+    game = Game(screen, object_pools=True, record_replays=REPLAY_DIR)
 
     # Start the game! This function contains the "main loop" and
     # won't return until the player closes the window
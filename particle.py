@@ -1,15 +1,26 @@
 import pygame
-import random
+import rng
 import math
 from constants import *
+from pool import Poolable
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
-class Particle(pygame.sprite.Sprite):
-    def __init__(self, x, y, velocity, color=COLOR_WHITE, lifetime=PARTICLE_LIFETIME, size=3):
+
+class Particle(Poolable, pygame.sprite.Sprite):
+    def __init__(self, x, y, velocity, color=None, lifetime=None, size=3):
         if hasattr(self, "containers"):
             super().__init__(self.containers)
         else:
             super().__init__()
+        if color is None:
+            color = COLOR_WHITE
+        if lifetime is None:
+            lifetime = PARTICLE_LIFETIME
         self.position = pygame.Vector2(x, y)
         self.velocity = velocity
         self.color = color
@@ -23,6 +34,10 @@ class Particle(pygame.sprite.Sprite):
         if self.lifetime <= 0:
             self.kill()
 
+    def bounding_rect(self):
+        extent = self.size + 2
+        return pygame.Rect(int(self.position.x - extent), int(self.position.y - extent), extent * 2 + 1, extent * 2 + 1)
+
     def draw(self, screen):
         # Fade out as lifetime decreases
         alpha = self.lifetime / self.max_lifetime
@@ -31,20 +46,169 @@ class Particle(pygame.sprite.Sprite):
 
 
 class ParticleSystem:
-    def __init__(self, particles_group, updatable_group, drawable_group):
+    """Spawns and simulates particles.
+
+    With NumPy available, particles live in preallocated arrays used as a
+    ring buffer of `capacity` slots: bursts are written as array slices,
+    update() advances every particle in one step and draw() writes pixels
+    straight into the target surface. When the buffer is full the oldest
+    particles are overwritten. Without NumPy, each particle is a Particle
+    sprite in the given groups as before.
+    """
+
+    def __init__(self, particles_group, updatable_group, drawable_group, capacity=None):
+        if capacity is None:
+            capacity = PARTICLE_CAPACITY
         self.particles_group = particles_group
         Particle.containers = (particles_group, updatable_group, drawable_group)
+        self.vectorized = NUMPY_AVAILABLE
+        self.capacity = capacity
+        if self.vectorized:
+            self.position = np.zeros((capacity, 2))
+            self.velocity = np.zeros((capacity, 2))
+            self.lifetime = np.zeros(capacity)
+            self.max_lifetime = np.ones(capacity)
+            self.size = np.zeros(capacity)
+            self.color_index = np.zeros(capacity, dtype=np.intp)
+            self.head = 0
+            self.palette = []
+            self._palette_lookup = {}
+            self._discs = {}
+            self.generator = np.random.default_rng(rng.cosmetic.getrandbits(64))
+
+    def _color_index(self, color):
+        color = pygame.Color(color)
+        key = tuple(color)
+        index = self._palette_lookup.get(key)
+        if index is None:
+            index = len(self.palette)
+            self.palette.append(color)
+            self._palette_lookup[key] = index
+        return index
+
+    def emit(self, x, y, velocity, color, lifetime, size):
+        """Write a burst into the ring buffer; arguments may be arrays or scalars"""
+        count = len(velocity)
+        if count > self.capacity:
+            # Only the newest `capacity` particles of the burst would survive
+            keep = slice(count - self.capacity, count)
+            x = np.broadcast_to(x, count)[keep]
+            y = np.broadcast_to(y, count)[keep]
+            lifetime = np.broadcast_to(lifetime, count)[keep]
+            velocity = velocity[keep]
+            count = self.capacity
+        slots = (self.head + np.arange(count)) % self.capacity
+        self.position[slots, 0] = x
+        self.position[slots, 1] = y
+        self.velocity[slots] = velocity
+        self.lifetime[slots] = lifetime
+        self.max_lifetime[slots] = lifetime
+        self.size[slots] = size
+        self.color_index[slots] = self._color_index(color)
+        self.head = (self.head + count) % self.capacity
+
+    def update(self, dt):
+        """Advance every buffered particle; no-op for sprite particles"""
+        if not self.vectorized:
+            return
+        self.position += self.velocity * dt
+        self.lifetime -= dt
+
+    def count(self):
+        if not self.vectorized:
+            return len(self.particles_group)
+        return int(np.count_nonzero(self.lifetime > 0))
 
-    def explosion(self, x, y, color=COLOR_WHITE, count=PARTICLE_COUNT_EXPLOSION, speed=PARTICLE_SPEED):
+    def clear(self):
+        if self.vectorized:
+            self.lifetime[:] = 0
+        for particle in list(self.particles_group):
+            particle.kill()
+
+    def dirty_rects(self, cell=None):
+        """Grid cells holding live buffered particles, for dirty-rect rendering"""
+        if not self.vectorized:
+            return []
+        if cell is None:
+            cell = PARTICLE_DIRTY_CELL
+        live = self.lifetime > 0
+        if not live.any():
+            return []
+        # Pad by the largest particle radius so discs near a cell edge are covered
+        pad = int(self.size[live].max()) + 2
+        cells = np.unique((self.position[live] // cell).astype(np.intp), axis=0)
+        return [pygame.Rect(cx * cell - pad, cy * cell - pad, cell + pad * 2, cell + pad * 2) for cx, cy in cells]
+
+    def _disc(self, radius):
+        """Pixel offsets covered by a filled circle of the given radius"""
+        disc = self._discs.get(radius)
+        if disc is None:
+            r = np.arange(-radius, radius + 1)
+            dx, dy = np.meshgrid(r, r)
+            inside = dx * dx + dy * dy < radius * radius
+            disc = (dx[inside], dy[inside]) if radius > 1 else (np.zeros(1, int), np.zeros(1, int))
+            self._discs[radius] = disc
+        return disc
+
+    def draw(self, screen):
+        """Draw buffered particles; sprite particles draw through their group"""
+        if not self.vectorized:
+            return
+        live = np.flatnonzero(self.lifetime > 0)
+        if len(live) == 0:
+            return
+
+        # Same fade as Particle.draw: radius shrinks with remaining lifetime
+        alpha = self.lifetime[live] / self.max_lifetime[live]
+        radius = (self.size[live] * alpha).astype(np.intp) + 1
+        x = self.position[live, 0].astype(np.intp)
+        y = self.position[live, 1].astype(np.intp)
+        colors = np.array([screen.map_rgb(color) for color in self.palette], dtype=np.uint32)
+        pixel = colors[self.color_index[live]]
+
+        try:
+            pixels = pygame.surfarray.pixels2d(screen)
+        except ValueError:
+            # 24-bit and some hardware surfaces can't be referenced as arrays
+            for px, py, r, i in zip(x, y, radius, self.color_index[live]):
+                pygame.draw.circle(screen, self.palette[i], (px, py), r)
+            return
+
+        width, height = pixels.shape
+        for r in np.unique(radius):
+            mask = radius == r
+            dx, dy = self._disc(int(r))
+            px = (x[mask, None] + dx).ravel()
+            py = (y[mask, None] + dy).ravel()
+            values = np.repeat(pixel[mask], len(dx))
+            visible = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+            pixels[px[visible], py[visible]] = values[visible]
+        del pixels
+
+    def explosion(self, x, y, color=None, count=None, speed=None):
         """Create explosion particles radiating outward"""
+        if color is None:
+            color = COLOR_WHITE
+        if count is None:
+            count = PARTICLE_COUNT_EXPLOSION
+        if speed is None:
+            speed = PARTICLE_SPEED
+        if self.vectorized:
+            angle = 2 * np.pi * np.arange(count) / count + self.generator.uniform(-0.2, 0.2, count)
+            particle_speed = speed * self.generator.uniform(0.5, 1.5, count)
+            velocity = np.column_stack((np.cos(angle), np.sin(angle))) * particle_speed[:, None]
+            lifetime = PARTICLE_LIFETIME * self.generator.uniform(0.8, 1.2, count)
+            self.emit(x, y, velocity, color, lifetime, 3)
+            return
+
         for i in range(count):
-            angle = (2 * math.pi * i) / count + random.uniform(-0.2, 0.2)
-            particle_speed = speed * random.uniform(0.5, 1.5)
+            angle = (2 * math.pi * i) / count + rng.cosmetic.uniform(-0.2, 0.2)
+            particle_speed = speed * rng.cosmetic.uniform(0.5, 1.5)
             velocity = pygame.Vector2(
                 math.cos(angle) * particle_speed,
                 math.sin(angle) * particle_speed
             )
-            Particle(x, y, velocity, color, PARTICLE_LIFETIME * random.uniform(0.8, 1.2))
+            Particle(x, y, velocity, color, PARTICLE_LIFETIME * rng.cosmetic.uniform(0.8, 1.2))
 
     def asteroid_explosion(self, x, y, radius):
         """Create asteroid-specific explosion based on size"""
@@ -63,16 +227,70 @@ class ParticleSystem:
         """Create large explosion for player death"""
         self.explosion(x, y, COLOR_WHITE, count=20, speed=PARTICLE_SPEED * 1.5)
 
-    def thrust(self, x, y, direction, color=COLOR_ORANGE):
+    def thrust(self, x, y, direction, color=None):
         """Create thrust particles behind the ship"""
+        if color is None:
+            color = COLOR_ORANGE
+        if self.vectorized:
+            count = PARTICLE_COUNT_THRUST
+            spread = self.generator.uniform(-0.3, 0.3, count)
+            cos = np.cos(spread)
+            sin = np.sin(spread)
+            # direction rotated by spread, reversed and scaled
+            vx = direction.x * cos - direction.y * sin
+            vy = direction.x * sin + direction.y * cos
+            velocity = np.column_stack((vx, vy)) * -self.generator.uniform(50, 100, count)[:, None]
+            self.emit(
+                x + self.generator.uniform(-3, 3, count),
+                y + self.generator.uniform(-3, 3, count),
+                velocity,
+                color,
+                PARTICLE_LIFETIME * 0.5,
+                2
+            )
+            return
+
         for _ in range(PARTICLE_COUNT_THRUST):
-            spread = random.uniform(-0.3, 0.3)
-            particle_velocity = direction.rotate(math.degrees(spread)) * -1 * random.uniform(50, 100)
+            spread = rng.cosmetic.uniform(-0.3, 0.3)
+            particle_velocity = direction.rotate(math.degrees(spread)) * -1 * rng.cosmetic.uniform(50, 100)
             Particle(
-                x + random.uniform(-3, 3),
-                y + random.uniform(-3, 3),
+                x + rng.cosmetic.uniform(-3, 3),
+                y + rng.cosmetic.uniform(-3, 3),
                 particle_velocity,
                 color,
                 PARTICLE_LIFETIME * 0.5,
                 size=2
             )
+
+
+class NullParticleSystem:
+    """Drop-in ParticleSystem that discards everything, for headless games"""
+
+    vectorized = False
+
+    def explosion(self, x, y, color=None, count=None, speed=None):
+        pass
+
+    def asteroid_explosion(self, x, y, radius):
+        pass
+
+    def player_death(self, x, y):
+        pass
+
+    def thrust(self, x, y, direction, color=None):
+        pass
+
+    def update(self, dt):
+        pass
+
+    def draw(self, screen):
+        pass
+
+    def clear(self):
+        pass
+
+    def count(self):
+        return 0
+
+    def dirty_rects(self, cell=None):
+        return []
@@ -1,8 +1,10 @@
 import pygame
-import random
+import rng
 from circleshape import CircleShape
 from constants import *
 from shot import Shot
+from inputs import THRUST, REVERSE, ROTATE_LEFT, ROTATE_RIGHT, FIRE
+from logger import log_event
 
 
 class Player(CircleShape):
@@ -23,6 +25,10 @@ class Player(CircleShape):
         self.shield_timer = 0
         # Callback for shoot sound
         self.on_shoot = None
+        # Shots spawned this game (spread shots count three)
+        self.shots_fired = 0
+        # Input bitmask for this frame (see inputs.py), set by Game
+        self.inputs = 0
         # Thrust state for visual
         self.thrusting = False
         self.flame_flicker = 0
@@ -34,7 +40,7 @@ class Player(CircleShape):
 
         # Draw shield if active
         if self.shield:
-            pygame.draw.circle(screen, COLOR_BLUE, self.position, self.radius + 10, 2)
+            pygame.draw.circle(screen, COLOR_BLUE, self.render_position, self.radius + 10, 2)
 
         # Draw thrust flame if thrusting
         if self.thrusting:
@@ -48,12 +54,12 @@ class Player(CircleShape):
         right = pygame.Vector2(0, 1).rotate(self.rotation + 90) * self.radius / 3
 
         # Base of flame (at ship's rear)
-        base = self.position - forward * self.radius
+        base = self.render_position - forward * self.radius
         left_base = base - right
         right_base = base + right
 
         # Tip of flame (with flicker)
-        flicker = random.uniform(0.7, 1.3)
+        flicker = rng.cosmetic.uniform(0.7, 1.3)
         flame_length = self.radius * 1.5 * flicker
         tip = base - forward * flame_length
 
@@ -69,29 +75,33 @@ class Player(CircleShape):
         inner_points = [inner_left_base, inner_tip, inner_right_base]
         pygame.draw.polygon(screen, COLOR_YELLOW, inner_points, 0)
 
+    def bounding_rect(self):
+        # Thrust flame reaches about 3 radii behind the ship's centre
+        return self.rect_around(self.radius * 3 + LINE_WIDTH)
+
     def triangle(self):
         forward = pygame.Vector2(0, 1).rotate(self.rotation)
         right = pygame.Vector2(0, 1).rotate(self.rotation + 90) * self.radius / 1.5
-        a = self.position + forward * self.radius
-        b = self.position - forward * self.radius - right
-        c = self.position - forward * self.radius + right
+        a = self.render_position + forward * self.radius
+        b = self.render_position - forward * self.radius - right
+        c = self.render_position - forward * self.radius + right
         return [a, b, c]
 
     def update(self, dt):
-        keys = pygame.key.get_pressed()
+        inputs = self.inputs
 
         # Track thrusting state for visual
-        self.thrusting = keys[pygame.K_w] or keys[pygame.K_s]
+        self.thrusting = bool(inputs & (THRUST | REVERSE))
 
-        if keys[pygame.K_w]:
+        if inputs & THRUST:
             self.move(dt)
-        if keys[pygame.K_s]:
+        if inputs & REVERSE:
             self.move(-dt)
-        if keys[pygame.K_a]:
+        if inputs & ROTATE_LEFT:
             self.rotate(-dt)
-        if keys[pygame.K_d]:
+        if inputs & ROTATE_RIGHT:
             self.rotate(dt)
-        if keys[pygame.K_SPACE]:
+        if inputs & FIRE:
             cooldown = PLAYER_SHOOT_COOLDOWN_SECONDS
             if self.rapid_fire:
                 cooldown /= POWERUP_RAPID_FIRE_MULTIPLIER
@@ -146,26 +156,37 @@ class Player(CircleShape):
                 shot = Shot(self.position.x, self.position.y, SHOT_RADIUS)
                 direction = pygame.Vector2(0, 1).rotate(self.rotation + angle_offset)
                 shot.velocity = direction * PLAYER_SHOT_SPEED
+            self.shots_fired += 3
+            log_event("shot_fired", count=3)
         else:
             shot = Shot(self.position.x, self.position.y, SHOT_RADIUS)
             direction = pygame.Vector2(0, 1).rotate(self.rotation)
             shot.velocity = direction * PLAYER_SHOT_SPEED
+            self.shots_fired += 1
+            log_event("shot_fired", count=1)
 
         # Play shoot sound
         if self.on_shoot:
             self.on_shoot()
 
-    def make_invincible(self, duration=PLAYER_INVINCIBILITY_TIME):
+    def make_invincible(self, duration=None):
         self.invincible = True
-        self.invincibility_timer = duration
+        # Read at call time so tuning profiles can override it
+        self.invincibility_timer = PLAYER_INVINCIBILITY_TIME if duration is None else duration
         self.blink_timer = 0.1
 
+    def snapshot(self):
+        record = super().snapshot()
+        record["rot"] = round(self.rotation, 2)
+        return record
+
     def is_vulnerable(self):
         return not self.invincible and not self.shield
 
     def reset(self, x, y):
         """Reset player to center position"""
         self.position = pygame.Vector2(x, y)
+        self.previous_position = None  # Don't interpolate the jump back to centre
         self.velocity = pygame.Vector2(0, 0)
         self.rotation = 0
         self.make_invincible()
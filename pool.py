@@ -0,0 +1,100 @@
+class PoolStats:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.live = 0
+        self.high_water = 0
+
+    def as_dict(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "live": self.live,
+            "high_water": self.high_water,
+        }
+
+
+class SpritePool:
+    """Recycles killed sprites so new ones can be reinitialized in place.
+
+    Killed sprites are only retired; recycle() makes them available again,
+    and Game calls it at the start of each frame. That way an object killed
+    mid-frame (e.g. an asteroid reading its own position in split()) is never
+    handed out again before the frame is over.
+    """
+
+    def __init__(self):
+        self.free = {}
+        self.retired = []
+        self.stats = {}
+
+    def _stats(self, cls):
+        stats = self.stats.get(cls.__name__)
+        if stats is None:
+            stats = self.stats[cls.__name__] = PoolStats()
+        return stats
+
+    def acquire(self, cls):
+        """Return a recycled instance of cls, or None if the pool is empty"""
+        stats = self._stats(cls)
+        stats.live += 1
+        stats.high_water = max(stats.high_water, stats.live)
+        free = self.free.get(cls)
+        if free:
+            stats.hits += 1
+            return free.pop()
+        stats.misses += 1
+        return None
+
+    def retire(self, sprite):
+        self._stats(type(sprite)).live -= 1
+        self.retired.append(sprite)
+
+    def recycle(self):
+        for sprite in self.retired:
+            self.free.setdefault(type(sprite), []).append(sprite)
+        self.retired = []
+
+    def prewarm(self, cls, count):
+        """Allocate instances up front; __init__ runs when they are acquired"""
+        # Pool under the class constructing cls really instantiates (e.g. a store handle)
+        cls = cls.instance_class()
+        free = self.free.setdefault(cls, [])
+        for _ in range(count - len(free)):
+            free.append(object.__new__(cls))
+
+    def clear(self):
+        self.free = {}
+        self.retired = []
+
+    def report(self):
+        return {name: stats.as_dict() for name, stats in self.stats.items()}
+
+
+class Poolable:
+    """Mixin for sprites that can come from a SpritePool.
+
+    Set `pool` on the class (like `containers`) to enable recycling;
+    constructing the class then reuses a dead instance when one is free.
+    """
+
+    pool = None
+
+    @classmethod
+    def instance_class(cls):
+        """The class cls(...) instantiates; subclasses may substitute another"""
+        return cls
+
+    def __new__(cls, *args, **kwargs):
+        pool = cls.pool
+        if pool is not None:
+            instance = pool.acquire(cls)
+            if instance is not None:
+                return instance
+        return super().__new__(cls)
+
+    def kill(self):
+        was_alive = self.alive()
+        super().kill()
+        if was_alive and self.pool is not None:
+            self.pool.retire(self)
@@ -1,5 +1,5 @@
 import pygame
-import random
+import rng
 import math
 from circleshape import CircleShape
 from constants import *
@@ -16,14 +16,14 @@ class PowerUp(CircleShape):
 
     def __init__(self, x, y, powerup_type=None):
         super().__init__(x, y, POWERUP_RADIUS)
-        self.type = powerup_type or random.choice(self.TYPES)
+        self.type = powerup_type or rng.gameplay.choice(self.TYPES)
         self.color = self.COLORS[self.type]
         self.lifetime = 10.0  # Despawn after 10 seconds
         self.pulse_timer = 0
         self.pulse_scale = 1.0
 
         # Slow drift
-        angle = random.uniform(0, 2 * math.pi)
+        angle = rng.gameplay.uniform(0, 2 * math.pi)
         self.velocity = pygame.Vector2(math.cos(angle), math.sin(angle)) * 20
 
     def draw(self, screen):
@@ -31,10 +31,10 @@ class PowerUp(CircleShape):
         pulse_radius = self.radius * self.pulse_scale
 
         # Draw outer ring
-        pygame.draw.circle(screen, self.color, self.position, int(pulse_radius), LINE_WIDTH)
+        pygame.draw.circle(screen, self.color, self.render_position, int(pulse_radius), LINE_WIDTH)
 
         # Draw inner symbol based on type
-        center = self.position
+        center = self.render_position
         r = pulse_radius * 0.5
 
         if self.type == 'shield':
@@ -64,19 +64,26 @@ class PowerUp(CircleShape):
                            (center.x, center.y - r),
                            (center.x, center.y + r), 2)
 
+    def bounding_rect(self):
+        # Pulse grows the ring up to 15% past the radius
+        return self.rect_around(self.radius * 1.15 + LINE_WIDTH + 2)
+
     def update(self, dt):
-        self.position += self.velocity * dt
+        self.position = self.position + self.velocity * dt
         self.wrap_position()
 
-        # Update pulse effect
-        self.pulse_timer += dt * 3
-        self.pulse_scale = 1.0 + 0.15 * math.sin(self.pulse_timer)
-
         # Update lifetime
         self.lifetime -= dt
         if self.lifetime <= 0:
             self.kill()
 
+        self.update_behavior(dt)
+
+    def update_behavior(self, dt):
+        # Update pulse effect
+        self.pulse_timer += dt * 3
+        self.pulse_scale = 1.0 + 0.15 * math.sin(self.pulse_timer)
+
     def apply(self, player):
         """Apply power-up effect to player"""
         if self.type == 'shield':
@@ -95,5 +102,5 @@ class PowerUp(CircleShape):
 
 def maybe_spawn_powerup(x, y, powerups_group):
     """Potentially spawn a power-up at the given position"""
-    if random.random() < POWERUP_DROP_CHANCE:
+    if rng.gameplay.random() < POWERUP_DROP_CHANCE:
         PowerUp(x, y)
@@ -0,0 +1,150 @@
+"""Per-phase frame timings for Game.run, with an on-screen overlay.
+
+FrameProfiler collects perf_counter_ns timings per frame and phase and
+keeps PROFILER_WINDOW frames of them; stats() turns them into
+percentiles. F3 in game shows the table and a frame-time graph against
+the 60 fps budget; its text is refreshed every PROFILER_OVERLAY_REFRESH
+frames.
+"""
+import math
+import time
+from collections import deque
+
+import pygame
+from constants import PROFILER_WINDOW, PROFILER_OVERLAY_REFRESH, COLOR_WHITE
+
+# Frame budget drawn on the overlay graph, in milliseconds
+_BUDGET_MS = 1000 / 60
+_GRAPH_HEIGHT = 60
+_GRAPH_MAX_MS = _BUDGET_MS * 2
+_COLUMN_WIDTH = 50
+
+
+def _percentile(ordered, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+class FrameProfiler:
+    """Per-phase frame timings over a rolling window, with an optional overlay.
+
+    Game.run marks the top-level phases of each frame with lap() (events,
+    update, draw, wait), and step()/draw() time their parts with add()
+    under dotted names ("update.collisions", "draw.flip", ...). Every
+    frame's totals go into fixed-size windows, from which stats() reports
+    percentiles. Callers check `enabled` before reading the clock, so a
+    disabled profiler costs a few attribute lookups per frame.
+    """
+
+    def __init__(self, window=None, enabled=False):
+        if window is None:
+            window = PROFILER_WINDOW
+        self.window = window
+        self.enabled = enabled
+        self.show_overlay = False
+        # Whether showing the overlay is what turned profiling on
+        self.enabled_by_overlay = False
+        # Phase -> nanoseconds per frame, oldest first
+        self.samples = {}
+        self.frame_ns = deque(maxlen=window)
+        self.current = {}
+        self.frame_start = 0
+        self.last = 0
+        self.frames = 0
+        self.font = None
+        self.overlay_lines = []
+
+    def begin_frame(self):
+        # Drop anything charged while profiling was switched on mid-frame
+        self.current.clear()
+        self.frame_start = self.last = time.perf_counter_ns()
+
+    def lap(self, phase):
+        """Charge the time since the last lap (or begin_frame) to phase"""
+        now = time.perf_counter_ns()
+        self.current[phase] = self.current.get(phase, 0) + now - self.last
+        self.last = now
+
+    def add(self, phase, ns):
+        self.current[phase] = self.current.get(phase, 0) + ns
+
+    def end_frame(self):
+        self.frame_ns.append(time.perf_counter_ns() - self.frame_start)
+        for phase in self.current.keys() - self.samples.keys():
+            # Pad so every window lines up with frame_ns
+            self.samples[phase] = deque([0] * (len(self.frame_ns) - 1), maxlen=self.window)
+        current = self.current
+        for phase, values in self.samples.items():
+            values.append(current.get(phase, 0))
+        current.clear()
+        self.frames += 1
+
+    def reset(self):
+        self.samples.clear()
+        self.frame_ns.clear()
+        self.current.clear()
+
+    def stats(self):
+        """{phase: {"mean", "p50", "p95", "p99", "max"}} in milliseconds over the window.
+
+        "frame" is the whole frame, including waiting for the frame cap.
+        """
+        result = {}
+        for phase, values in (("frame", self.frame_ns), *sorted(self.samples.items())):
+            if not values:
+                continue
+            ordered = sorted(values)
+            result[phase] = {
+                "mean": sum(ordered) / len(ordered) / 1e6,
+                "p50": _percentile(ordered, 0.50) / 1e6,
+                "p95": _percentile(ordered, 0.95) / 1e6,
+                "p99": _percentile(ordered, 0.99) / 1e6,
+                "max": ordered[-1] / 1e6,
+            }
+        return result
+
+    def toggle_overlay(self):
+        """Show or hide the overlay; profiling runs while it is shown"""
+        self.show_overlay = not self.show_overlay
+        if self.show_overlay and not self.enabled:
+            self.enabled = self.enabled_by_overlay = True
+        elif not self.show_overlay and self.enabled_by_overlay:
+            self.enabled = self.enabled_by_overlay = False
+        self.reset()
+        self.overlay_lines = []
+
+    def draw_overlay(self, screen):
+        """Percentile table and frame-time graph in the bottom-left corner"""
+        if self.font is None:
+            self.font = pygame.font.Font(None, 20)
+        # Re-rendering text every frame would show up in the numbers
+        if self.frames % PROFILER_OVERLAY_REFRESH == 0 or not self.overlay_lines:
+            rows = [("phase ms", "p50", "p95", "p99")]
+            for phase, numbers in self.stats().items():
+                rows.append((phase, *(f"{numbers[key]:.2f}" for key in ("p50", "p95", "p99"))))
+            self.overlay_lines = [[self.font.render(cell, True, COLOR_WHITE) for cell in row] for row in rows]
+
+        line_height = self.font.get_linesize()
+        name_width = max(row[0].get_width() for row in self.overlay_lines) + 10
+        table_width = name_width + 3 * _COLUMN_WIDTH
+        width = max(self.window * 2, table_width) + 12
+        height = line_height * len(self.overlay_lines) + _GRAPH_HEIGHT + 16
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        for index, row in enumerate(self.overlay_lines):
+            y = 4 + index * line_height
+            panel.blit(row[0], (6, y))
+            # Numbers right-aligned in their columns
+            for column, cell in enumerate(row[1:], 1):
+                panel.blit(cell, (6 + name_width + column * _COLUMN_WIDTH - cell.get_width(), y))
+
+        # One bar per frame, oldest on the left; the line marks 60 fps
+        bottom = height - 6
+        for index, ns in enumerate(self.frame_ns):
+            ms = ns / 1e6
+            bar = min(_GRAPH_HEIGHT, int(ms / _GRAPH_MAX_MS * _GRAPH_HEIGHT))
+            color = (80, 220, 80) if ms <= _BUDGET_MS else (230, 200, 60) if ms <= _GRAPH_MAX_MS else (230, 70, 60)
+            pygame.draw.line(panel, color, (6 + index * 2, bottom), (6 + index * 2, bottom - bar))
+        budget_y = bottom - int(_BUDGET_MS / _GRAPH_MAX_MS * _GRAPH_HEIGHT)
+        pygame.draw.line(panel, (200, 200, 200), (6, budget_y), (width - 6, budget_y))
+        screen.blit(panel, (10, screen.get_height() - height - 10))
@@ -0,0 +1,87 @@
+import pygame
+from constants import *
+
+
+class DirtyRectRenderer:
+    """Redraws only the screen regions that changed since the last frame.
+
+    Each frame the area covered by every drawable last frame is restored
+    from the cached starfield background, everything is drawn straight onto
+    the display, and only the old and new bounding rects (plus the HUD band)
+    are pushed with pygame.display.update. draw() returns False whenever a
+    full redraw is needed instead: outside normal play, during screen shake,
+    when the dirty area exceeds `max_fraction` of the screen, and every
+    `refresh_frames` frames so the starfield keeps twinkling.
+    """
+
+    def __init__(self, max_fraction=None, refresh_frames=None):
+        self.max_fraction = DIRTY_RECT_MAX_FRACTION if max_fraction is None else max_fraction
+        self.refresh_frames = DIRTY_RECT_REFRESH_FRAMES if refresh_frames is None else refresh_frames
+        self.screen_rect = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.hud_rect = pygame.Rect(0, 0, SCREEN_WIDTH, HUD_BAND_HEIGHT)
+        self.previous = None
+        self.frames_since_full = 0
+        self.dirty_frames = 0
+        self.full_frames = 0
+
+    def collect(self, game):
+        """Bounding rects of everything drawn this frame, keyed by what drew them"""
+        rects = {"hud": self.hud_rect}
+        for obj in game.drawable:
+            rect = obj.bounding_rect().clip(self.screen_rect)
+            if rect.w and rect.h:
+                rects[obj] = rect
+        for rect in game.particle_system.dirty_rects():
+            rect = rect.clip(self.screen_rect)
+            if rect.w and rect.h:
+                rects[rect.topleft] = rect
+        return rects
+
+    def draw(self, game):
+        """Draw a partial frame; returns False if the caller must redraw fully"""
+        background = getattr(game.starfield, "background", None)
+        if background is None or game.state != STATE_PLAYING:
+            return False
+        if game.shake_offset.x or game.shake_offset.y:
+            return False
+        if self.previous is None or self.frames_since_full + 1 >= self.refresh_frames:
+            return False
+
+        rects = self.collect(game)
+        # An object that only moved a little needs one rect covering both spots
+        dirty = []
+        for key, rect in rects.items():
+            old = self.previous.get(key)
+            dirty.append(rect if old is None else rect.union(old))
+        dirty.extend(rect for key, rect in self.previous.items() if key not in rects)
+        area = sum(rect.w * rect.h for rect in dirty)
+        if area > self.max_fraction * self.screen_rect.w * self.screen_rect.h:
+            return False
+
+        screen = game.screen
+        for rect in self.previous.values():
+            screen.blit(background, rect, rect)
+        for obj in game.drawable:
+            obj.draw(screen)
+        game.particle_system.draw(screen)
+        game.draw_hud()
+        pygame.display.update(dirty)
+
+        self.previous = rects
+        self.frames_since_full += 1
+        self.dirty_frames += 1
+        return True
+
+    def full_frame_drawn(self, game):
+        """Record what a full redraw put on screen so the next partial frame can erase it"""
+        # Overlays and shaken frames leave pixels outside the collected rects
+        shaken = game.shake_offset.x or game.shake_offset.y
+        if game.state == STATE_PLAYING and not shaken:
+            self.previous = self.collect(game)
+        else:
+            self.previous = None
+        self.frames_since_full = 0
+        self.full_frames += 1
+
+    def stats(self):
+        return {"dirty_frames": self.dirty_frames, "full_frames": self.full_frames}
@@ -0,0 +1,186 @@
+"""Compact session recordings and a headless replay runner.
+
+A replay file holds the session seed and the input bitmask of every
+simulation tick, run-length encoded:
+
+    header   <8sBHQ   magic, version, tick rate, seed
+    runs     <HB      tick count, input bits      (repeated)
+    end      <HB      0, 0
+    trailer  <IiHII   ticks, score, wave, event count, event CRC32
+
+The trailer lets a replay verify that re-simulation produced the same
+score and the same sequence of logged events. Files cut short (e.g. by a
+crash) have no trailer but can still be replayed.
+
+Usage:  python replay.py SESSION.replay [...]
+"""
+import os
+import struct
+import sys
+import time
+import zlib
+from datetime import datetime
+
+import logger
+
+MAGIC = b"ASTRPLAY"
+VERSION = 2  # 2: shot_fired and game_over events are part of the event CRC
+_HEADER = struct.Struct("<8sBHQ")
+_RUN = struct.Struct("<HB")
+_TRAILER = struct.Struct("<IiHII")
+_MAX_RUN = 0xFFFF
+
+
+class EventDigest:
+    """Running CRC of (tick, event type) for every logged event"""
+
+    def __init__(self, game):
+        self.game = game
+        self.count = 0
+        self.crc = 0
+
+    def __call__(self, event_type, details):
+        self.count += 1
+        self.crc = zlib.crc32(f"{self.game.tick}:{event_type};".encode(), self.crc)
+
+
+class ReplayRecorder:
+    """Collects one session's inputs and writes them out on finish()"""
+
+    def __init__(self, game, path):
+        self.game = game
+        self.path = path
+        self.seed = game.rng.seed_value
+        self.tick_rate = round(1 / game.tick_dt)
+        self.runs = bytearray()
+        self.ticks = 0
+        self.run_bits = None
+        self.run_length = 0
+        self.digest = EventDigest(game)
+        logger.add_listener(self.digest)
+
+    def record(self, bits):
+        self.ticks += 1
+        if bits == self.run_bits and self.run_length < _MAX_RUN:
+            self.run_length += 1
+            return
+        self._close_run()
+        self.run_bits = bits
+        self.run_length = 1
+
+    def _close_run(self):
+        if self.run_length:
+            self.runs += _RUN.pack(self.run_length, self.run_bits)
+
+    def finish(self):
+        logger.remove_listener(self.digest)
+        self._close_run()
+        self.run_length = 0
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, self.tick_rate, self.seed))
+            f.write(self.runs)
+            f.write(_RUN.pack(0, 0))
+            f.write(_TRAILER.pack(
+                self.ticks, self.game.score, self.game.wave, self.digest.count, self.digest.crc
+            ))
+        return self.path
+
+
+def session_path(directory, seed):
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    return os.path.join(directory, f"session-{stamp}-{seed}.replay")
+
+
+class Replay:
+    def __init__(self, tick_rate, seed, inputs, trailer):
+        self.tick_rate = tick_rate
+        self.seed = seed
+        # One input bitmask per tick
+        self.inputs = inputs
+        # (ticks, score, wave, event count, event crc), or None if truncated
+        self.trailer = trailer
+
+
+def read_replay(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version, tick_rate, seed = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path}: not a version {VERSION} replay file")
+
+    inputs = bytearray()
+    offset = _HEADER.size
+    trailer = None
+    while offset + _RUN.size <= len(data):
+        count, bits = _RUN.unpack_from(data, offset)
+        offset += _RUN.size
+        if count == 0:
+            if offset + _TRAILER.size <= len(data):
+                trailer = _TRAILER.unpack_from(data, offset)
+            break
+        inputs += bytes((bits,)) * count
+    return Replay(tick_rate, seed, inputs, trailer)
+
+
+class ReplayResult:
+    def __init__(self, ticks, score, wave, event_count, event_crc, elapsed, expected):
+        self.ticks = ticks
+        self.score = score
+        self.wave = wave
+        self.event_count = event_count
+        self.event_crc = event_crc
+        self.elapsed = elapsed
+        self.expected = expected
+
+    @property
+    def verified(self):
+        """True/False against the recorded trailer, None if there was none"""
+        if self.expected is None:
+            return None
+        return self.expected == (self.ticks, self.score, self.wave, self.event_count, self.event_crc)
+
+
+def run_replay(path):
+    """Re-simulate a replay headlessly as fast as possible"""
+    from game import Game
+
+    replay = read_replay(path)
+    game = Game(headless=True, tick_rate=replay.tick_rate)
+    game.start_game(seed=replay.seed)
+    digest = EventDigest(game)
+    logger.add_listener(digest)
+    dt = game.tick_dt
+    start = time.perf_counter()
+    try:
+        for bits in replay.inputs:
+            game.step(dt, bits)
+    finally:
+        logger.remove_listener(digest)
+    elapsed = time.perf_counter() - start
+    return ReplayResult(
+        len(replay.inputs), game.score, game.wave, digest.count, digest.crc, elapsed, replay.trailer
+    )
+
+
+def main(paths):
+    logger.set_enabled(False)
+    status = 0
+    for path in paths:
+        result = run_replay(path)
+        simulated = result.ticks / read_replay(path).tick_rate
+        verdict = {True: "verified", False: "MISMATCH", None: "unverified"}[result.verified]
+        if result.verified is False:
+            status = 1
+        print(
+            f"{path}: score {result.score}, wave {result.wave}, {result.event_count} events, "
+            f"{simulated:.0f} s simulated in {result.elapsed:.2f} s "
+            f"({simulated / max(result.elapsed, 1e-9):.0f}x) - {verdict}"
+        )
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,45 @@
+"""Random number streams.
+
+All randomness goes through one of two streams so sessions can be
+reproduced from a seed:
+
+- `gameplay`: anything that can change the simulation (spawns, UFO AI,
+  splits, power-up drops).
+- `cosmetic`: anything that only changes what is drawn or heard (particles,
+  screen shake, flame flicker, stars, asteroid outlines and spin).
+
+Modules must look the streams up at call time (`rng.gameplay.uniform(...)`)
+so that activate() can swap in a game's own RandomStreams.
+"""
+import random
+
+
+def new_seed():
+    """Fresh seed from the OS, for sessions that don't specify one"""
+    return random.SystemRandom().getrandbits(63)
+
+
+class RandomStreams:
+    def __init__(self, seed=None):
+        self.gameplay = random.Random()
+        self.cosmetic = random.Random()
+        self.seed(seed)
+
+    def seed(self, seed=None):
+        if seed is None:
+            seed = new_seed()
+        self.seed_value = seed
+        self.gameplay.seed(seed)
+        self.cosmetic.seed(f"{seed}:cosmetic")
+
+
+_default = RandomStreams()
+gameplay = _default.gameplay
+cosmetic = _default.cosmetic
+
+
+def activate(streams):
+    """Route module-level draws to the given RandomStreams"""
+    global gameplay, cosmetic
+    gameplay = streams.gameplay
+    cosmetic = streams.cosmetic
@@ -3,15 +3,17 @@ from constants import *
 import pygame
 
 class Shot(CircleShape):
+    wraps_around = False
+
     def __init__(self, x, y, radius):
         super().__init__(x, y, radius)
         self.lifetime = SHOT_LIFETIME
 
     def draw(self, screen):
-        pygame.draw.circle(screen, "red", self.position, self.radius, LINE_WIDTH)
+        pygame.draw.circle(screen, "red", self.render_position, self.radius, LINE_WIDTH)
 
     def update(self, dt):
-        self.position += self.velocity * dt
+        self.position = self.position + self.velocity * dt
         self.lifetime -= dt
         if self.lifetime <= 0:
             self.kill()
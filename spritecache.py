@@ -0,0 +1,88 @@
+from collections import OrderedDict
+
+import pygame
+from constants import LINE_WIDTH, ASTEROID_ATLAS_ANGLES, ASTEROID_ATLAS_BUDGET_BYTES
+
+
+class RotationAtlas:
+    """One polygon outline pre-rendered at `angles` evenly spaced rotations.
+
+    Frames sit side by side in a single surface and are rendered the first
+    time each angle is needed.
+    """
+
+    def __init__(self, vertices, radius, angles, color):
+        self.vertices = vertices
+        self.angles = angles
+        self.color = color
+        # Pad so LINE_WIDTH strokes at the outer edge aren't clipped
+        self.size = int(radius * 2) + LINE_WIDTH * 2 + 2
+        self.half = self.size / 2
+        self.surface = pygame.Surface((self.size * angles, self.size))
+        self.surface.set_colorkey((0, 0, 0))
+        self.rendered = bytearray(angles)
+
+    @property
+    def nbytes(self):
+        return self.surface.get_bytesize() * self.surface.get_width() * self.surface.get_height()
+
+    def frame(self, rotation):
+        """Return the atlas area for the frame nearest to rotation (degrees)"""
+        index = round(rotation * self.angles / 360) % self.angles
+        if not self.rendered[index]:
+            angle = index * 360 / self.angles
+            left = index * self.size
+            center = pygame.Vector2(left + self.half, self.half)
+            points = [center + v.rotate(angle) for v in self.vertices]
+            pygame.draw.polygon(self.surface, self.color, points, LINE_WIDTH)
+            self.rendered[index] = 1
+        return pygame.Rect(index * self.size, 0, self.size, self.size)
+
+
+class RotationAtlasCache:
+    """LRU cache of RotationAtlas objects keyed by shape, bounded in bytes"""
+
+    def __init__(self, angles=None, budget_bytes=None):
+        self.angles = ASTEROID_ATLAS_ANGLES if angles is None else angles
+        self.budget_bytes = ASTEROID_ATLAS_BUDGET_BYTES if budget_bytes is None else budget_bytes
+        self.atlases = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, vertices, radius, color="white"):
+        atlas = self.atlases.get(key)
+        if atlas is not None:
+            self.hits += 1
+            self.atlases.move_to_end(key)
+            return atlas
+
+        self.misses += 1
+        atlas = RotationAtlas(vertices, radius, self.angles, color)
+        self.atlases[key] = atlas
+        self.nbytes += atlas.nbytes
+        # Never evict the atlas that is about to be drawn
+        while self.nbytes > self.budget_bytes and len(self.atlases) > 1:
+            _, evicted = self.atlases.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+            self.evictions += 1
+        return atlas
+
+    def draw(self, screen, key, vertices, radius, position, rotation, color="white"):
+        atlas = self.get(key, vertices, radius, color)
+        area = atlas.frame(rotation)
+        screen.blit(atlas.surface, (position.x - atlas.half, position.y - atlas.half), area)
+
+    def clear(self):
+        self.atlases.clear()
+        self.nbytes = 0
+
+    def stats(self):
+        return {
+            "atlases": len(self.atlases),
+            "bytes": self.nbytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
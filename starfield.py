@@ -1,19 +1,46 @@
 import pygame
-import random
-from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+import rng
+import math
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, STARFIELD_LAYER_SPEEDS
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 
 class Starfield:
-    def __init__(self, num_stars=100):
+    """Twinkling star background.
+
+    With NumPy available, star attributes live in arrays and draw() writes
+    every star's pixels into a cached background surface with surfarray,
+    then blits it in one go. Pixel positions are computed once and the
+    surface is never cleared wholesale, so cost hardly depends on num_stars.
+    With `layers` > 1 stars are split into parallax layers that drift at
+    STARFIELD_LAYER_SPEEDS; only pixels lit last frame are erased.
+
+    draw() paints the whole background, so callers don't need to clear the
+    screen first.
+    """
+
+    def __init__(self, num_stars=100, layers=1):
+        self.layers = max(1, min(layers, len(STARFIELD_LAYER_SPEEDS)))
+        self.time = 0
+        self.vectorized = NUMPY_AVAILABLE
+        if self.vectorized:
+            self._init_arrays(num_stars)
+            return
+
         self.stars = []
         for _ in range(num_stars):
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(0, SCREEN_HEIGHT)
+            x = rng.cosmetic.randint(0, SCREEN_WIDTH)
+            y = rng.cosmetic.randint(0, SCREEN_HEIGHT)
             # Different star sizes and brightness
-            size = random.choice([1, 1, 1, 2])  # Mostly small stars
-            brightness = random.randint(60, 200)
-            twinkle_speed = random.uniform(1.0, 3.0)
-            twinkle_offset = random.uniform(0, 6.28)  # Random phase
+            size = rng.cosmetic.choice([1, 1, 1, 2])  # Mostly small stars
+            brightness = rng.cosmetic.randint(60, 200)
+            twinkle_speed = rng.cosmetic.uniform(1.0, 3.0)
+            twinkle_offset = rng.cosmetic.uniform(0, 6.28)  # Random phase
             self.stars.append({
                 'x': x,
                 'y': y,
@@ -22,13 +49,81 @@ class Starfield:
                 'twinkle_speed': twinkle_speed,
                 'twinkle_offset': twinkle_offset
             })
-        self.time = 0
+
+    def _init_arrays(self, num_stars):
+        generator = np.random.default_rng(rng.cosmetic.getrandbits(32))
+        self.x = generator.integers(0, SCREEN_WIDTH, num_stars).astype(np.float64)
+        self.y = generator.integers(0, SCREEN_HEIGHT, num_stars)
+        # Mostly small stars
+        self.size = np.where(generator.random(num_stars) < 0.75, 1, 2)
+        self.base_brightness = generator.integers(60, 201, num_stars).astype(np.float64)
+        self.twinkle_speed = generator.uniform(1.0, 3.0, num_stars)
+        self.twinkle_offset = generator.uniform(0, 6.28, num_stars)
+        self.layer = generator.integers(0, self.layers, num_stars)
+        if self.layers > 1:
+            # Farther layers are dimmer and never use the larger star size
+            self.base_brightness *= 1.0 - 0.25 * (self.layers - 1 - self.layer) / self.layers
+            self.size[self.layer == 0] = 1
+        self.drift = np.asarray(STARFIELD_LAYER_SPEEDS, dtype=np.float64)[self.layer]
+
+        # Size-2 stars cover a 3x3 block, like pygame.draw.circle(radius=2)
+        block = np.arange(-1, 2)
+        self._big_dx = np.repeat(block, 3)
+        self._big_dy = np.tile(block, 3)
+
+        self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), 0, 32)
+        self.background.fill((0, 0, 0))
+        self._gray = None
+        self._lit = None
+        self._pixels = None
 
     def update(self, dt):
         self.time += dt
 
     def draw(self, screen):
-        import math
+        if not self.vectorized:
+            self._draw_stars(screen)
+            return
+        self._render_background()
+        screen.blit(self.background, (0, 0))
+
+    def _render_background(self):
+        twinkle = np.sin(self.time * self.twinkle_speed + self.twinkle_offset)
+        brightness = np.clip(self.base_brightness + twinkle * 40, 40, 255).astype(np.uint32)
+        if self._gray is None:
+            r, g, b, _ = self.background.get_shifts()
+            self._gray = (r, g, b)
+        r, g, b = self._gray
+        color = (brightness << r) | (brightness << g) | (brightness << b)
+
+        if self._lit is None or self.layers > 1:
+            self._place_pixels()
+        px, py, owner = self._pixels
+
+        pixels = pygame.surfarray.pixels2d(self.background)
+        if self._lit is not None and self.layers > 1:
+            pixels[self._lit] = 0
+        pixels[px, py] = color[owner]
+        del pixels
+        self._lit = (px, py)
+
+    def _place_pixels(self):
+        """Work out which pixels each star covers; static unless drifting"""
+        if self.layers > 1:
+            x = ((self.x + self.time * self.drift) % SCREEN_WIDTH).astype(np.intp)
+        else:
+            x = self.x.astype(np.intp)
+        y = self.y
+
+        big = np.flatnonzero(self.size == 2)
+        px = np.concatenate((x, (x[big, None] + self._big_dx).ravel()))
+        py = np.concatenate((y, (y[big, None] + self._big_dy).ravel()))
+        owner = np.concatenate((np.arange(len(x)), np.repeat(big, len(self._big_dx))))
+        inside = (px >= 0) & (px < SCREEN_WIDTH) & (py >= 0) & (py < SCREEN_HEIGHT)
+        self._pixels = (px[inside], py[inside], owner[inside])
+
+    def _draw_stars(self, screen):
+        screen.fill("black")
         for star in self.stars:
             # Twinkle effect
             twinkle = math.sin(self.time * star['twinkle_speed'] + star['twinkle_offset'])
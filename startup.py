@@ -0,0 +1,48 @@
+"""Time to first frame, broken down by start-up phase.
+
+The clock starts when this module is first imported, so main.py imports
+it before anything else. Code on the start-up path wraps its work in
+phase(name); Game.run calls first_frame() once the first frame is on
+screen, which logs a "startup" event with the total and every phase in
+milliseconds. Anything not inside a phase is reported as "other".
+"""
+import time
+from contextlib import contextmanager
+
+_start = time.perf_counter()
+_phases = {}
+_first_frame = None
+
+
+@contextmanager
+def phase(name):
+    """Add the time spent in the block to phase `name`"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _phases[name] = _phases.get(name, 0.0) + time.perf_counter() - start
+
+
+def first_frame():
+    """Record the first frame; later calls do nothing"""
+    global _first_frame
+    if _first_frame is not None:
+        return
+    _first_frame = time.perf_counter() - _start
+    # Imported here: the logger shouldn't count towards the imports phase
+    from logger import log_event
+    log_event("startup", **{f"{name}_ms": round(ms, 2) for name, ms in breakdown().items()})
+
+
+def breakdown():
+    """Milliseconds per phase, then "other" and "first_frame" (the total) once known"""
+    result = {name: seconds * 1000 for name, seconds in _phases.items()}
+    if _first_frame is not None:
+        result["other"] = (_first_frame - sum(_phases.values())) * 1000
+        result["first_frame"] = _first_frame * 1000
+    return result
+
+
+def format_breakdown():
+    return "\n".join(f"{name:>12} {ms:>8.1f} ms" for name, ms in breakdown().items())
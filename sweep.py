@@ -0,0 +1,173 @@
+"""Search over tuning profiles with parallel headless games.
+
+Each profile is scored by playing the same seeds with the same input
+policy (see batch.py); every (profile, seed) game is a separate task on
+one ProcessPoolExecutor. Results are cached in a JSON file keyed by the
+profile hash and the evaluation settings, so repeating or extending a
+sweep only plays the new points. Clear the cache after changing game code.
+
+Grid search over every combination of the listed values:
+
+    python sweep.py WAVE_SPEED_MULTIPLIER=1.05,1.1,1.2 UFO_SPAWN_MIN_TIME=10,20
+
+Random search, sampling each range uniformly (ints if both ends are ints):
+
+    python sweep.py --random 20 WAVE_SPEED_MULTIPLIER=1.0:1.3 POWERUP_DROP_CHANCE=0.05:0.3
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from batch import MAX_SIM_SECONDS, POLICIES, init_worker, play
+from tuning import TuningProfile
+
+CACHE_PATH = "sweep_cache.json"
+
+
+def _parse_value(text):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def grid_profiles(axes):
+    """One profile per combination of {name: [values]}"""
+    names = sorted(axes)
+    for combo in itertools.product(*(axes[name] for name in names)):
+        yield TuningProfile(dict(zip(names, combo)))
+
+
+def random_profiles(ranges, count, seed=0):
+    """count profiles sampled uniformly from {name: (low, high)}"""
+    rng = random.Random(seed)
+    for _ in range(count):
+        overrides = {}
+        for name, (low, high) in sorted(ranges.items()):
+            if isinstance(low, int) and isinstance(high, int):
+                overrides[name] = rng.randint(low, high)
+            else:
+                overrides[name] = round(rng.uniform(low, high), 4)
+        yield TuningProfile(overrides)
+
+
+class ResultCache:
+    """Profile results on disk, keyed by profile digest and evaluation settings"""
+
+    def __init__(self, path=CACHE_PATH):
+        self.path = path
+        self.entries = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r") as f:
+                    self.entries = json.load(f)
+            except (IOError, json.JSONDecodeError):
+                self.entries = {}
+
+    @staticmethod
+    def key(profile, settings):
+        return f"{profile.digest()}:{settings}"
+
+    def get(self, profile, settings):
+        return self.entries.get(self.key(profile, settings))
+
+    def put(self, profile, settings, summary):
+        self.entries[self.key(profile, settings)] = summary
+
+    def save(self):
+        if self.path:
+            with open(self.path, "w") as f:
+                json.dump(self.entries, f, indent=1, sort_keys=True)
+
+
+def summarize(profile, results):
+    n = len(results)
+    return {
+        "overrides": profile.overrides,
+        "score": sum(r.score for r in results) / n,
+        "waves": sum(r.waves for r in results) / n,
+        "deaths": sum(r.deaths for r in results) / n,
+        "survival": sum(r.sim_seconds for r in results) / n,
+    }
+
+
+def sweep(profiles, seeds, policy="random", max_seconds=MAX_SIM_SECONDS, workers=None, cache=None):
+    """Evaluate profiles on the given seeds; returns (summary, cached) pairs in profile order"""
+    seeds = list(seeds)
+    settings = f"{policy}:{max_seconds}:{','.join(map(str, seeds))}"
+    summaries = {}
+    pending = []
+    for profile in profiles:
+        summary = cache.get(profile, settings) if cache else None
+        summaries[profile.digest()] = (profile, summary, summary is not None)
+        if summary is None:
+            pending.append(profile)
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+            futures = {
+                profile.digest(): [
+                    executor.submit(play, seed, policy, max_seconds, profile=profile) for seed in seeds
+                ]
+                for profile in pending
+            }
+            for profile in pending:
+                results = [future.result() for future in futures[profile.digest()]]
+                summary = summarize(profile, results)
+                summaries[profile.digest()] = (profile, summary, False)
+                if cache:
+                    cache.put(profile, settings, summary)
+        if cache:
+            cache.save()
+
+    return [(summary, cached) for _, summary, cached in summaries.values()]
+
+
+def format_table(rows, names):
+    header = " ".join(f"{name:>24}" for name in names)
+    lines = [f"{header} {'score':>8} {'waves':>6} {'deaths':>6} {'survival':>8}"]
+    for summary, cached in sorted(rows, key=lambda row: -row[0]["score"]):
+        values = " ".join(f"{summary['overrides'][name]:>24}" for name in names)
+        lines.append(
+            f"{values} {summary['score']:>8.0f} {summary['waves']:>6.2f} {summary['deaths']:>6.2f} "
+            f"{summary['survival']:>7.0f}s{' (cached)' if cached else ''}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep constants.py overrides over headless games")
+    parser.add_argument("axes", nargs="+", help="NAME=v1,v2,... for a grid, NAME=low:high with --random")
+    parser.add_argument("--random", type=int, metavar="N", help="sample N profiles instead of a grid")
+    parser.add_argument("--games", type=int, default=16, help="games (seeds) per profile")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="random")
+    parser.add_argument("--max-seconds", type=float, default=MAX_SIM_SECONDS)
+    parser.add_argument("--cache", default=CACHE_PATH, help="result cache file ('' to disable)")
+    args = parser.parse_args(argv)
+
+    axes = {}
+    for axis in args.axes:
+        name, _, spec = axis.partition("=")
+        if args.random:
+            low, _, high = spec.partition(":")
+            axes[name] = (_parse_value(low), _parse_value(high))
+        else:
+            axes[name] = [_parse_value(value) for value in spec.split(",")]
+    if args.random:
+        profiles = list(random_profiles(axes, args.random))
+    else:
+        profiles = list(grid_profiles(axes))
+
+    start = time.perf_counter()
+    rows = sweep(profiles, range(args.games), args.policy, args.max_seconds, args.workers, ResultCache(args.cache))
+    print(format_table(rows, sorted(axes)))
+    print(f"{len(profiles)} profiles x {args.games} games in {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
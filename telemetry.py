@@ -0,0 +1,317 @@
+"""Columnar binary telemetry: a compact alternative to game_state.jsonl.
+
+Every logged entity becomes one fixed-width ENTITY row in an append-only
+file, and every logged frame one FRAME row in an index beside it:
+
+    <path>       16-byte header, then ENTITY rows
+    <path>.idx   16-byte header, then FRAME rows (frame -> first row, row count)
+    <path>.json  group and type names the rows' codes refer to, screen size
+
+Rows are numpy structured records, so TelemetryReader memory-maps both
+files and hands out zero-copy column views (reader.rows["x"], ...).
+
+Use it as the logger's state sink:
+
+    logger.configure(state_sink=TelemetrySink("game_state.tlm"))
+
+and convert between layouts with:
+
+    python telemetry.py to-jsonl game_state.tlm game_state.jsonl
+    python telemetry.py from-jsonl game_state.jsonl game_state.tlm
+"""
+import json
+import os
+import struct
+import sys
+from datetime import datetime
+
+import numpy as np
+
+import logger
+
+MAGIC = b"ASTRTLM"
+VERSION = 1
+HEADER_SIZE = 16
+MAX_GROUPS = 8
+
+ENTITY = np.dtype([
+    ("frame", "<u4"),
+    ("group", "u1"),
+    ("type", "u1"),
+    ("flags", "<u2"),
+    ("x", "<f4"),
+    ("y", "<f4"),
+    ("vx", "<f4"),
+    ("vy", "<f4"),
+    ("radius", "<f4"),
+    ("rotation", "<f4"),
+])
+FRAME = np.dtype([
+    ("frame", "<u4"),
+    ("elapsed_s", "<u4"),
+    ("time_ms", "<u4"),  # Wall clock, milliseconds since midnight
+    ("rows", "<u4"),
+    ("first_row", "<u8"),
+    ("present", "<u4"),  # Bit per group logged on this frame
+    # Group sizes; sampled groups may have fewer rows than members
+    ("counts", "<u4", (MAX_GROUPS,)),
+])
+
+# ENTITY flags
+HAS_ROTATION = 1
+
+
+def _header(kind):
+    return struct.pack("<7sBBxxxxxxx", MAGIC, VERSION, kind)
+
+
+_ENTITY_HEADER = _header(0)
+_FRAME_HEADER = _header(1)
+
+
+def _time_ms(timestamp):
+    clock = datetime.strptime(timestamp, "%H:%M:%S.%f")
+    return ((clock.hour * 60 + clock.minute) * 60 + clock.second) * 1000 + clock.microsecond // 1000
+
+
+def _timestamp(time_ms):
+    seconds, ms = divmod(int(time_ms), 1000)
+    minutes, second = divmod(seconds, 60)
+    hour, minute = divmod(minutes, 60)
+    return f"{hour:02d}:{minute:02d}:{second:02d}.{ms:03d}"
+
+
+class TelemetrySink:
+    """Logger state sink writing log_state entries as binary rows.
+
+    Rows are queued on the logger's writer thread with append_raw, so no
+    file I/O happens on the game thread except rewriting the small name
+    table when a new group or entity type first appears.
+    """
+
+    def __init__(self, path="game_state.tlm", append=None):
+        self.path = path
+        # Writes bytes to a path; logger.append_raw unless converting offline
+        self.append = append or logger.append_raw
+        self.groups = []
+        self.single = []
+        self.types = []
+        self.screen_size = []
+        self.rows_written = 0
+        self.started = False
+
+    def _code(self, names, name):
+        if name not in names:
+            names.append(name)
+            self._write_names()
+        return names.index(name)
+
+    def _write_names(self):
+        with open(self.path + ".json", "w") as f:
+            json.dump({
+                "version": VERSION,
+                "groups": self.groups,
+                "single": self.single,
+                "types": self.types,
+                "screen_size": self.screen_size,
+            }, f)
+
+    def write_state(self, entry):
+        if not self.started:
+            self.started = True
+            self.screen_size = list(entry.get("screen_size", []))
+            self._write_names()
+            self.append(self.path, _ENTITY_HEADER)
+            self.append(self.path + ".idx", _FRAME_HEADER)
+
+        frame_number = entry["frame"]
+        records = []
+        frame = np.zeros(1, dtype=FRAME)
+        for name, value in entry.items():
+            if not isinstance(value, dict):
+                continue
+            if name not in self.groups:
+                if len(self.groups) == MAX_GROUPS:
+                    continue
+                self.single.append("sprites" not in value)
+            group = self._code(self.groups, name)
+            frame["present"] |= 1 << group
+            if "sprites" in value:
+                frame["counts"][0, group] = value["count"]
+                sprites = value["sprites"]
+            else:
+                frame["counts"][0, group] = 1
+                sprites = (value,)
+            for sprite in sprites:
+                records.append((group, sprite))
+
+        rows = np.zeros(len(records), dtype=ENTITY)
+        for i, (group, sprite) in enumerate(records):
+            rotation = sprite.get("rot")
+            rows[i] = (
+                frame_number, group, self._code(self.types, sprite["type"]),
+                0 if rotation is None else HAS_ROTATION,
+                *sprite["pos"], *sprite["vel"], sprite["rad"], rotation or 0.0,
+            )
+        frame["frame"] = frame_number
+        frame["elapsed_s"] = entry.get("elapsed_s", 0)
+        frame["time_ms"] = _time_ms(entry["timestamp"]) if "timestamp" in entry else 0
+        frame["rows"] = len(rows)
+        frame["first_row"] = self.rows_written
+        self.rows_written += len(rows)
+
+        # Rows before their index entry, so a reader never indexes missing rows
+        self.append(self.path, rows.tobytes())
+        self.append(self.path + ".idx", frame.tobytes())
+
+
+def _map(path, dtype):
+    """Read-only memmap of every complete record after the header"""
+    count = max(0, (os.path.getsize(path) - HEADER_SIZE) // dtype.itemsize)
+    if count == 0:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", offset=HEADER_SIZE, shape=(count,))
+
+
+class TelemetryReader:
+    """Zero-copy view of a telemetry file; safe to open while it is being written"""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            header = f.read(HEADER_SIZE)
+        magic, version, _ = struct.unpack("<7sBB", header[:9])
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: not a version {VERSION} telemetry file")
+        with open(path + ".json", "r") as f:
+            names = json.load(f)
+        self.groups = names["groups"]
+        self.single = names["single"]
+        self.types = names["types"]
+        self.screen_size = names["screen_size"]
+        self.rows = _map(path, ENTITY)
+        frames = _map(path + ".idx", FRAME)
+        # Drop index entries whose rows haven't reached the disk yet
+        complete = frames["first_row"] + frames["rows"] <= len(self.rows)
+        self.frames = frames[: int(np.argmin(complete)) if not complete.all() else len(frames)]
+
+    def __len__(self):
+        return len(self.frames)
+
+    def frame_index(self, frame):
+        """Position of a frame number in self.frames, by binary search"""
+        index = int(np.searchsorted(self.frames["frame"], frame))
+        if index == len(self.frames) or self.frames["frame"][index] != frame:
+            raise KeyError(frame)
+        return index
+
+    def rows_for(self, frame):
+        """ENTITY rows logged on a given frame number"""
+        info = self.frames[self.frame_index(frame)]
+        start = int(info["first_row"])
+        return self.rows[start:start + int(info["rows"])]
+
+    def rows_between(self, first_frame, last_frame):
+        """ENTITY rows for frames first_frame..last_frame inclusive"""
+        numbers = self.frames["frame"]
+        lo = int(np.searchsorted(numbers, first_frame, "left"))
+        hi = int(np.searchsorted(numbers, last_frame, "right"))
+        if lo >= hi:
+            return self.rows[:0]
+        start = int(self.frames["first_row"][lo])
+        end = int(self.frames["first_row"][hi - 1] + self.frames["rows"][hi - 1])
+        return self.rows[start:end]
+
+    def group_rows(self, name, rows=None):
+        rows = self.rows if rows is None else rows
+        return rows[rows["group"] == self.groups.index(name)]
+
+    def entries(self):
+        """Yield every frame as a game_state.jsonl entry"""
+        for info in self.frames:
+            start = int(info["first_row"])
+            rows = self.rows[start:start + int(info["rows"])]
+            entry = {
+                "timestamp": _timestamp(info["time_ms"]),
+                "elapsed_s": int(info["elapsed_s"]),
+                "frame": int(info["frame"]),
+                "screen_size": list(self.screen_size),
+            }
+            for group, name in enumerate(self.groups):
+                if not info["present"] & (1 << group):
+                    continue
+                members = rows[rows["group"] == group]
+                if self.single[group]:
+                    entry[name] = _sprite_record(self.types, members[0])
+                else:
+                    sprites = [_sprite_record(self.types, row) for row in members]
+                    entry[name] = {"count": int(info["counts"][group]), "sprites": sprites}
+            yield entry
+
+
+def _sprite_record(types, row):
+    record = {
+        "type": types[row["type"]],
+        "pos": [round(float(row["x"]), 2), round(float(row["y"]), 2)],
+        "vel": [round(float(row["vx"]), 2), round(float(row["vy"]), 2)],
+        "rad": _number(row["radius"]),
+    }
+    if row["flags"] & HAS_ROTATION:
+        record["rot"] = round(float(row["rotation"]), 2)
+    return record
+
+
+def _number(value):
+    value = float(value)
+    return int(value) if value.is_integer() else round(value, 2)
+
+
+def jsonl_to_telemetry(jsonl_path, path):
+    """Convert a game_state.jsonl file; returns the number of frames"""
+    files = {}
+
+    def append(target, data):
+        f = files.get(target)
+        if f is None:
+            f = files[target] = open(target, "wb")
+        f.write(data)
+
+    sink = TelemetrySink(path, append=append)
+    frames = 0
+    try:
+        with open(jsonl_path, "r") as f:
+            for line in f:
+                if line.strip():
+                    sink.write_state(json.loads(line))
+                    frames += 1
+    finally:
+        for f in files.values():
+            f.close()
+    return frames
+
+
+def telemetry_to_jsonl(path, jsonl_path):
+    """Convert a telemetry file back to game_state.jsonl lines; returns the number of frames"""
+    frames = 0
+    with open(jsonl_path, "w") as f:
+        for entry in TelemetryReader(path).entries():
+            f.write(json.dumps(entry) + "\n")
+            frames += 1
+    return frames
+
+
+def main(argv):
+    if len(argv) != 3 or argv[0] not in ("to-jsonl", "from-jsonl"):
+        print(__doc__.strip().splitlines()[-2].strip())
+        print("usage: python telemetry.py to-jsonl|from-jsonl SOURCE DEST")
+        return 2
+    command, source, dest = argv
+    if command == "to-jsonl":
+        frames = telemetry_to_jsonl(source, dest)
+    else:
+        frames = jsonl_to_telemetry(source, dest)
+    print(f"{frames} frames written to {dest}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,77 @@
+"""Tuning profiles: per-game overrides of the values in constants.py.
+
+Every module reads constants through `from constants import *`, which
+copies them into its own globals. activate() rewrites those copies in
+the gameplay modules listed in GAME_MODULES (and constants itself), so
+code picks the overrides up without being changed. Tools such as batch,
+sweep and the benchmarks are left alone. Like rng.activate, Game activates its own profile
+whenever it runs, so games with different profiles can share a process.
+
+Only values read at call time are affected, so game code doesn't bind
+constants as default arguments: such defaults are None and the constant
+is looked up when the call runs. Derived constants such as
+ASTEROID_MAX_RADIUS are not recomputed and must be overridden explicitly.
+"""
+import hashlib
+import json
+import sys
+
+import constants
+
+DEFAULTS = {name: value for name, value in vars(constants).items() if name.isupper()}
+# Modules the game runs that read constants; a new one must be added here
+GAME_MODULES = (
+    "constants", "game", "asteroid", "asteroidfield", "audio", "circleshape", "collision",
+    "entitystore", "flightrecorder", "hud", "particle", "player", "powerup", "renderer",
+    "shot", "spritecache", "starfield", "ufo",
+)
+_active = None
+
+
+class TuningProfile:
+    def __init__(self, overrides=None):
+        overrides = dict(overrides or {})
+        unknown = sorted(set(overrides) - set(DEFAULTS))
+        if unknown:
+            raise KeyError(f"not in constants.py: {', '.join(unknown)}")
+        self.overrides = overrides
+
+    def __repr__(self):
+        return f"TuningProfile({self.overrides!r})"
+
+    def values(self):
+        """Every constant with this profile's overrides applied"""
+        values = dict(DEFAULTS)
+        values.update(self.overrides)
+        return values
+
+    def digest(self):
+        """Stable hash of the overrides, used to cache results per profile"""
+        encoded = json.dumps(self.overrides, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode()).hexdigest()[:16]
+
+
+def _game_modules():
+    for name in GAME_MODULES:
+        module = sys.modules.get(name)
+        if module is not None:
+            yield module
+
+
+def activate(profile):
+    """Apply a TuningProfile to every game module (None restores the defaults)"""
+    global _active
+    if profile is _active:
+        return
+    previous = _active.overrides if _active else {}
+    changes = profile.overrides if profile else {}
+    # Names the old profile changed go back to their defaults
+    values = {name: DEFAULTS[name] for name in previous}
+    values.update(changes)
+    if values:
+        for module in _game_modules():
+            namespace = vars(module)
+            for name, value in values.items():
+                if name in namespace:
+                    namespace[name] = value
+    _active = profile
@@ -1,5 +1,5 @@
 import pygame
-import random
+import rng
 import math
 from circleshape import CircleShape
 from constants import *
@@ -21,7 +21,7 @@ class UFO(CircleShape):
 
     def _set_random_direction(self):
         """Set a random movement direction"""
-        angle = random.uniform(0, 2 * math.pi)
+        angle = rng.gameplay.uniform(0, 2 * math.pi)
         self.velocity = pygame.Vector2(
             math.cos(angle) * self.speed,
             math.sin(angle) * self.speed
@@ -29,7 +29,7 @@ class UFO(CircleShape):
 
     def draw(self, screen):
         # Draw UFO as a classic flying saucer shape
-        center = self.position
+        center = self.render_position
         r = self.radius
 
         # Main body (ellipse approximated with lines)
@@ -52,16 +52,19 @@ class UFO(CircleShape):
 
     def update(self, dt):
         # Move
-        self.position += self.velocity * dt
+        self.position = self.position + self.velocity * dt
 
         # Screen wrapping
         self.wrap_position()
 
+        self.update_behavior(dt)
+
+    def update_behavior(self, dt):
         # Change direction periodically
         self.direction_timer -= dt
         if self.direction_timer <= 0:
             self._set_random_direction()
-            self.direction_timer = random.uniform(1.5, 3.0)
+            self.direction_timer = rng.gameplay.uniform(1.5, 3.0)
 
         # Shooting
         self.shoot_timer -= dt
@@ -76,11 +79,11 @@ class UFO(CircleShape):
             direction = (self.target.position - self.position).normalize()
             # Add some inaccuracy
             angle = math.atan2(direction.y, direction.x)
-            angle += random.uniform(-0.2, 0.2)
+            angle += rng.gameplay.uniform(-0.2, 0.2)
             direction = pygame.Vector2(math.cos(angle), math.sin(angle))
         else:
             # Random direction
-            angle = random.uniform(0, 2 * math.pi)
+            angle = rng.gameplay.uniform(0, 2 * math.pi)
             direction = pygame.Vector2(math.cos(angle), math.sin(angle))
 
         shot = Shot(self.position.x, self.position.y, SHOT_RADIUS)
@@ -94,7 +97,7 @@ class UFO(CircleShape):
 class UFOSpawner:
     """Handles UFO spawning logic"""
     def __init__(self):
-        self.spawn_timer = random.uniform(UFO_SPAWN_MIN_TIME, UFO_SPAWN_MAX_TIME)
+        self.spawn_timer = rng.gameplay.uniform(UFO_SPAWN_MIN_TIME, UFO_SPAWN_MAX_TIME)
         self.active_ufo = None
 
     def update(self, dt, wave, ufos_group, player):
@@ -103,20 +106,20 @@ class UFOSpawner:
             self.spawn_timer -= dt
             if self.spawn_timer <= 0:
                 self.spawn_ufo(wave, ufos_group, player)
-                self.spawn_timer = random.uniform(UFO_SPAWN_MIN_TIME, UFO_SPAWN_MAX_TIME)
+                self.spawn_timer = rng.gameplay.uniform(UFO_SPAWN_MIN_TIME, UFO_SPAWN_MAX_TIME)
 
     def spawn_ufo(self, wave, ufos_group, player):
         """Spawn a UFO at a random edge"""
         # Small UFO appears more often at higher waves
-        is_small = random.random() < min(0.1 + wave * 0.05, 0.5)
+        is_small = rng.gameplay.random() < min(0.1 + wave * 0.05, 0.5)
 
         # Random edge spawn
-        if random.random() < 0.5:
-            x = random.choice([-ASTEROID_MAX_RADIUS, SCREEN_WIDTH + ASTEROID_MAX_RADIUS])
-            y = random.uniform(100, SCREEN_HEIGHT - 100)
+        if rng.gameplay.random() < 0.5:
+            x = rng.gameplay.choice([-ASTEROID_MAX_RADIUS, SCREEN_WIDTH + ASTEROID_MAX_RADIUS])
+            y = rng.gameplay.uniform(100, SCREEN_HEIGHT - 100)
         else:
-            x = random.uniform(100, SCREEN_WIDTH - 100)
-            y = random.choice([-ASTEROID_MAX_RADIUS, SCREEN_HEIGHT + ASTEROID_MAX_RADIUS])
+            x = rng.gameplay.uniform(100, SCREEN_WIDTH - 100)
+            y = rng.gameplay.choice([-ASTEROID_MAX_RADIUS, SCREEN_HEIGHT + ASTEROID_MAX_RADIUS])
 
         ufo = UFO(x, y, is_small)
         ufo.target = player
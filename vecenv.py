@@ -0,0 +1,170 @@
+"""K headless games stepped in lockstep, with batched NumPy actions and observations.
+
+Games run the normal Game rules one after another each step; what is
+batched is everything around them. Actions are converted to input
+bitmasks for all games at once, and observations are built by stacking
+every game's objects into one array and sorting, ranking and padding
+them per game with array ops. With entity_store=True the object state
+is read straight out of each game's EntityStore arrays.
+
+Observations (all float32, K = number of games):
+
+    player     (K, 6)     x, y, sin(rotation), cos(rotation), lives, vulnerable
+    asteroids  (K, A, 5)  dx, dy, vx, vy, radius, nearest first
+    ufos       (K, U, 5)  same layout
+    shots      (K, S, 5)  same layout; player and UFO shots alike
+
+dx and dy are the shortest offsets from the player on the wrapping
+screen. Unused rows are zero and `<name>_mask` arrays mark the real ones.
+"""
+import numpy as np
+
+from asteroid import Asteroid
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, STATE_GAME_OVER
+from game import Game
+from inputs import THRUST, REVERSE, ROTATE_LEFT, ROTATE_RIGHT, FIRE
+from shot import Shot
+from ufo import UFO
+import logger
+
+_SCREEN = np.array([SCREEN_WIDTH, SCREEN_HEIGHT], dtype=np.float64)
+_ENTITY_FEATURES = 5
+
+
+def action_bits(actions):
+    """Input bitmasks for a (K, 3) batch of (thrust, rotate, fire) actions.
+
+    thrust: 1 forward, -1 reverse, 0 none; rotate: 1 right, -1 left, 0 none;
+    fire: nonzero to fire. A 1-D array is taken as bitmasks already.
+    """
+    actions = np.asarray(actions)
+    if actions.ndim == 1:
+        return actions.astype(np.int64)
+    thrust, rotate, fire = actions[:, 0], actions[:, 1], actions[:, 2]
+    return (
+        np.where(thrust > 0, THRUST, 0)
+        | np.where(thrust < 0, REVERSE, 0)
+        | np.where(rotate > 0, ROTATE_RIGHT, 0)
+        | np.where(rotate < 0, ROTATE_LEFT, 0)
+        | np.where(fire != 0, FIRE, 0)
+    )
+
+
+def _entity_rows(game, cls, group):
+    """(n, 5) x, y, vx, vy, radius of every live cls in one game"""
+    if game.store is not None:
+        arrays = game.store.arrays[cls]
+        live = np.flatnonzero(arrays.alive[:arrays.high])
+        return np.column_stack((arrays.position[live], arrays.velocity[live], arrays.radius[live]))
+    return np.array(
+        [(s.position.x, s.position.y, s.velocity.x, s.velocity.y, s.radius) for s in group],
+        dtype=np.float64,
+    ).reshape(-1, _ENTITY_FEATURES)
+
+
+class VectorEnv:
+    """K independent headless games behind one batched step(actions).
+
+    Finished games (game over, or max_seconds of game time) are reset with
+    the next seed automatically; step() reports them in `dones` and their
+    final score in info["final_score"]. JSONL logging is switched off while
+    the env is open, since K games writing one log would be unreadable;
+    close() turns it back on if it was on before.
+    """
+
+    def __init__(self, num_envs, seed=0, max_asteroids=16, max_ufos=2, max_shots=16,
+                 max_seconds=10 * 60, frame_skip=1, entity_store=False, profile=None):
+        self.logging_was_enabled = logger.is_enabled()
+        logger.set_enabled(False)
+        self.num_envs = num_envs
+        self.limits = {"asteroids": max_asteroids, "ufos": max_ufos, "shots": max_shots}
+        self.frame_skip = frame_skip
+        self.next_seed = seed
+        self.games = [Game(headless=True, entity_store=entity_store, profile=profile) for _ in range(num_envs)]
+        # Per game: each one runs at its own (possibly tuned) tick rate
+        self.max_ticks = [int(max_seconds * game.tick_rate) for game in self.games]
+        self.seeds = np.zeros(num_envs, dtype=np.int64)
+        self.scores = np.zeros(num_envs, dtype=np.int64)
+
+    def reset(self):
+        """Restart every game with fresh seeds and return the observations"""
+        for index in range(self.num_envs):
+            self.reset_at(index)
+        return self.observe()
+
+    def reset_at(self, index, seed=None):
+        """Restart one game, with the next seed unless one is given"""
+        if seed is None:
+            seed = self.next_seed
+            self.next_seed += 1
+        self.games[index].start_game(seed=seed)
+        self.seeds[index] = seed
+        self.scores[index] = 0
+
+    def step(self, actions):
+        """Advance every game by frame_skip ticks; returns (obs, rewards, dones, info)"""
+        bits = action_bits(actions).tolist()
+        for game, inputs in zip(self.games, bits):
+            dt = game.tick_dt
+            for _ in range(self.frame_skip):
+                game.step(dt, inputs)
+                if game.state == STATE_GAME_OVER:
+                    break
+
+        scores = np.fromiter((game.score for game in self.games), dtype=np.int64, count=self.num_envs)
+        rewards = (scores - self.scores).astype(np.float32)
+        self.scores = scores
+        dones = np.fromiter(
+            (game.state == STATE_GAME_OVER or game.tick >= max_ticks
+             for game, max_ticks in zip(self.games, self.max_ticks)),
+            dtype=bool, count=self.num_envs,
+        )
+        info = {"final_score": np.where(dones, scores, 0), "seed": self.seeds.copy()}
+        for index in np.flatnonzero(dones):
+            self.reset_at(index)
+        return self.observe(), rewards, dones, info
+
+    def close(self):
+        """Put logging back the way it was before the env was created"""
+        logger.set_enabled(self.logging_was_enabled)
+
+    def observe(self):
+        state = np.array(
+            [(g.player.position.x, g.player.position.y, g.player.rotation, g.lives, g.player.is_vulnerable())
+             for g in self.games],
+            dtype=np.float64,
+        )
+        radians = np.radians(state[:, 2])
+        player = np.column_stack((state[:, :2], np.sin(radians), np.cos(radians), state[:, 3:]))
+
+        obs = {"player": player.astype(np.float32)}
+        for name, cls in (("asteroids", Asteroid), ("ufos", UFO), ("shots", Shot)):
+            obs[name], obs[name + "_mask"] = self._entities(cls, name, state[:, :2], self.limits[name])
+        return obs
+
+    def _entities(self, cls, group, origins, limit):
+        """Pad each game's cls objects, nearest first, into (K, limit, 5)"""
+        out = np.zeros((self.num_envs, limit, _ENTITY_FEATURES), dtype=np.float32)
+        mask = np.zeros((self.num_envs, limit), dtype=bool)
+        chunks = [_entity_rows(game, cls, getattr(game, group)) for game in self.games]
+        counts = np.fromiter((len(chunk) for chunk in chunks), dtype=np.intp, count=self.num_envs)
+        if not counts.sum():
+            return out, mask
+        rows = np.concatenate(chunks)
+        env = np.repeat(np.arange(self.num_envs), counts)
+
+        # Shortest offset on the wrapping screen
+        offset = rows[:, :2] - origins[env]
+        offset = (offset + _SCREEN / 2) % _SCREEN - _SCREEN / 2
+        rows[:, :2] = offset
+        distance = np.einsum("ij,ij->i", offset, offset)
+
+        order = np.lexsort((distance, env))
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        rank = np.arange(len(order)) - starts[env[order]]
+        keep = rank < limit
+        env_kept = env[order][keep]
+        rank_kept = rank[keep]
+        out[env_kept, rank_kept] = rows[order[keep]]
+        mask[env_kept, rank_kept] = True
+        return out, mask